@@ -33,4 +33,5 @@ export type ReadSaaSRequest = {
   async_config?: AsyncConfig | null;
   skip_missing_param_values?: boolean | null;
   output?: string | null;
+  max_concurrency?: number | null;
 };
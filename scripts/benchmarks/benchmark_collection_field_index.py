@@ -0,0 +1,143 @@
+"""
+Benchmark for field lookups on a Collection.
+
+Builds a collection of 500 fields, 50 object fields with 9 nested scalar fields each, with
+identities, references, primary keys and data categories spread over them. Then it times the
+lookups query configs and masking make for every row: a field() call per field path, plus
+identities, references and field paths by category. They run once against the Collection,
+which flattens its fields again for each lookup, and once against a CollectionFieldIndex,
+built once for the round the way an ExecutionNode builds it when it is hydrated.
+
+Usage:
+    python scripts/benchmarks/benchmark_collection_field_index.py [--fields N] [lookup_rounds ...]
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from fides.api.graph.config import (
+    Collection,
+    CollectionFieldIndex,
+    Field,
+    FieldAddress,
+    FieldPath,
+    ObjectField,
+    ScalarField,
+)
+
+DEFAULT_LOOKUP_ROUNDS = [1, 10]
+SUBFIELDS_PER_OBJECT = 9
+
+
+def build_collection(field_count: int) -> Collection:
+    """Build a collection of field_count fields, most of them nested in object fields"""
+    fields: List[Field] = []
+    object_count = field_count // (SUBFIELDS_PER_OBJECT + 1)
+    for object_index in range(object_count):
+        subfields = {}
+        for subfield_index in range(SUBFIELDS_PER_OBJECT):
+            name = f"field_{subfield_index}"
+            subfields[name] = ScalarField(
+                name=name,
+                primary_key=object_index == 0 and subfield_index == 0,
+                identity="email" if subfield_index == 1 else None,
+                references=(
+                    [(FieldAddress("other", "collection", name), "from")]
+                    if subfield_index == 2
+                    else []
+                ),
+                data_categories=[f"user.category_{subfield_index}"],
+            )
+        fields.append(ObjectField(name=f"object_{object_index}", fields=subfields))
+    return Collection(name="benchmark", fields=fields)
+
+
+def flatten(collection: Collection) -> Dict[FieldPath, Field]:
+    """Flatten the fields the way Collection.field_dict does on every access"""
+    return collection.recursively_collect_matches(lambda f: True)
+
+
+def lookup_rebuilding(collection: Collection, field_paths: List[FieldPath]) -> int:
+    """Look up every field path, flattening the fields again for each lookup"""
+    found = 0
+    for field_path in field_paths:
+        field: Optional[Field] = (
+            flatten(collection)[field_path]
+            if field_path in flatten(collection)
+            else None
+        )
+        found += field is not None
+    identities = {
+        path: field.identity
+        for path, field in flatten(collection).items()
+        if field.identity
+    }
+    references = {
+        path: field.references
+        for path, field in flatten(collection).items()
+        if field.references
+    }
+    categories = defaultdict(list)
+    for path, field in flatten(collection).items():
+        for category in field.data_categories or []:
+            categories[category].append(path)
+    assert identities and references and categories
+    return found
+
+
+def lookup_indexed(collection: Collection, field_paths: List[FieldPath]) -> int:
+    """Index the collection's fields once, then look up every field path in the index"""
+    index = CollectionFieldIndex.build(collection)
+    found = 0
+    for field_path in field_paths:
+        found += index.field(field_path) is not None
+    assert index.identities and index.references and index.field_paths_by_category
+    return found
+
+
+def time_lookups(
+    lookup: Callable[[Collection, List[FieldPath]], int],
+    collection: Collection,
+    field_paths: List[FieldPath],
+    rounds: int,
+) -> float:
+    """Run the lookups for the given number of rounds and return the elapsed time"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        assert lookup(collection, field_paths) == len(field_paths)
+    return time.perf_counter() - start
+
+
+def run_benchmark(field_count: int, rounds: int) -> None:
+    """Time rebuilding and indexed lookups over a collection of field_count fields"""
+    collection = build_collection(field_count)
+    field_paths = list(flatten(collection))
+    timings: Dict[str, Any] = {
+        label: time_lookups(lookup, collection, field_paths, rounds)
+        for label, lookup in (
+            ("rebuilding", lookup_rebuilding),
+            ("indexed", lookup_indexed),
+        )
+    }
+    lookup_count = rounds * len(field_paths)
+    print(
+        f"{rounds:>6} rounds x {len(field_paths)} field paths: "
+        + ", ".join(
+            f"{label} {elapsed:.3f}s ({lookup_count / elapsed:,.0f} lookups/s)"
+            for label, elapsed in timings.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--fields", default=500, type=int, help="number of fields in the collection"
+    )
+    parser.add_argument("lookup_rounds", nargs="*", type=int)
+    args = parser.parse_args()
+
+    for count in args.lookup_rounds or DEFAULT_LOOKUP_ROUNDS:
+        run_benchmark(args.fields, count)
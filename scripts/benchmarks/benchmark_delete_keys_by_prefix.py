@@ -0,0 +1,114 @@
+"""
+Benchmark for deleting cached privacy request keys by prefix.
+
+Populates Redis with keys for a number of privacy requests, then deletes the keys of some
+of those requests, first with the KEYS based Lua script that delete_keys_by_prefix
+used to run and then with the SCAN and UNLINK based implementation, once per prefix and in a
+single sweep for all prefixes. The KEYS script blocks Redis for its whole run, so the time it
+takes is also how long every other client is stalled. SCAN only blocks Redis for one chunk at a
+time, but every sweep visits the whole keyspace, so deleting many requests' keys is cheaper in
+a single sweep while deleting a few is cheaper with one sweep per prefix.
+
+Keys are written to the Redis server configured for fides unless a Redis URL is given with
+--url. Every key is written under a random prefix for the run and only those keys are deleted,
+so other keys in the database are left alone, but they are swept by SCAN like in production.
+
+Usage:
+    python scripts/benchmarks/benchmark_delete_keys_by_prefix.py [--url URL] [--requests N] [key_count ...]
+"""
+
+import argparse
+import time
+from typing import List
+from uuid import uuid4
+
+from fides.api.util.cache import FidesopsRedis
+from fides.config import CONFIG
+
+DEFAULT_KEY_COUNTS = [100_000, 1_000_000]
+KEYS_PER_REQUEST = 10
+DEFAULT_DELETED_REQUEST_COUNT = 50
+POPULATE_BATCH_SIZE = 10_000
+
+
+def get_client(url: str) -> FidesopsRedis:
+    """Connect to the Redis server at the given URL, or to the one configured for fides"""
+    return FidesopsRedis.from_url(  # type: ignore[return-value]
+        url or str(CONFIG.redis.connection_url), decode_responses=True
+    )
+
+
+def populate(
+    client: FidesopsRedis, run_prefix: str, key_count: int, deleted_request_count: int
+) -> List[str]:
+    """Write key_count keys spread across privacy requests, returning the prefixes to delete"""
+    client.delete_keys_by_prefix(run_prefix)
+    prefixes = [
+        f"{run_prefix}id-pri_{request_index}-"
+        for request_index in range(key_count // KEYS_PER_REQUEST)
+    ]
+    pipe = client.pipeline(transaction=False)
+    for index in range(key_count):
+        pipe.set(f"{prefixes[index // KEYS_PER_REQUEST]}identity-{index}", "value")
+        if index % POPULATE_BATCH_SIZE == POPULATE_BATCH_SIZE - 1:
+            pipe.execute()
+    pipe.execute()
+    return prefixes[:deleted_request_count]
+
+
+def delete_with_keys_script(client: FidesopsRedis, prefixes: List[str]) -> None:
+    """Delete the keys under each prefix with the original KEYS based Lua script"""
+    for prefix in prefixes:
+        client.register_script(
+            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
+        )()
+
+
+def run_benchmark(
+    client: FidesopsRedis, key_count: int, deleted_request_count: int
+) -> None:
+    """Time each way of deleting some requests' keys out of key_count keys"""
+    run_prefix = f"benchmark-{uuid4().hex}-"
+    try:
+        prefixes = populate(client, run_prefix, key_count, deleted_request_count)
+        start = time.perf_counter()
+        delete_with_keys_script(client, prefixes)
+        keys_time = time.perf_counter() - start
+
+        prefixes = populate(client, run_prefix, key_count, deleted_request_count)
+        start = time.perf_counter()
+        for prefix in prefixes:
+            client.delete_keys_by_prefix(prefix)
+        scan_time = time.perf_counter() - start
+
+        prefixes = populate(client, run_prefix, key_count, deleted_request_count)
+        start = time.perf_counter()
+        client.delete_keys_by_prefixes(prefixes)
+        sweep_time = time.perf_counter() - start
+    finally:
+        client.delete_keys_by_prefix(run_prefix)
+
+    print(
+        f"{key_count:>9} keys: KEYS script {keys_time:.3f}s, "
+        f"SCAN+UNLINK per prefix {scan_time:.3f}s, "
+        f"SCAN+UNLINK single sweep {sweep_time:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--url", default="", help="URL of the Redis server to use instead of fides'"
+    )
+    parser.add_argument(
+        "--requests",
+        default=DEFAULT_DELETED_REQUEST_COUNT,
+        type=int,
+        help="number of privacy requests whose keys are deleted",
+    )
+    parser.add_argument("key_counts", nargs="*", type=int)
+    args = parser.parse_args()
+
+    redis_client = get_client(args.url)
+    for count in args.key_counts or DEFAULT_KEY_COUNTS:
+        run_benchmark(redis_client, count, args.requests)
@@ -0,0 +1,156 @@
+"""
+Benchmark for batched DynamoDB reads and writes.
+
+Creates a table keyed on a single partition key and compares writing and then reading back
+its items one at a time, with one put_item and one query per item as the DynamoDB connector
+used to, against the BatchWriteItem and BatchGetItem calls it now makes.
+
+The table is created in moto's in-memory DynamoDB unless an endpoint is given with
+--endpoint-url, e.g. for DynamoDB Local, in which case the table is dropped afterwards.
+moto scans the whole table for every query, so reading 10k items one at a time takes minutes
+there; pass --batched-only to skip the one-by-one calls.
+
+Usage:
+    pip install "moto[dynamodb]"
+    python scripts/benchmarks/benchmark_dynamodb_batching.py [--endpoint-url URL] [--batched-only] [item_count ...]
+"""
+
+import argparse
+import time
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List
+
+import boto3
+from loguru import logger
+
+from fides.api.service.connectors.dynamodb_connector import (
+    DYNAMODB_BATCH_WRITE_SIZE,
+    DynamoDBConnector,
+)
+
+DEFAULT_ITEM_COUNTS = [1_000, 10_000]
+TABLE_NAME = "benchmark_customer"
+
+
+def mock_dynamodb(endpoint_url: str) -> ContextManager:
+    """Run against moto unless a real endpoint was given"""
+    if endpoint_url:
+        return nullcontext()
+
+    from moto import mock_aws  # pylint: disable=import-outside-toplevel
+
+    return mock_aws()
+
+
+def create_table(client: Any) -> None:
+    """Create an empty table keyed on email"""
+    client.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{"AttributeName": "email", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "email", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.get_waiter("table_exists").wait(TableName=TABLE_NAME)
+
+
+def build_items(item_count: int) -> List[Dict[str, Any]]:
+    """Build serialized customer items"""
+    return [
+        {
+            "email": {"S": f"customer-{index}@example.com"},
+            "name": {"S": f"Customer {index}"},
+        }
+        for index in range(item_count)
+    ]
+
+
+def write_one_by_one(client: Any, items: List[Dict[str, Any]]) -> None:
+    """Write each item with its own put_item call"""
+    for item in items:
+        client.put_item(TableName=TABLE_NAME, Item=item)
+
+
+def read_one_by_one(client: Any, items: List[Dict[str, Any]]) -> int:
+    """Read each item back with its own query"""
+    found = 0
+    for item in items:
+        response = client.query(
+            TableName=TABLE_NAME,
+            ExpressionAttributeValues={":value": item["email"]},
+            KeyConditionExpression="email = :value",
+        )
+        found += len(response["Items"])
+    return found
+
+
+def write_batched(client: Any, items: List[Dict[str, Any]]) -> None:
+    """Write the items in BatchWriteItem calls"""
+    for start in range(0, len(items), DYNAMODB_BATCH_WRITE_SIZE):
+        DynamoDBConnector._batch_put_items(  # pylint: disable=protected-access
+            client, TABLE_NAME, items[start : start + DYNAMODB_BATCH_WRITE_SIZE]
+        )
+
+
+def read_batched(client: Any, items: List[Dict[str, Any]]) -> int:
+    """Read the items back in BatchGetItem calls"""
+    keys = [{"email": item["email"]} for item in items]
+    return len(
+        DynamoDBConnector._batch_get_items(  # pylint: disable=protected-access
+            client, TABLE_NAME, keys
+        )
+    )
+
+
+def run_benchmark(endpoint_url: str, item_count: int, batched_only: bool) -> None:
+    """Time one-by-one and batched writes and reads of item_count items"""
+    with mock_dynamodb(endpoint_url):
+        client = boto3.client(
+            "dynamodb",
+            region_name="us-east-1",
+            endpoint_url=endpoint_url or None,
+            aws_access_key_id="benchmark",
+            aws_secret_access_key="benchmark",
+        )
+        create_table(client)
+        items = build_items(item_count)
+        try:
+            timings = {}
+            for label, write, read in (
+                ("one by one", write_one_by_one, read_one_by_one),
+                ("batched", write_batched, read_batched),
+            ):
+                if batched_only and label != "batched":
+                    continue
+                start = time.perf_counter()
+                write(client, items)
+                written = time.perf_counter()
+                assert read(client, items) == item_count
+                timings[label] = (written - start, time.perf_counter() - written)
+        finally:
+            client.delete_table(TableName=TABLE_NAME)
+
+    print(
+        f"{item_count:>6} items: "
+        + ", ".join(
+            f"{label} write {write_time:.3f}s ({item_count / write_time:,.0f}/s) "
+            f"read {read_time:.3f}s ({item_count / read_time:,.0f}/s)"
+            for label, (write_time, read_time) in timings.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--endpoint-url", default="", help="DynamoDB endpoint to use instead of moto"
+    )
+    parser.add_argument(
+        "--batched-only", action="store_true", help="skip the one-by-one calls"
+    )
+    parser.add_argument("item_counts", nargs="*", type=int)
+    args = parser.parse_args()
+
+    # the connector logs every batch it writes
+    logger.disable("fides")
+    for count in args.item_counts or DEFAULT_ITEM_COUNTS:
+        run_benchmark(args.endpoint_url, count, args.batched_only)
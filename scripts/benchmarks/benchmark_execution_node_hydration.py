@@ -0,0 +1,95 @@
+"""
+Benchmark for hydrating ExecutionNodes from RequestTasks.
+
+Saves a collection of 500 fields, 50 object fields with 9 nested scalar fields each, on an
+in-memory RequestTask along with its traversal details, the way DSR 3.0 persists them. Then it
+times building an ExecutionNode from the task, as every task run, retry and graph task does:
+once parsing the saved details for each node, and once through the hydrated node cache.
+
+Usage:
+    python scripts/benchmarks/benchmark_execution_node_hydration.py [--fields N] [node_count ...]
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List
+
+import fides.api.db.base  # pylint: disable=unused-import  # registers every model mapper
+from fides.api.graph.config import Collection, Field, ObjectField, ScalarField
+from fides.api.graph.execution import ExecutionNode, clear_hydrated_node_cache
+from fides.api.models.privacy_request import RequestTask, TraversalDetails
+
+DEFAULT_NODE_COUNTS = [100, 1000]
+SUBFIELDS_PER_OBJECT = 9
+
+
+def build_request_task(field_count: int) -> RequestTask:
+    """Build an in-memory RequestTask for a collection of field_count fields"""
+    fields: List[Field] = []
+    for object_index in range(field_count // (SUBFIELDS_PER_OBJECT + 1)):
+        subfields = {
+            f"field_{subfield_index}": ScalarField(
+                name=f"field_{subfield_index}",
+                primary_key=object_index == 0 and subfield_index == 0,
+                data_categories=[f"user.category_{subfield_index}"],
+            )
+            for subfield_index in range(SUBFIELDS_PER_OBJECT)
+        }
+        fields.append(ObjectField(name=f"object_{object_index}", fields=subfields))
+    collection = Collection(name="customer", fields=fields)
+
+    return RequestTask(
+        collection_address="benchmark:customer",
+        dataset_name="benchmark",
+        collection_name="customer",
+        collection=json.loads(collection.model_dump_json(serialize_as_any=True)),
+        traversal_details=TraversalDetails(
+            dataset_connection_key="benchmark_connection",
+            incoming_edges=[
+                ["benchmark:users:email", "benchmark:customer:object_0.field_1"]
+            ],
+            outgoing_edges=[
+                ["benchmark:customer:object_0.field_0", "benchmark:orders:customer_id"]
+            ],
+            input_keys=["benchmark:users"],
+        ).model_dump(mode="json"),
+    )
+
+
+def run_benchmark(field_count: int, node_count: int) -> None:
+    """Time building node_count ExecutionNodes with and without the hydrated node cache"""
+    request_task = build_request_task(field_count)
+    timings: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    for _ in range(node_count):
+        clear_hydrated_node_cache()
+        ExecutionNode(request_task)
+    timings["parsed"] = time.perf_counter() - start
+
+    clear_hydrated_node_cache()
+    start = time.perf_counter()
+    for _ in range(node_count):
+        ExecutionNode(request_task)
+    timings["cached"] = time.perf_counter() - start
+
+    print(
+        f"{node_count:>6} nodes x {field_count} fields: "
+        + ", ".join(
+            f"{label} {elapsed:.3f}s ({elapsed / node_count * 1_000_000:,.0f}us/node)"
+            for label, elapsed in timings.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--fields", default=500, type=int, help="number of fields in the collection"
+    )
+    parser.add_argument("node_counts", nargs="*", type=int)
+    args = parser.parse_args()
+
+    for count in args.node_counts or DEFAULT_NODE_COUNTS:
+        run_benchmark(args.fields, count)
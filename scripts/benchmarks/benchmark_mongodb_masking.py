@@ -0,0 +1,248 @@
+"""
+Benchmark for masking MongoDB documents with bulk writes.
+
+Fills a collection with customers who each have a history of embedded documents containing
+their name, then nulls out every name twice: once with an update_one call per customer, as
+the MongoDB connector used to, and once through MongoDBConnector.mask_data, which sends the
+same updates in unordered bulk writes.
+
+The collection lives in mongomock unless a server is given with --url, in which case the
+benchmark database is dropped afterwards. mongomock runs in-process, so every call it serves
+is delayed by --round-trip-ms to stand in for the network round trip a real server costs.
+It also finds documents by scanning the collection, which makes large counts slow there.
+
+Usage:
+    pip install mongomock
+    python scripts/benchmarks/benchmark_mongodb_masking.py [--url URL] [--history N] [--round-trip-ms MS] [customer_count ...]
+"""
+
+import argparse
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List
+
+from fideslang.models import Dataset
+from loguru import logger
+from pymongo import MongoClient
+
+import fides.api.db.base  # pylint: disable=unused-import  # registers every model mapper
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.execution import ExecutionNode
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.policy import ActionType, Policy, Rule, RuleTarget
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors.mongodb_connector import MongoDBConnector
+
+DEFAULT_CUSTOMER_COUNTS = [1_000, 5_000]
+DATABASE_NAME = "mongo_benchmark"
+COLLECTION_NAME = "customer"
+
+DATASET = {
+    "fides_key": DATABASE_NAME,
+    "name": "Mongo masking benchmark",
+    "collections": [
+        {
+            "name": COLLECTION_NAME,
+            "fields": [
+                {
+                    "name": "_id",
+                    "data_categories": ["system.operations"],
+                    "fides_meta": {"primary_key": True, "data_type": "integer"},
+                },
+                {
+                    "name": "email",
+                    "data_categories": ["user.contact.email"],
+                    "fides_meta": {"identity": "email", "data_type": "string"},
+                },
+                {
+                    "name": "history",
+                    "fides_meta": {"data_type": "object[]"},
+                    "fields": [
+                        {
+                            "name": "name",
+                            "data_categories": ["user.name"],
+                            "fides_meta": {"data_type": "string"},
+                        },
+                        {"name": "note", "fides_meta": {"data_type": "string"}},
+                    ],
+                },
+            ],
+        }
+    ],
+}
+
+
+def build_node() -> ExecutionNode:
+    """Build the execution node for the customer collection"""
+    graph = convert_dataset_to_graph(Dataset(**DATASET), DATABASE_NAME)
+    traversal = Traversal(DatasetGraph(graph), {"email": "customer@example.com"})
+    return traversal.traversal_node_dict[
+        CollectionAddress(DATABASE_NAME, COLLECTION_NAME)
+    ].to_mock_execution_node()
+
+
+def build_policy() -> Policy:
+    """Build an erasure policy that nulls out user.name"""
+    return Policy(
+        key="benchmark_erasure",
+        rules=[
+            Rule(
+                key="benchmark_erasure_rule",
+                action_type=ActionType.erasure,
+                masking_strategy={"strategy": "null_rewrite", "configuration": {}},
+                targets=[RuleTarget(data_category="user.name")],
+            )
+        ],
+    )
+
+
+def build_rows(customer_count: int, history_length: int) -> List[Dict[str, Any]]:
+    """Build customer documents with history_length embedded entries each"""
+    return [
+        {
+            "_id": index + 1,
+            "email": f"customer-{index}@example.com",
+            "history": [
+                {"name": f"Customer {index}", "note": f"Visit {visit}"}
+                for visit in range(history_length)
+            ],
+        }
+        for index in range(customer_count)
+    ]
+
+
+def with_round_trip(method: Callable, round_trip_seconds: float) -> Callable:
+    """Delay each call to method by one simulated round trip"""
+
+    @wraps(method)
+    def delayed(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(round_trip_seconds)
+        return method(*args, **kwargs)
+
+    return delayed
+
+
+def simulate_round_trips(round_trip_ms: float) -> None:
+    """Delay the mongomock writes the benchmark times"""
+    import mongomock  # pylint: disable=import-outside-toplevel
+
+    for name in ("update_one", "bulk_write"):
+        method = getattr(mongomock.Collection, name)
+        setattr(
+            mongomock.Collection,
+            name,
+            with_round_trip(method, round_trip_ms / 1000),
+        )
+
+
+def create_client(url: str) -> MongoClient:
+    """Connect to the given server, or to mongomock if there is none"""
+    if url:
+        return MongoClient(url, uuidRepresentation="standard")
+
+    import mongomock  # pylint: disable=import-outside-toplevel
+
+    return mongomock.MongoClient()
+
+
+def mask_one_by_one(
+    connector: MongoDBConnector,
+    node: ExecutionNode,
+    policy: Policy,
+    privacy_request: PrivacyRequest,
+    rows: List[Dict[str, Any]],
+) -> int:
+    """Mask each row with its own update_one call"""
+    query_config = connector.query_config(node)
+    collection = connector.client()[DATABASE_NAME][COLLECTION_NAME]
+    update_ct = 0
+    for row in rows:
+        update_stmt = query_config.generate_update_stmt(row, policy, privacy_request)
+        if update_stmt is not None:
+            query, update = update_stmt
+            update_ct += collection.update_one(
+                query, update, upsert=False
+            ).modified_count
+    return update_ct
+
+
+def mask_in_bulk(
+    connector: MongoDBConnector,
+    node: ExecutionNode,
+    policy: Policy,
+    privacy_request: PrivacyRequest,
+    rows: List[Dict[str, Any]],
+) -> int:
+    """Mask the rows through the connector"""
+    return connector.mask_data(node, policy, privacy_request, None, rows)
+
+
+def run_benchmark(url: str, customer_count: int, history_length: int) -> None:
+    """Time one-by-one and bulk masking of customer_count customers"""
+    connector = MongoDBConnector(
+        ConnectionConfig(
+            key=DATABASE_NAME,
+            connection_type=ConnectionType.mongodb,
+            secrets={"url": url},
+        )
+    )
+    connector.db_client = create_client(url)
+    collection = connector.db_client[DATABASE_NAME][COLLECTION_NAME]
+    node = build_node()
+    policy = build_policy()
+    privacy_request = PrivacyRequest(id="benchmark")
+    rows = build_rows(customer_count, history_length)
+
+    timings = {}
+    try:
+        for label, mask in (
+            ("one by one", mask_one_by_one),
+            ("bulk", mask_in_bulk),
+        ):
+            collection.delete_many({})
+            collection.insert_many([dict(row) for row in rows])
+            start = time.perf_counter()
+            assert mask(connector, node, policy, privacy_request, rows) == len(rows)
+            timings[label] = time.perf_counter() - start
+    finally:
+        connector.db_client.drop_database(DATABASE_NAME)
+        connector.close()
+
+    print(
+        f"{customer_count:>6} customers x {history_length} history entries: "
+        + ", ".join(
+            f"{label} {elapsed:.3f}s ({customer_count / elapsed:,.0f}/s)"
+            for label, elapsed in timings.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--url", default="", help="MongoDB server to use instead of mongomock"
+    )
+    parser.add_argument(
+        "--history",
+        default=50,
+        type=int,
+        help="embedded history entries per customer",
+    )
+    parser.add_argument(
+        "--round-trip-ms",
+        default=1.0,
+        type=float,
+        help="simulated round trip per mongomock call",
+    )
+    parser.add_argument("customer_counts", nargs="*", type=int)
+    args = parser.parse_args()
+
+    # the connector logs every update it sends
+    logger.disable("fides")
+    if not args.url:
+        simulate_round_trips(args.round_trip_ms)
+    for count in args.customer_counts or DEFAULT_CUSTOMER_COUNTS:
+        run_benchmark(args.url, count, args.history)
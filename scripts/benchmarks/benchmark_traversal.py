@@ -0,0 +1,79 @@
+"""
+Benchmark for building a Traversal over synthetic dataset graphs.
+
+Each graph is made up of datasets of 10 collections. The first collection in each dataset
+has an identity field, and every other collection references the previous collection in its
+dataset, so traversal has to follow a mix of identity and reference edges.
+
+Usage:
+    python scripts/benchmarks/benchmark_traversal.py [collection_count ...]
+"""
+
+import sys
+import time
+from typing import List
+
+from fides.api.graph.config import Collection, FieldAddress, GraphDataset, ScalarField
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+
+DEFAULT_COLLECTION_COUNTS = [100, 1_000, 10_000]
+COLLECTIONS_PER_DATASET = 10
+
+
+def build_datasets(collection_count: int) -> List[GraphDataset]:
+    """Build synthetic datasets containing the requested number of collections"""
+    datasets = []
+    for dataset_index in range(0, collection_count, COLLECTIONS_PER_DATASET):
+        dataset_name = f"dataset_{dataset_index // COLLECTIONS_PER_DATASET}"
+        collections = []
+        for collection_index in range(
+            min(COLLECTIONS_PER_DATASET, collection_count - dataset_index)
+        ):
+            if collection_index:
+                seed_field = ScalarField(
+                    name="parent_id",
+                    references=[
+                        (
+                            FieldAddress(
+                                dataset_name, f"collection_{collection_index - 1}", "id"
+                            ),
+                            "from",
+                        )
+                    ],
+                )
+            else:
+                seed_field = ScalarField(name="email", identity="email")
+            collections.append(
+                Collection(
+                    name=f"collection_{collection_index}",
+                    fields=[ScalarField(name="id", primary_key=True), seed_field],
+                )
+            )
+        datasets.append(
+            GraphDataset(
+                name=dataset_name,
+                collections=collections,
+                connection_key=f"{dataset_name}_connection",
+            )
+        )
+    return datasets
+
+
+def run_benchmark(collection_count: int) -> None:
+    """Time graph construction and traversal for the given number of collections"""
+    start = time.perf_counter()
+    graph = DatasetGraph(*build_datasets(collection_count))
+    graph_built = time.perf_counter()
+    Traversal(graph, {"email": "customer-1@example.com"})
+    traversal_built = time.perf_counter()
+    print(
+        f"{collection_count:>6} collections: "
+        f"graph {graph_built - start:.3f}s, traversal {traversal_built - graph_built:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_COLLECTION_COUNTS
+    for count in counts:
+        run_benchmark(count)
@@ -5,11 +5,13 @@ import io
 import json
 from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from typing import (
     Annotated,
     Any,
     DefaultDict,
     Dict,
+    Generator,
     List,
     Literal,
     Optional,
@@ -29,7 +31,7 @@ from loguru import logger
 from pydantic import Field
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy import cast, column, null, or_, select
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy.sql.expression import nullslast
 from starlette.responses import StreamingResponse
 from starlette.status import (
@@ -55,6 +57,7 @@ from fides.api.common_exceptions import (
 )
 from fides.api.graph.config import CollectionAddress
 from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.graph_cache import get_dataset_graph
 from fides.api.graph.traversal import Traversal
 from fides.api.models.audit_log import AuditLog, AuditLogAction
 from fides.api.models.client import ClientDetail
@@ -119,7 +122,7 @@ from fides.api.util.cache import FidesopsRedis, get_cache
 from fides.api.util.collection_util import Row
 from fides.api.util.endpoint_utils import validate_start_and_end_filters
 from fides.api.util.enums import ColumnSort
-from fides.api.util.fuzzy_search_utils import get_decrypted_identities_automaton
+from fides.api.util.fuzzy_search_utils import get_privacy_request_ids_by_identity_prefix
 from fides.api.util.storage_util import storage_json_encoder
 from fides.common.api.scope_registry import (
     PRIVACY_REQUEST_CALLBACK_RESUME,
@@ -256,58 +259,97 @@ def create_privacy_request_authenticated(
     )
 
 
-def privacy_request_csv_download(
+PRIVACY_REQUEST_CSV_HEADER = [
+    "Status",
+    "Request Type",
+    "Subject Identity",
+    "Custom Privacy Request Fields",
+    "Time Received",
+    "Reviewed By",
+    "Request ID",
+    "Time Approved/Denied",
+    "Denial Reason",
+]
+
+# The number of privacy requests read, and written to the CSV, at a time
+PRIVACY_REQUEST_CSV_BATCH_SIZE = 1000
+
+
+def privacy_request_csv_rows(
     db: Session, privacy_request_query: Query
-) -> StreamingResponse:
-    """Download privacy requests as CSV for Admin UI"""
+) -> Generator[str, None, None]:
+    """
+    Yields the CSV report for the privacy requests, one batch of rows at a time.
+
+    The privacy requests are read from a server-side cursor, and the policies, rules, identities,
+    custom fields and denial reasons of each batch are loaded in one query apiece, so memory use
+    stays flat however many privacy requests are downloaded.
+    """
     f = io.StringIO()
     csv_file = csv.writer(f)
+    csv_file.writerow(PRIVACY_REQUEST_CSV_HEADER)
+    yield f.getvalue()
 
-    csv_file.writerow(
-        [
-            "Status",
-            "Request Type",
-            "Subject Identity",
-            "Custom Privacy Request Fields",
-            "Time Received",
-            "Reviewed By",
-            "Request ID",
-            "Time Approved/Denied",
-            "Denial Reason",
-        ]
-    )
-    privacy_request_ids: List[str] = [r.id for r in privacy_request_query]
-    denial_audit_log_query: Query = db.query(AuditLog).filter(
-        AuditLog.action == AuditLogAction.denied,
-        AuditLog.privacy_request_id.in_(privacy_request_ids),
+    privacy_requests = iter(
+        privacy_request_query.with_session(db)
+        .options(
+            selectinload(PrivacyRequest.policy).selectinload(Policy.rules),  # type: ignore[attr-defined]
+            selectinload(PrivacyRequest.provided_identities),  # type: ignore[attr-defined]
+            selectinload(PrivacyRequest.custom_fields),  # type: ignore[attr-defined]
+        )
+        .yield_per(PRIVACY_REQUEST_CSV_BATCH_SIZE)
     )
-    denial_audit_logs: Dict[str, str] = {
-        r.privacy_request_id: r.message for r in denial_audit_log_query
-    }
+    while batch := list(islice(privacy_requests, PRIVACY_REQUEST_CSV_BATCH_SIZE)):
+        denied_ids = [pr.id for pr in batch if pr.status == PrivacyRequestStatus.denied]
+        denial_audit_log_query: Query = db.query(AuditLog).filter(
+            AuditLog.action == AuditLogAction.denied,
+            AuditLog.privacy_request_id.in_(denied_ids),
+        )
+        denial_audit_logs: Dict[str, str] = (
+            {r.privacy_request_id: r.message for r in denial_audit_log_query}
+            if denied_ids
+            else {}
+        )
+
+        f.seek(0)
+        f.truncate()
+        for pr in batch:
+            csv_file.writerow(
+                [
+                    pr.status.value if pr.status else None,
+                    (
+                        pr.policy.rules[0].action_type
+                        if len(pr.policy.rules) > 0
+                        else None
+                    ),
+                    pr.get_persisted_identity().model_dump(mode="json"),
+                    pr.get_persisted_custom_privacy_request_fields(),
+                    pr.created_at,
+                    pr.reviewed_by,
+                    pr.id,
+                    pr.reviewed_at,
+                    denial_audit_logs.get(pr.id),
+                ]
+            )
+        yield f.getvalue()
+
+
+def stream_privacy_request_csv_rows(
+    privacy_request_query: Query,
+) -> Generator[str, None, None]:
+    """
+    Streams the CSV report with a session of its own, since the request's session is
+    closed before a streaming response is sent.
+    """
+    with deps.get_db_contextmanager() as db:
+        yield from privacy_request_csv_rows(db, privacy_request_query)
 
-    for pr in privacy_request_query:
-        denial_reason = (
-            denial_audit_logs[pr.id]
-            if pr.status == PrivacyRequestStatus.denied and pr.id in denial_audit_logs
-            else None
-        )
-
-        csv_file.writerow(
-            [
-                pr.status.value if pr.status else None,
-                pr.policy.rules[0].action_type if len(pr.policy.rules) > 0 else None,
-                pr.get_persisted_identity().model_dump(mode="json"),
-                pr.get_persisted_custom_privacy_request_fields(),
-                pr.created_at,
-                pr.reviewed_by,
-                pr.id,
-                pr.reviewed_at,
-                denial_reason,
-            ]
-        )
-
-    f.seek(0)
-    response = StreamingResponse(f, media_type="text/csv")
+
+def privacy_request_csv_download(privacy_request_query: Query) -> StreamingResponse:
+    """Download privacy requests as CSV for Admin UI"""
+    response = StreamingResponse(
+        stream_privacy_request_csv_rows(privacy_request_query), media_type="text/csv"
+    )
     response.headers["Content-Disposition"] = (
         f"attachment; filename=privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.csv"
     )
@@ -434,26 +476,14 @@ def _filter_privacy_request_queryset(
     # Handle fuzzy search string
     if fuzzy_search_str:
         if CONFIG.execution.fuzzy_search_enabled:
-            decrypted_identities_automaton = get_decrypted_identities_automaton(db)
-
-            # Set of associated privacy request ids
-            fuzzy_search_identity_privacy_request_ids: Optional[Set[str]] = set(
-                x
-                for list in decrypted_identities_automaton.values(fuzzy_search_str)
-                for x in list
-            )
-
-            if not fuzzy_search_identity_privacy_request_ids:
-                query = query.filter(PrivacyRequest.id.ilike(f"{fuzzy_search_str}%"))
-            else:
-                query = query.filter(
-                    or_(
-                        PrivacyRequest.id.in_(
-                            fuzzy_search_identity_privacy_request_ids
-                        ),
-                        PrivacyRequest.id.ilike(f"{fuzzy_search_str}%"),
-                    )
+            query = query.filter(
+                or_(
+                    PrivacyRequest.id.in_(
+                        get_privacy_request_ids_by_identity_prefix(db, fuzzy_search_str)
+                    ),
+                    PrivacyRequest.id.ilike(f"{fuzzy_search_str}%"),
                 )
+            )
         else:
             # When fuzzy search is disabled, treat fuzzy_search_str as an
             # exact match on identity or partial match on privacy request ID
@@ -732,7 +762,7 @@ def _shared_privacy_request_search(
         _validate_result_size(query)
         # Returning here if download_csv param was specified
         logger.info("Downloading privacy requests as csv")
-        return privacy_request_csv_download(db, query)
+        return privacy_request_csv_download(query)
 
     # Conditionally embed execution log details in the response.
     if verbose:
@@ -1057,8 +1087,10 @@ def get_request_preview_queries(
                 connection_configs.append(connection_config)
 
         try:
-            dataset_graph: DatasetGraph = DatasetGraph(
-                *[dataset.get_graph() for dataset in dataset_configs]
+            dataset_graph: DatasetGraph = (
+                DatasetGraph(*[dataset.get_graph() for dataset in dataset_configs])
+                if dataset_keys
+                else get_dataset_graph(db, include_disabled=True)
             )
         except ValidationError as exc:
             raise HTTPException(
@@ -1643,20 +1675,12 @@ def privacy_request_data_transfer(
         )
 
     access_result = {k.split("__")[-1]: v for k, v in value_dict.items()}
-    datasets = DatasetConfig.all(db=db)
-    if not datasets:
+    dataset_graph = get_dataset_graph(db, include_disabled=True)
+    if not dataset_graph.nodes:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail=f"No datasets found for privacy request {privacy_request_id}",
         )
-
-    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-    if not dataset_graphs:
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail=f"No dataset graphs found for privacy request {privacy_request_id}",
-        )
-    dataset_graph = DatasetGraph(*dataset_graphs)
     target_categories = {target.data_category for target in rule.targets}
     filtered_results: Optional[Dict[str, Optional[List[Row]]]] = filter_data_categories(
         access_result,  # type: ignore
@@ -1,4 +1,5 @@
 import hashlib
+import hmac
 import secrets
 from base64 import b64decode, b64encode
 from binascii import Error
@@ -37,6 +38,15 @@ def hash_value_with_salt(text: bytes, salt: bytes) -> str:
     return hashlib.sha256(text + salt).hexdigest()
 
 
+def hmac_value_with_key(text: bytes, key: bytes) -> str:
+    """
+    Computes the HMAC-SHA256 of the text with the provided secret key and returns the hex string
+    representation. Used for blind indexes, where equal values must hash equally but the hashes
+    should be useless without the key.
+    """
+    return hmac.new(key, text, hashlib.sha256).hexdigest()
+
+
 def generate_secure_random_string(length: int) -> str:
     """Generates a securely random string using Python secrets library
     that is twice the length of the specified input"""
@@ -446,6 +446,55 @@ PROHIBITED_KEYWORDS = [
 ]
 
 
+@dataclass(frozen=True)
+class CollectionFieldIndex:
+    """Lookups over the flattened fields of a Collection, built in a single pass.
+
+    The index is a snapshot: it does not follow changes made to the collection's fields
+    after it was built, so it is only kept where the collection is treated as read-only.
+    """
+
+    field_dict: Dict[FieldPath, Field]
+    field_paths_by_category: Dict[FidesKey, List[FieldPath]]
+    identities: Dict[FieldPath, str]
+    references: Dict[FieldPath, List[Tuple[FieldAddress, Optional[EdgeDirection]]]]
+    custom_request_fields: Dict[FieldPath, str]
+    primary_keys: Dict[FieldPath, Field]
+
+    @classmethod
+    def build(cls, collection: Collection) -> CollectionFieldIndex:
+        """Flattens the collection's fields and indexes them"""
+        field_dict: Dict[FieldPath, Field] = collection.field_dict
+        categories: Dict[FidesKey, List[FieldPath]] = defaultdict(list)
+        identities: Dict[FieldPath, str] = {}
+        references = {}
+        custom_request_fields: Dict[FieldPath, str] = {}
+        primary_keys: Dict[FieldPath, Field] = {}
+        for field_path, field in field_dict.items():
+            for category in field.data_categories or []:
+                categories[category].append(field_path)
+            if field.identity:
+                identities[field_path] = field.identity
+            if field.references:
+                references[field_path] = field.references
+            if field.custom_request_field:
+                custom_request_fields[field_path] = field.custom_request_field
+            if field.primary_key:
+                primary_keys[field_path] = field
+        return cls(
+            field_dict=field_dict,
+            field_paths_by_category=dict(categories),
+            identities=identities,
+            references=references,
+            custom_request_fields=custom_request_fields,
+            primary_keys=primary_keys,
+        )
+
+    def field(self, field_path: FieldPath) -> Optional[Field]:
+        """Return Field (looked up by FieldPath) if indexed or None if not found"""
+        return self.field_dict.get(field_path)
+
+
 class Collection(BaseModel):
     """A single grouping of individual data points that are accessed together"""
 
@@ -1,10 +1,16 @@
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from fideslang.validation import FidesKey
 
 from fides.api.graph.config import (
     Collection,
     CollectionAddress,
+    CollectionFieldIndex,
     Field,
     FieldAddress,
     FieldPath,
@@ -16,48 +22,138 @@ from fides.api.util.logger_context_utils import Contextualizable, LoggerContextK
 
 COLLECTION_FIELD_PATH_MAP = Dict[CollectionAddress, List[Tuple[FieldPath, FieldPath]]]
 
+# The number of hydrated nodes each process keeps
+HYDRATED_NODE_CACHE_SIZE = 1024
 
-class ExecutionNode(Contextualizable):  # pylint: disable=too-many-instance-attributes
-    """Node for *executing* a task. This node only has knowledge of itself and its incoming and outgoing edges
 
-    After we build the graph, we save details to RequestTasks in the database that are hydrated here to execute an individual
-    node without rebuilding the graph with traversal.traverse
-    """
+@dataclass(frozen=True)
+class HydratedNode:
+    """The parsed collection and traversal details of a RequestTask, shared by the
+    ExecutionNodes built from RequestTasks with the same saved details"""
 
-    def __init__(self, request_task: RequestTask):
+    collection: Collection
+    field_index: CollectionFieldIndex
+    address: CollectionAddress
+    incoming_edges: FrozenSet[Edge]
+    outgoing_edges: FrozenSet[Edge]
+    connection_key: FidesKey
+    input_keys: Tuple[CollectionAddress, ...]
+
+    @classmethod
+    def parse(cls, request_task: RequestTask) -> "HydratedNode":
+        """Parse the collection and traversal details saved on the RequestTask"""
         assert request_task.collection  # For mypy
-        self.collection: Collection = Collection.parse_from_request_task(
-            request_task.collection
-        )
-        self.address: CollectionAddress = CollectionAddress.from_string(
-            request_task.collection_address
-        )
         traversal_details = TraversalDetails.model_validate(
             request_task.traversal_details or {}
         )
+        collection = Collection.parse_from_request_task(request_task.collection)
+        return cls(
+            collection=collection,
+            field_index=CollectionFieldIndex.build(collection),
+            address=CollectionAddress.from_string(request_task.collection_address),
+            incoming_edges=frozenset(
+                Edge(
+                    FieldAddress.from_string(edge[0]), FieldAddress.from_string(edge[1])
+                )
+                for edge in traversal_details.incoming_edges
+            ),
+            outgoing_edges=frozenset(
+                Edge(
+                    FieldAddress.from_string(edge[0]), FieldAddress.from_string(edge[1])
+                )
+                for edge in traversal_details.outgoing_edges
+            ),
+            connection_key=FidesKey(traversal_details.dataset_connection_key),
+            input_keys=tuple(
+                CollectionAddress.from_string(input_key)
+                for input_key in traversal_details.input_keys
+            ),
+        )
+
+
+class HydratedNodeCache:
+    """
+    A process-wide LRU cache of the nodes hydrated from RequestTasks.
 
-        self.incoming_edges: Set[Edge] = {
-            Edge(FieldAddress.from_string(edge[0]), FieldAddress.from_string(edge[1]))
-            for edge in traversal_details.incoming_edges
-        }
-        self.outgoing_edges: Set[Edge] = {
-            Edge(FieldAddress.from_string(edge[0]), FieldAddress.from_string(edge[1]))
-            for edge in traversal_details.outgoing_edges
-        }
-        self.connection_key: FidesKey = FidesKey(
-            traversal_details.dataset_connection_key
+    Nodes are keyed by collection address and a digest of the saved collection and
+    traversal details, so retries of a task and the tasks of other privacy requests
+    against the same dataset reuse the parsed collection instead of parsing it again,
+    and a dataset change is picked up as a new key.
+    """
+
+    def __init__(self, maxsize: int = HYDRATED_NODE_CACHE_SIZE) -> None:
+        self._nodes: "OrderedDict[Tuple[str, str], HydratedNode]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = Lock()
+
+    @staticmethod
+    def get_cache_key(request_task: RequestTask) -> Tuple[str, str]:
+        """Digest the saved details as loaded, a different key order only costs a cache miss"""
+        details = json.dumps(
+            [request_task.collection, request_task.traversal_details], default=str
+        )
+        return (
+            request_task.collection_address,
+            hashlib.sha256(details.encode("utf-8")).hexdigest(),
         )
 
+    def get(self, request_task: RequestTask) -> HydratedNode:
+        """Returns the hydrated node for the RequestTask, parsing it on a cache miss"""
+        key = self.get_cache_key(request_task)
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is not None:
+                self._nodes.move_to_end(key)
+                return node
+
+        node = HydratedNode.parse(request_task)
+        with self._lock:
+            self._nodes[key] = node
+            if len(self._nodes) > self._maxsize:
+                self._nodes.popitem(last=False)
+        return node
+
+    def clear(self) -> None:
+        """Drops all hydrated nodes"""
+        with self._lock:
+            self._nodes.clear()
+
+
+hydrated_node_cache = HydratedNodeCache()
+
+
+def clear_hydrated_node_cache() -> None:
+    """Clears the process-wide cache of hydrated nodes"""
+    hydrated_node_cache.clear()
+
+
+class ExecutionNode(Contextualizable):  # pylint: disable=too-many-instance-attributes
+    """Node for *executing* a task. This node only has knowledge of itself and its incoming and outgoing edges
+
+    After we build the graph, we save details to RequestTasks in the database that are hydrated here to execute an individual
+    node without rebuilding the graph with traversal.traverse
+    """
+
+    def __init__(self, request_task: RequestTask):
+        # The collection is shared with the other nodes hydrated from the same details,
+        # so it is treated as read-only
+        hydrated_node: HydratedNode = hydrated_node_cache.get(request_task)
+        self.collection: Collection = hydrated_node.collection
+        # Field lookups for the hot paths that run per row or per input value
+        self.field_index: CollectionFieldIndex = hydrated_node.field_index
+        self.address: CollectionAddress = hydrated_node.address
+
+        self.incoming_edges: Set[Edge] = set(hydrated_node.incoming_edges)
+        self.outgoing_edges: Set[Edge] = set(hydrated_node.outgoing_edges)
+        self.connection_key: FidesKey = hydrated_node.connection_key
+
         self.incoming_edges_by_collection: Dict[CollectionAddress, List[Edge]] = (
             partition(self.incoming_edges, lambda e: e.f1.collection_address())
         )
 
         # Input should be passed into accessing data in this order
-        self.input_keys: List[CollectionAddress] = [
-            CollectionAddress.from_string(input_key)
-            for input_key in traversal_details.input_keys
-        ]
-        self.grouped_fields = self.collection.grouped_inputs
+        self.input_keys: List[CollectionAddress] = list(hydrated_node.input_keys)
+        self.grouped_fields: Set[str] = set(self.collection.grouped_inputs)
 
     @property
     def query_field_paths(self) -> Set[FieldPath]:
@@ -119,7 +215,7 @@ class ExecutionNode(Contextualizable):  # pylint: disable=too-many-instance-attr
         out = {}
         for key, values in input_data.items():
             path: FieldPath = FieldPath.parse(key)
-            field: Optional[Field] = self.collection.field(path)
+            field: Optional[Field] = self.field_index.field(path)
 
             if field and path in self.query_field_paths and isinstance(values, list):
                 cast_values = [field.cast(v) for v in values]
@@ -0,0 +1,113 @@
+"""
+A process-level cache of compiled DatasetGraphs.
+
+Building a DatasetGraph means parsing every collection of every dataset and recomputing all of
+the edges between them, even though datasets rarely change between privacy requests. The compiled
+graph is cached here, keyed by a fingerprint of the DatasetConfig, CTL Dataset and ConnectionConfig
+rows that it was built from, so a change made by any process will cause the graph to be rebuilt.
+Writes made through this process also clear the cache directly.
+"""
+
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from fides.api.graph.graph import DatasetGraph
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.datasetconfig import DatasetConfig
+
+from fides.api.models.sql_models import (  # type: ignore[attr-defined] # isort: skip
+    Dataset as CtlDataset,
+)
+
+GraphFingerprint = Tuple[Tuple[Any, ...], ...]
+
+
+class DatasetGraphCache:
+    """Caches the most recently compiled DatasetGraph, with and without disabled connections"""
+
+    def __init__(self) -> None:
+        self._graphs: Dict[bool, Tuple[GraphFingerprint, DatasetGraph]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_fingerprint(db: Session) -> GraphFingerprint:
+        """
+        Returns the versions of every row that a DatasetGraph is built from.
+
+        Only ids, timestamps and the disabled flag are selected, so neither the dataset
+        contents nor the encrypted connection secrets are loaded.
+        """
+        return tuple(
+            tuple(row)
+            for row in db.query(
+                DatasetConfig.id,
+                DatasetConfig.updated_at,
+                CtlDataset.updated_at,
+                ConnectionConfig.id,
+                ConnectionConfig.updated_at,
+                ConnectionConfig.disabled,
+            )
+            .join(CtlDataset, DatasetConfig.ctl_dataset_id == CtlDataset.id)
+            .join(
+                ConnectionConfig,
+                DatasetConfig.connection_config_id == ConnectionConfig.id,
+            )
+            .order_by(DatasetConfig.id)
+            .all()
+        )
+
+    def get(self, db: Session, include_disabled: bool = False) -> DatasetGraph:
+        """
+        Returns a DatasetGraph of all datasets, rebuilding it only if a dataset or
+        connection has changed since it was last built.
+
+        Datasets belonging to disabled connections are left out unless include_disabled is set.
+        The returned graph is shared, so it must not be modified.
+        """
+        fingerprint = self.get_fingerprint(db)
+        with self._lock:
+            cached: Optional[Tuple[GraphFingerprint, DatasetGraph]] = self._graphs.get(
+                include_disabled
+            )
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        logger.debug("Building dataset graph for {} datasets", len(fingerprint))
+        dataset_configs: List[DatasetConfig] = DatasetConfig.all(db=db)
+        dataset_graph = DatasetGraph(
+            *[
+                dataset_config.get_graph()
+                for dataset_config in dataset_configs
+                if include_disabled or not dataset_config.connection_config.disabled
+            ]
+        )
+        with self._lock:
+            self._graphs[include_disabled] = (fingerprint, dataset_graph)
+        return dataset_graph
+
+    def clear(self) -> None:
+        """Drops all cached graphs"""
+        with self._lock:
+            self._graphs.clear()
+
+
+_dataset_graph_cache = DatasetGraphCache()
+
+
+def get_dataset_graph(db: Session, include_disabled: bool = False) -> DatasetGraph:
+    """Returns the cached DatasetGraph of all datasets, see DatasetGraphCache.get"""
+    return _dataset_graph_cache.get(db, include_disabled=include_disabled)
+
+
+def clear_dataset_graph_cache(*_: Any) -> None:
+    """Clears the process-level DatasetGraph cache"""
+    _dataset_graph_cache.clear()
+
+
+for _model in (DatasetConfig, CtlDataset, ConnectionConfig):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, clear_dataset_graph_cache)
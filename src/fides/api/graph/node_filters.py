@@ -69,8 +69,9 @@ class OptionalIdentityFilter(NodeFilter):
         # Get all collection addresses as strings
         all_collection_addresses = {str(addr) for addr in graph.nodes.keys()}
 
-        # Test reachability with each possible identity seed
-        for identity_key in graph.identity_keys.values():
+        # Test reachability with each possible identity seed. The same identity is usually
+        # declared on many fields, so each distinct identity is only evaluated once.
+        for identity_key in dict.fromkeys(graph.identity_keys.values()):
             self._compute_reachable_nodes(identity_key, all_collection_addresses)
 
     def exclude_node(self, node: "TraversalNode") -> bool:
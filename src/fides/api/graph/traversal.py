@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from itertools import chain
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import pydash.collections
 from fideslang.validation import FidesKey
@@ -40,7 +41,7 @@ from fides.api.models.privacy_request import (
 from fides.api.schemas.policy import ActionType
 from fides.api.util.collection_util import Row, append, partition
 from fides.api.util.logger_context_utils import Contextualizable, LoggerContextKeys
-from fides.api.util.matching_queue import MatchingQueue
+from fides.api.util.ready_queue import ReadyQueue
 
 ARTIFICIAL_NODES: List[CollectionAddress] = [
     ROOT_COLLECTION_ADDRESS,
@@ -65,6 +66,72 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
+def index_edges_by_collection(edges: Set[Edge]) -> Dict[CollectionAddress, Set[Edge]]:
+    """Maps each collection to the edges that start or end in it"""
+    edges_by_collection: Dict[CollectionAddress, Set[Edge]] = {}
+    for edge in edges:
+        for address in (edge.f1.collection_address(), edge.f2.collection_address()):
+            edges_by_collection.setdefault(address, set()).add(edge)
+    return edges_by_collection
+
+
+@dataclass
+class AfterDependencies:
+    """The "after" constraints of the nodes in a traversal, indexed so traversal can track
+    when each node is ready to run.
+
+    A collection "after" waits on each listed collection in the graph, and a dataset "after"
+    waits on every collection in each listed dataset. For each node we count how many nodes
+    it is waiting on, and for each collection or dataset, which nodes are waiting on it.
+    """
+
+    blocker_counts: Dict[CollectionAddress, int]
+    dependents_by_collection: Dict[CollectionAddress, List[CollectionAddress]]
+    dependents_by_dataset: Dict[str, List[CollectionAddress]]
+
+    @classmethod
+    def build(
+        cls, traversal_node_dict: Dict[CollectionAddress, TraversalNode]
+    ) -> AfterDependencies:
+        """Index the "after" constraints of every node in the traversal"""
+        nodes_per_dataset: Dict[str, int] = {}
+        for address in traversal_node_dict:
+            nodes_per_dataset[address.dataset] = (
+                nodes_per_dataset.get(address.dataset, 0) + 1
+            )
+
+        after_dependencies = cls(
+            blocker_counts={}, dependents_by_collection={}, dependents_by_dataset={}
+        )
+        for address, tn in traversal_node_dict.items():
+            blocker_count = 0
+            for after_address in tn.node.collection.after:
+                if after_address in traversal_node_dict:
+                    blocker_count += 1
+                    append(
+                        after_dependencies.dependents_by_collection,
+                        after_address,
+                        address,
+                    )
+            for after_dataset in tn.node.dataset.after:
+                blocker_count += nodes_per_dataset.get(after_dataset, 0)
+                append(after_dependencies.dependents_by_dataset, after_dataset, address)
+            after_dependencies.blocker_counts[address] = blocker_count
+        return after_dependencies
+
+    def release(
+        self,
+        finished_address: CollectionAddress,
+        running_node_queue: ReadyQueue[CollectionAddress, TraversalNode],
+    ) -> None:
+        """Release one blocker from every node waiting on the finished node"""
+        for dependent in chain(
+            self.dependents_by_collection.get(finished_address, []),
+            self.dependents_by_dataset.get(finished_address.dataset, []),
+        ):
+            running_node_queue.release(dependent)
+
+
 class BaseTraversal:
     """Handling for a single reified traversal of a graph based on input (seed) data."""
 
@@ -191,42 +258,36 @@ class BaseTraversal:
             self.traversal_node_dict.keys()
         )
         finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        finished_node_positions: Dict[CollectionAddress, int] = {}
+        # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
+        # nodes are only ready to run once every node they are waiting for has finished
+        after_dependencies = AfterDependencies.build(self.traversal_node_dict)
+        running_node_queue: ReadyQueue[CollectionAddress, TraversalNode] = ReadyQueue(
+            after_dependencies.blocker_counts
+        )
+        running_node_queue.push_if_new(self.root_node.address, self.root_node)
         remaining_edges: Set[Edge] = self.edges.copy()
+        remaining_edges_by_node = index_edges_by_collection(remaining_edges)
         while not running_node_queue.is_empty():
-            # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
+            n = running_node_queue.pop_ready()
 
             if n:
                 node_run_fn(n, environment)
+                node_edges: Set[Edge] = remaining_edges_by_node.get(n.address, set())
                 # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges: Set[Edge] = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,  # type: ignore[redundant-cast]
-                    )
-
-                    def edge_ends_with_collection(_edge: Edge) -> bool:
-                        # append edges that end in this traversal_node
-                        return _edge.ends_with_collection(
-                            cast(TraversalNode, n).address  # type: ignore[redundant-cast]
-                        )
-
-                    for edge in filter(edge_ends_with_collection, completed_edges):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
+                self._remove_edges_from_finished_nodes(
+                    n,
+                    node_edges,
+                    finished_nodes,
+                    finished_node_positions,
+                    remaining_edges,
+                    remaining_edges_by_node,
+                )
                 # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
                 # in the form (field_address_this, field_address_foreign)
 
                 edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)  # type: ignore[redundant-cast]
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
+                    [e.split_by_address(n.address) for e in node_edges]
                 )
                 if not edges_to_children:
                     n.is_terminal_node = True
@@ -235,13 +296,17 @@ class BaseTraversal:
                 child_node_addresses = {
                     a[1].collection_address() for a in edges_to_children if a
                 }
-                for nxt_address in child_node_addresses:
+                # children are queued in sorted order so the traversal order doesn't depend on set iteration order
+                for nxt_address in sorted(child_node_addresses):
                     # only add the next traversal_node to the queue if it is not already there (no duplicates)
                     running_node_queue.push_if_new(
-                        self.traversal_node_dict[nxt_address]
+                        nxt_address, self.traversal_node_dict[nxt_address]
                     )
+                finished_node_positions.setdefault(n.address, len(finished_nodes))
                 finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                if n.address in remaining_node_keys:
+                    remaining_node_keys.remove(n.address)
+                    after_dependencies.release(n.address, running_node_queue)
             else:
                 # traversal traversal_node dict diff finished nodes
                 logger.error(
@@ -288,6 +353,41 @@ class BaseTraversal:
             logger.debug("Found {} end nodes: {}", len(end_nodes), end_nodes)
         return end_nodes
 
+    @staticmethod
+    def _remove_edges_from_finished_nodes(
+        n: TraversalNode,
+        node_edges: Set[Edge],
+        finished_nodes: Dict[CollectionAddress, TraversalNode],
+        finished_node_positions: Dict[CollectionAddress, int],
+        remaining_edges: Set[Edge],
+        remaining_edges_by_node: Dict[CollectionAddress, Set[Edge]],
+    ) -> None:
+        """Delete the edges between the traversal_node that's just run and any finished nodes,
+        visiting the finished nodes in the order they finished, and add the edges that end in
+        the traversal_node as children of the finished nodes."""
+        completed_edges_by_node: Dict[CollectionAddress, List[Edge]] = {}
+        for edge in node_edges:
+            for finished_node_address in (
+                edge.f1.collection_address(),
+                edge.f2.collection_address(),
+            ):
+                if finished_node_address in finished_nodes and edge.spans(
+                    finished_node_address, n.address
+                ):
+                    append(completed_edges_by_node, finished_node_address, edge)
+        for finished_node_address in sorted(
+            completed_edges_by_node, key=finished_node_positions.__getitem__
+        ):
+            finished_node = finished_nodes[finished_node_address]
+            for edge in completed_edges_by_node[finished_node_address]:
+                remaining_edges.discard(edge)
+                remaining_edges_by_node[edge.f1.collection_address()].discard(edge)
+                remaining_edges_by_node[edge.f2.collection_address()].discard(edge)
+                # append edges that end in this traversal_node
+                # note, this will not work for self-reference
+                if edge.ends_with_collection(n.address):
+                    finished_node.add_child(n, edge)
+
     @property
     def skipped_nodes(self) -> Dict[str, str]:
         """
@@ -0,0 +1,100 @@
+from typing import Any, Callable, Optional
+
+from loguru import logger
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+
+from fides.api.api.deps import get_db_contextmanager
+from fides.api.models.identity_search_index import IdentitySearchIndex
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.tasks.scheduled.scheduler import scheduler
+from fides.api.util.cache import FidesopsRedis, get_cache
+from fides.api.util.fuzzy_search_utils import add_to_identity_search_index
+from fides.config import CONFIG
+
+IDENTITY_SEARCH_INDEX_BACKFILL = "identity_search_index_backfill"
+IDENTITY_SEARCH_INDEX_BACKFILL_LOCK = "identity_search_index_backfill_lock"
+
+
+def initiate_identity_search_index_backfill() -> None:
+    """Initiates scheduler to add the identities missing from the identity search index"""
+
+    if CONFIG.test_mode or not CONFIG.execution.fuzzy_search_enabled:
+        return
+
+    assert (
+        scheduler.running
+    ), "Scheduler is not running! Cannot backfill the identity search index."
+
+    logger.info("Initiating scheduler for identity search index backfill")
+    scheduler.add_job(
+        func=identity_search_index_backfill_task,
+        id=IDENTITY_SEARCH_INDEX_BACKFILL,
+    )
+
+
+def identity_search_index_backfill_task() -> None:
+    """
+    Job to add the provided identities that are missing from the identity search index,
+    e.g. ones persisted before the index existed or while fuzzy search was disabled.
+
+    Only one worker runs the backfill at a time, the others skip it.
+    """
+    redis_conn: FidesopsRedis = get_cache()
+
+    # The lock expires if the worker holding it dies, and is renewed after every batch
+    lock = redis_conn.lock(IDENTITY_SEARCH_INDEX_BACKFILL_LOCK, timeout=600)
+    if not lock.acquire(blocking=False):
+        logger.info(
+            "Another instance of the identity search index backfill is already running. Skipping this execution."
+        )
+        return
+
+    try:
+        with get_db_contextmanager() as db:
+            backfill_identity_search_index(db, on_batch_complete=lock.reacquire)
+    finally:
+        lock.release()
+
+
+def backfill_identity_search_index(
+    db: Session,
+    batch_size: int = 1000,
+    on_batch_complete: Optional[Callable[[], Any]] = None,
+) -> int:
+    """
+    Index all provided identities that are not in the identity search index yet.
+
+    Each batch is committed once it is indexed, so an interrupted backfill picks up where it
+    left off. Returns the number of provided identities that were processed.
+    """
+
+    is_indexed = exists().where(
+        IdentitySearchIndex.provided_identity_id == ProvidedIdentity.id
+    )
+    indexed_count = 0
+    last_id: Optional[str] = None
+    while True:
+        query = db.query(ProvidedIdentity).filter(
+            ProvidedIdentity.privacy_request_id.isnot(None), ~is_indexed
+        )
+        # identities without a value, or with one too short to index, get no rows, so page past them
+        if last_id is not None:
+            query = query.filter(ProvidedIdentity.id > last_id)
+        unindexed_batch = query.order_by(ProvidedIdentity.id).limit(batch_size).all()
+        if not unindexed_batch:
+            break
+
+        add_to_identity_search_index(db, unindexed_batch)
+
+        # commit after each batch is complete
+        db.commit()
+        indexed_count += len(unindexed_batch)
+        last_id = unindexed_batch[-1].id
+        if on_batch_complete:
+            on_batch_complete()
+
+    logger.info(
+        f"Completed identity search index backfill for {indexed_count} provided identities."
+    )
+    return indexed_count
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+from copy import deepcopy
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional, Type
 
@@ -297,6 +298,21 @@ class ConnectionConfig(Base):
         db_obj = cls(**data)  # type: ignore
         return db_obj
 
+    def detached_copy(self) -> ConnectionConfig:
+        """
+        Returns an unsaved copy of the ConnectionConfig that is not attached to any session.
+        Unlike the original, the copy can be read from threads other than the one using its session.
+        """
+        return ConnectionConfig(
+            id=self.id,
+            key=self.key,
+            name=self.name,
+            connection_type=self.connection_type,
+            access=self.access,
+            secrets=deepcopy(self.secrets),
+            saas_config=deepcopy(self.saas_config),
+        )
+
     def get_saas_config(self) -> Optional[SaaSConfig]:
         """Returns a SaaSConfig object from a yaml config"""
         return SaaSConfig(**self.saas_config) if self.saas_config else None
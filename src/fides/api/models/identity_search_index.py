@@ -0,0 +1,28 @@
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.ext.declarative import declared_attr
+
+from fides.api.db.base_class import Base  # type: ignore[attr-defined]
+
+
+class IdentitySearchIndex(Base):
+    """
+    A blind index over the prefixes of the identity values provided with privacy requests,
+    used to search privacy requests by the start of an identity value without decrypting them.
+
+    Each row holds a keyed hash of one prefix of a ProvidedIdentity's value.
+    """
+
+    @declared_attr
+    def __tablename__(self) -> str:
+        return "identity_search_index"
+
+    provided_identity_id = Column(
+        String,
+        ForeignKey("providedidentity.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Copied from the provided identity so searches don't need a join. Rows are removed
+    # along with the provided identity, which is removed along with its privacy request.
+    privacy_request_id = Column(String, nullable=False)
+    prefix_hash = Column(String, nullable=False, index=True)
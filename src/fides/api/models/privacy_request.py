@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timedelta
 from enum import Enum as EnumType
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from celery.result import AsyncResult
 from loguru import logger
@@ -22,7 +22,15 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import Query, RelationshipProperty, Session, backref, relationship
+from sqlalchemy.orm import (
+    Query,
+    RelationshipProperty,
+    Session,
+    backref,
+    deferred,
+    relationship,
+    undefer,
+)
 from sqlalchemy.orm.dynamic import AppenderQuery
 from sqlalchemy.sql import text
 from sqlalchemy_utils.types.encrypted.encrypted_type import (
@@ -94,9 +102,10 @@ from fides.api.tasks import celery_app
 from fides.api.util.cache import (
     FidesopsRedis,
     celery_tasks_in_flight,
-    get_all_cache_keys_for_privacy_request,
+    escape_redis_pattern,
     get_async_task_tracking_cache_key,
     get_cache,
+    get_celery_tasks_in_flight,
     get_custom_privacy_request_field_cache_key,
     get_drp_request_body_cache_key,
     get_encryption_cache_key,
@@ -106,7 +115,7 @@ from fides.api.util.cache import (
 from fides.api.util.collection_util import Row, extract_key_for_address
 from fides.api.util.constants import API_DATE_FORMAT
 from fides.api.util.custom_json_encoder import CustomJSONEncoder
-from fides.api.util.decrypted_identity_automaton import DecryptedIdentityAutomatonMixin
+from fides.api.util.fuzzy_search_utils import add_to_identity_search_index
 from fides.api.util.identity_verification import IdentityVerificationMixin
 from fides.api.util.logger import Pii
 from fides.api.util.logger_context_utils import Contextualizable, LoggerContextKeys
@@ -206,7 +215,7 @@ def generate_request_task_callback_jwe(request_task: RequestTask) -> str:
 
 
 class PrivacyRequest(
-    IdentityVerificationMixin, DecryptedIdentityAutomatonMixin, Contextualizable, Base
+    IdentityVerificationMixin, Contextualizable, Base
 ):  # pylint: disable=R0904,too-many-instance-attributes
     """
     The DB ORM model to describe current and historic PrivacyRequests.
@@ -393,9 +402,7 @@ class PrivacyRequest(
         """
         logger.info(f"Clearing cached values for privacy request {self.id}")
         cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        cache.delete_keys_by_pattern(f"*{escape_redis_pattern(self.id)}*")
 
     def delete(self, db: Session) -> None:
         """
@@ -471,6 +478,7 @@ class PrivacyRequest(
             identity = Identity(**identity)
 
         identity_dict = identity.labeled_dict()
+        provided_identities: List[ProvidedIdentity] = []
         for key, value in identity_dict.items():
             if value is not None:
                 if isinstance(value, dict):
@@ -496,18 +504,24 @@ class PrivacyRequest(
                 if label is not None:
                     provided_identity_data["field_label"] = label
 
-                ProvidedIdentity.create(
-                    db=db,
-                    data=provided_identity_data,
+                provided_identities.append(
+                    ProvidedIdentity.create(
+                        db=db,
+                        data=provided_identity_data,
+                    )
                 )
 
-        # Simultaneously add identities to automaton for fuzzy search
+        # Simultaneously add identities to the search index for fuzzy search
         if CONFIG.execution.fuzzy_search_enabled:
             try:
-                self.add_identities_to_automaton()
+                add_to_identity_search_index(db, provided_identities)
+                db.commit()
             except Exception as exc:
                 # This should never affect the ability to create privacy requests
-                logger.error(f"Could not add identities to Automaton: {Pii(str(exc))}")
+                db.rollback()
+                logger.error(
+                    f"Could not add identities to the search index: {Pii(str(exc))}"
+                )
 
     def persist_custom_privacy_request_fields(
         self,
@@ -1179,7 +1193,7 @@ class PrivacyRequest(
                 RequestTask.collection_address.notin_(
                     [ROOT_COLLECTION_ADDRESS.value, TERMINATOR_ADDRESS.value]
                 ),
-            ):
+            ).options(undefer(RequestTask.access_data)):
                 final_results[task.collection_address] = task.get_access_data()
 
             return final_results
@@ -1956,24 +1970,30 @@ class RequestTask(Base):
     # Raw data retrieved from an access request is stored here.  This contains all of the
     # intermediate data we retrieved, needed for downstream tasks, but hasn't been filtered
     # by data category for the end user.
-    access_data = Column(  # An encrypted JSON String - saved as a list of Rows
-        StringEncryptedType(
-            type_in=JSONTypeOverride,
-            key=CONFIG.security.app_encryption_key,
-            engine=AesGcmEngine,
-            padding="pkcs5",
-        ),
+    # Deferred, along with data_for_erasures, so the encrypted payloads are only loaded and
+    # decrypted where the data is used, not on every query for the task.
+    access_data = deferred(
+        Column(  # An encrypted JSON String - saved as a list of Rows
+            StringEncryptedType(
+                type_in=JSONTypeOverride,
+                key=CONFIG.security.app_encryption_key,
+                engine=AesGcmEngine,
+                padding="pkcs5",
+            ),
+        )
     )
 
     # This is the raw access data saved in erasure format (with placeholders preserved) to perform a masking request.
     # First saved on the access node, and then copied to the corresponding erasure node.
-    data_for_erasures = Column(  # An encrypted JSON String - saved as a list of rows
-        StringEncryptedType(
-            type_in=JSONTypeOverride,
-            key=CONFIG.security.app_encryption_key,
-            engine=AesGcmEngine,
-            padding="pkcs5",
-        ),
+    data_for_erasures = deferred(
+        Column(  # An encrypted JSON String - saved as a list of rows
+            StringEncryptedType(
+                type_in=JSONTypeOverride,
+                key=CONFIG.security.app_encryption_key,
+                engine=AesGcmEngine,
+                padding="pkcs5",
+            ),
+        )
     )
 
     # Written after an erasure is completed
@@ -2062,11 +2082,22 @@ class RequestTask(Base):
 
     def upstream_tasks_complete(self, db: Session, should_log: bool = False) -> bool:
         """Determines if all of the upstream tasks of the current task are complete"""
-        upstream_tasks: Query = self.upstream_tasks_objects(db)
+        return self.upstream_statuses_complete(
+            self.get_task_statuses(db, self.upstream_tasks or []), should_log
+        )
+
+    def upstream_statuses_complete(
+        self,
+        task_statuses: Dict[str, ExecutionLogStatus],
+        should_log: bool = False,
+    ) -> bool:
+        """Determines if all of the upstream tasks of the current task are complete,
+        given the statuses of tasks on the same privacy request and action type by collection address
+        """
         tasks_complete: bool = all(
-            upstream_task.status in COMPLETED_EXECUTION_LOG_STATUSES
-            for upstream_task in upstream_tasks
-        ) and upstream_tasks.count() == len(self.upstream_tasks or [])
+            task_statuses.get(upstream_address) in COMPLETED_EXECUTION_LOG_STATUSES
+            for upstream_address in self.upstream_tasks or []
+        )
 
         if not tasks_complete and should_log:
             logger.debug(
@@ -2077,12 +2108,69 @@ class RequestTask(Base):
 
         return tasks_complete
 
+    def get_task_statuses(
+        self, db: Session, collection_addresses: Iterable[str]
+    ) -> Dict[str, ExecutionLogStatus]:
+        """Returns the statuses of tasks on the same privacy request and action type by collection address.
+
+        Only the address and status columns are selected, so the encrypted task data is not loaded.
+        """
+        collection_addresses = list(collection_addresses)
+        if not collection_addresses:
+            return {}
+
+        return dict(
+            db.query(RequestTask.collection_address, RequestTask.status).filter(
+                RequestTask.privacy_request_id == self.privacy_request_id,
+                RequestTask.action_type == self.action_type,
+                RequestTask.collection_address.in_(collection_addresses),
+            )
+        )
+
+    def get_queueable_downstream_tasks(
+        self, db: Session, should_log: bool = False
+    ) -> List["RequestTask"]:
+        """Returns the pending downstream tasks that can be queued, in bulk.
+
+        Equivalent to calling can_queue_request_task on each pending downstream task, but the upstream
+        statuses of all candidates are fetched with one query and Celery is only inspected once.
+        """
+        pending_downstream: List[RequestTask] = self.get_pending_downstream_tasks(
+            db
+        ).all()
+        upstream_statuses: Dict[str, ExecutionLogStatus] = self.get_task_statuses(
+            db,
+            {
+                upstream_address
+                for downstream_task in pending_downstream
+                for upstream_address in downstream_task.upstream_tasks or []
+            },
+        )
+        upstream_complete: List[RequestTask] = [
+            downstream_task
+            for downstream_task in pending_downstream
+            if downstream_task.upstream_statuses_complete(upstream_statuses, should_log)
+        ]
+        running_task_ids: Set[str] = RequestTask.get_running_request_task_ids(
+            upstream_complete, should_log
+        )
+        return [
+            downstream_task
+            for downstream_task in upstream_complete
+            if downstream_task.id not in running_task_ids
+        ]
+
     def upstream_tasks_objects(self, db: Session) -> Query:
-        """Returns Request Task objects that are upstream of the current Request Task"""
-        upstream_tasks: Query = db.query(RequestTask).filter(
-            RequestTask.privacy_request_id == self.privacy_request_id,
-            RequestTask.collection_address.in_(self.upstream_tasks or []),
-            RequestTask.action_type == self.action_type,
+        """Returns Request Task objects that are upstream of the current Request Task,
+        with their access data loaded to be passed into the current task"""
+        upstream_tasks: Query = (
+            db.query(RequestTask)
+            .filter(
+                RequestTask.privacy_request_id == self.privacy_request_id,
+                RequestTask.collection_address.in_(self.upstream_tasks or []),
+                RequestTask.action_type == self.action_type,
+            )
+            .options(undefer(RequestTask.access_data))
         )
         return upstream_tasks
 
@@ -2117,3 +2205,45 @@ class RequestTask(Base):
             )
 
         return task_in_flight
+
+    @staticmethod
+    def get_running_request_task_ids(
+        request_tasks: List["RequestTask"], should_log: bool = False
+    ) -> Set[str]:
+        """Returns the ids of the given Request Tasks that appear to be running in another celery task.
+
+        Batched version of request_task_running: the cached Celery Task IDs are fetched with a
+        single MGET and all of them are looked up in one Celery inspection.
+        """
+        if not request_tasks:
+            return set()
+
+        cache: FidesopsRedis = get_cache()
+        celery_task_ids: List[Optional[str]] = cache.mget(
+            [
+                get_async_task_tracking_cache_key(request_task.id)
+                for request_task in request_tasks
+            ]
+        )
+        queued: Dict[str, RequestTask] = {
+            celery_task_id: request_task
+            for request_task, celery_task_id in zip(request_tasks, celery_task_ids)
+            if celery_task_id
+        }
+        if not queued:
+            return set()
+
+        running_task_ids: Set[str] = set()
+        for celery_task_id in get_celery_tasks_in_flight(list(queued)):
+            request_task = queued.get(celery_task_id)
+            if not request_task:
+                continue
+            if should_log:
+                logger.debug(
+                    "Celery Task {} already processing for {} task {}.",
+                    celery_task_id,
+                    request_task.action_type.value,
+                    request_task.collection_address,
+                )
+            running_task_ids.add(request_task.id)
+        return running_task_ids
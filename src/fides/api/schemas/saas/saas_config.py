@@ -3,7 +3,13 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 from fideslang.models import FidesCollectionKey, FidesDatasetReference
 from fideslang.validation import FidesKey
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PositiveInt,
+    field_validator,
+    model_validator,
+)
 
 from fides.api.common_exceptions import ValidationError
 from fides.api.graph.config import (
@@ -231,6 +237,9 @@ class ReadSaaSRequest(SaaSRequest):
     """
 
     output: Optional[str] = None
+    max_concurrency: Optional[PositiveInt] = (
+        None  # Number of independent requests (e.g. one per input value) to send at once, one at a time if not set
+    )
 
     @model_validator(mode="after")
     def validate_request(self) -> "ReadSaaSRequest":
@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from functools import partial
+from typing import Callable
 
 from requests import PreparedRequest
 
@@ -14,3 +16,16 @@ class AuthenticationStrategy(Strategy):
         self, request: PreparedRequest, connection_config: ConnectionConfig
     ) -> PreparedRequest:
         """Add authentication to the request"""
+
+    def get_authenticator(
+        self, connection_config: ConnectionConfig
+    ) -> Callable[[PreparedRequest], PreparedRequest]:
+        """
+        Returns a function that adds authentication to a request without reading the given
+        connection config, so it can be called from threads other than the one using its session.
+
+        By default, requests are authenticated against a detached copy of the connection config.
+        """
+        return partial(
+            self.add_authentication, connection_config=connection_config.detached_copy()
+        )
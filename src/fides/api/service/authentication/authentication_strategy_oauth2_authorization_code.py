@@ -2,7 +2,6 @@ from typing import List, Optional
 from urllib.parse import urlencode
 from uuid import uuid4
 
-from requests import PreparedRequest
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import FidesopsException
@@ -31,12 +30,9 @@ class OAuth2AuthorizationCodeAuthenticationStrategy(OAuth2AuthenticationStrategy
         super().__init__(configuration)
         self.authorization_request = configuration.authorization_request
 
-    def add_authentication(
-        self, request: PreparedRequest, connection_config: ConnectionConfig
-    ) -> PreparedRequest:
+    def get_valid_access_token(self, connection_config: ConnectionConfig) -> str:
         """
-        Checks the expiration date on the existing access token and refreshes if necessary.
-        The existing/updated access token is then added to the request as a bearer token.
+        Checks the expiration date on the existing access token and refreshes it if necessary.
         """
 
         # make sure required secrets have been provided
@@ -54,11 +50,7 @@ class OAuth2AuthorizationCodeAuthenticationStrategy(OAuth2AuthenticationStrategy
         #
         # https://datatracker.ietf.org/doc/html/rfc6749#section-5.1
 
-        access_token = self._refresh_token(connection_config)
-
-        # add access_token to request
-        request.headers["Authorization"] = "Bearer " + access_token
-        return request
+        return self._refresh_token(connection_config)
 
     @property
     def _required_secrets(self) -> List[str]:
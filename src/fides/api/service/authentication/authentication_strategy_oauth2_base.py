@@ -1,20 +1,35 @@
+from abc import abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional
 
 from loguru import logger
+from redis.exceptions import LockError
+from requests import PreparedRequest
 from sqlalchemy.orm import Session
 
-from fides.api.common_exceptions import FidesopsException, OAuth2TokenException
+from fides.api.common_exceptions import (
+    FidesopsException,
+    OAuth2TokenException,
+    RedisConnectionError,
+)
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.schemas.saas.saas_config import ClientConfig, SaaSRequest
 from fides.api.schemas.saas.strategy_configuration import OAuth2BaseConfiguration
 from fides.api.service.authentication.authentication_strategy import (
     AuthenticationStrategy,
 )
+from fides.api.service.authentication.oauth2_token_cache import (
+    OAuth2Token,
+    oauth2_token_cache,
+)
 from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
+from fides.api.util.cache import get_cache
 from fides.api.util.logger import Pii
 from fides.api.util.saas_util import assign_placeholders, map_param_values
 
+OAUTH2_TOKEN_REFRESH_LOCK_TIMEOUT_SECONDS = 60
+
 
 class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
     """
@@ -27,6 +42,43 @@ class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
         self.token_request = configuration.token_request
         self.refresh_request = configuration.refresh_request
 
+    def add_authentication(
+        self, request: PreparedRequest, connection_config: ConnectionConfig
+    ) -> PreparedRequest:
+        """
+        Checks the expiration date on the existing access token and refreshes if necessary.
+        The existing/updated access token is then added to the request as a bearer token.
+        """
+        return self._add_bearer_token(
+            request, self.get_valid_access_token(connection_config)
+        )
+
+    def get_authenticator(
+        self, connection_config: ConnectionConfig
+    ) -> Callable[[PreparedRequest], PreparedRequest]:
+        """
+        Gets the access token up front, refreshing and persisting it on the calling thread
+        if necessary, so the returned function only adds it to each request.
+        """
+        access_token = self.get_valid_access_token(connection_config)
+
+        def authenticate(request: PreparedRequest) -> PreparedRequest:
+            return self._add_bearer_token(request, access_token)
+
+        return authenticate
+
+    @abstractmethod
+    def get_valid_access_token(self, connection_config: ConnectionConfig) -> str:
+        """Returns the connection's access token, refreshed if it is close to expiring"""
+
+    @staticmethod
+    def _add_bearer_token(
+        request: PreparedRequest, access_token: str
+    ) -> PreparedRequest:
+        """Adds the access token to the request as a bearer token"""
+        request.headers["Authorization"] = "Bearer " + access_token
+        return request
+
     @property
     def _required_secrets(self) -> List[str]:
         """A list of required secrets for the given OAuth2 strategy."""
@@ -171,16 +223,24 @@ class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
         if expires_in:
             data["expires_at"] = int(datetime.utcnow().timestamp()) + expires_in
 
-        # persist new tokens to the database
+        # persist new tokens to the database if they have changed
         # ideally we use a passed in database session but we can
         # get the session from the connection_config as a fallback
-        db = db or Session.object_session(connection_config)
+        replaced_access_token = connection_config.secrets.get("access_token")  # type: ignore
         updated_secrets = {**connection_config.secrets, **data}  # type: ignore
-        connection_config.update(db, data={"secrets": updated_secrets})
-        logger.info(
-            "Successfully updated the OAuth2 token(s) for {}", connection_config.key
-        )
+        if updated_secrets != connection_config.secrets:
+            db = db or Session.object_session(connection_config)
+            connection_config.update(db, data={"secrets": updated_secrets})
+            logger.info(
+                "Successfully updated the OAuth2 token(s) for {}", connection_config.key
+            )
 
+        oauth2_token_cache.set(
+            connection_config,
+            OAuth2Token(
+                access_token, updated_secrets.get("expires_at"), replaced_access_token
+            ),
+        )
         return access_token
 
     def get_access_token(
@@ -205,12 +265,131 @@ class OAuth2AuthenticationStrategyBase(AuthenticationStrategy):
         """
 
         if self.refresh_request:
-            expires_at = connection_config.secrets.get("expires_at")  # type: ignore
-            if self._close_to_expiration(expires_at, connection_config):
+            return self._get_unexpired_token(connection_config, self.refresh_request)
+        return connection_config.secrets.get("access_token")  # type: ignore
+
+    @staticmethod
+    def _token_from_secrets(secrets: Dict[str, Any]) -> Optional[OAuth2Token]:
+        """Returns the token stored in the secrets, or None if no access token is stored"""
+        access_token: Optional[str] = secrets.get("access_token")
+        if access_token is None:
+            return None
+        return OAuth2Token(access_token, secrets.get("expires_at"))
+
+    def _get_latest_token(
+        self, connection_config: ConnectionConfig
+    ) -> Optional[OAuth2Token]:
+        """
+        Returns the token in the connection config secrets, or the token cached
+        for the connection if it expires later.
+        """
+        token = self._token_from_secrets(connection_config.secrets or {})
+        cached_token = oauth2_token_cache.get(connection_config)
+        if cached_token and (
+            token is None or (cached_token.expires_at or 0) > (token.expires_at or 0)
+        ):
+            return cached_token
+        return token
+
+    def _get_persisted_token(
+        self, connection_config: ConnectionConfig
+    ) -> Optional[OAuth2Token]:
+        """
+        Returns the token currently stored in the database for the connection, which may
+        have been refreshed by another worker, without reloading the connection config.
+        """
+        db = Session.object_session(connection_config)
+        secrets = (
+            db.query(ConnectionConfig.secrets)
+            .filter(ConnectionConfig.id == connection_config.id)
+            .scalar()
+            if db
+            else None
+        ) or {}
+        return self._token_from_secrets(secrets)
+
+    @staticmethod
+    @contextmanager
+    def _distributed_refresh_lock(
+        connection_config: ConnectionConfig,
+    ) -> Iterator[None]:
+        """
+        Holds a lock shared by all workers to make sure only one of them refreshes the
+        connection's token at a time. The lock is skipped if Redis is not available, or
+        if another worker holds it for longer than expected.
+        """
+        try:
+            cache = get_cache()
+        except RedisConnectionError:
+            yield
+            return
+
+        lock = cache.lock(
+            f"oauth2_token_refresh__{connection_config.key}",
+            timeout=OAUTH2_TOKEN_REFRESH_LOCK_TIMEOUT_SECONDS,
+            blocking_timeout=OAUTH2_TOKEN_REFRESH_LOCK_TIMEOUT_SECONDS,
+        )
+        if not lock.acquire():
+            logger.warning(
+                "Timed out waiting for another worker to refresh the OAuth2 token for {}, continuing without the lock",
+                connection_config.key,
+            )
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            try:
+                lock.release()
+            except LockError:
+                logger.warning(
+                    "The OAuth2 token refresh lock for {} expired before it was released",
+                    connection_config.key,
+                )
+
+    def _get_unexpired_token(
+        self, connection_config: ConnectionConfig, token_request: SaaSRequest
+    ) -> str:
+        """
+        Returns the latest access token for the connection, using the given token request
+        to refresh it if it is close to expiring.
+
+        Only one thread per process and one worker at a time refreshes the token of a
+        connection. Any others wait for it and then use the token it stored.
+        """
+        # a connection without a stored access token is refreshed to get one
+        token = self._get_latest_token(connection_config)
+        if token and not self._close_to_expiration(token.expires_at, connection_config):  # type: ignore
+            return token.access_token
+
+        with oauth2_token_cache.get_refresh_lock(connection_config):
+            with self._distributed_refresh_lock(connection_config):
+                # another thread or worker may have refreshed the token while we waited
+                expires_at = connection_config.secrets.get("expires_at") or 0  # type: ignore
+                for token in (
+                    self._get_latest_token(connection_config),
+                    self._get_persisted_token(connection_config),
+                ):
+                    if token is None:
+                        continue
+                    is_newer = (token.expires_at or 0) > expires_at
+                    if is_newer and not self._close_to_expiration(
+                        token.expires_at, connection_config  # type: ignore
+                    ):
+                        oauth2_token_cache.set(
+                            connection_config,
+                            token._replace(
+                                replaced_access_token=connection_config.secrets.get(  # type: ignore
+                                    "access_token"
+                                )
+                            ),
+                        )
+                        return token.access_token
+
                 refresh_response = self._call_token_request(
-                    "refresh", self.refresh_request, connection_config
+                    "refresh", token_request, connection_config
                 )
                 return self._validate_and_store_response(
                     refresh_response, connection_config
                 )
-        return connection_config.secrets.get("access_token")  # type: ignore
@@ -1,5 +1,3 @@
-from requests import PreparedRequest
-
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.schemas.saas.strategy_configuration import OAuth2BaseConfiguration
 from fides.api.service.authentication.authentication_strategy_oauth2_base import (
@@ -16,23 +14,15 @@ class OAuth2ClientCredentialsAuthenticationStrategy(OAuth2AuthenticationStrategy
     name = "oauth2_client_credentials"
     configuration_model = OAuth2BaseConfiguration
 
-    def add_authentication(
-        self, request: PreparedRequest, connection_config: ConnectionConfig
-    ) -> PreparedRequest:
+    def get_valid_access_token(self, connection_config: ConnectionConfig) -> str:
         """
-        Checks the expiration date on the existing access token and refreshes if necessary.
-        The existing/updated access token is then added to the request as a bearer token.
+        Requests an access token if none is stored, otherwise checks the expiration date
+        on the existing access token and refreshes it if necessary.
         """
-
         access_token = connection_config.secrets.get("access_token")  # type: ignore
         if not access_token:
-            access_token = self.get_access_token(connection_config)
-        else:
-            access_token = self._refresh_token(connection_config)
-
-        # add access_token to request
-        request.headers["Authorization"] = "Bearer " + access_token
-        return request
+            return self.get_access_token(connection_config)
+        return self._refresh_token(connection_config)
 
     def _refresh_token(self, connection_config: ConnectionConfig) -> str:
         """
@@ -42,13 +32,4 @@ class OAuth2ClientCredentialsAuthenticationStrategy(OAuth2AuthenticationStrategy
         For the Client Credentials OAuth flow we reuse the access request to get a new token.
         """
 
-        expires_at = connection_config.secrets.get("expires_at")  # type: ignore
-        if self._close_to_expiration(expires_at, connection_config):
-            refresh_response = self._call_token_request(
-                "refresh", self.token_request, connection_config
-            )
-            return self._validate_and_store_response(
-                refresh_response, connection_config
-            )
-
-        return connection_config.secrets.get("access_token")  # type: ignore
+        return self._get_unexpired_token(connection_config, self.token_request)
@@ -0,0 +1,86 @@
+"""
+A process-wide cache of OAuth2 access tokens.
+
+Each ConnectionConfig loaded for a privacy request carries the tokens that were stored in its
+secrets when it was loaded. Once any of them refreshes its token, the new token is cached here
+so the other instances for the same connection use it instead of refreshing the token again.
+"""
+
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from fides.api.models.connectionconfig import ConnectionConfig
+
+TokenCacheKey = Tuple[str, Optional[str]]
+
+
+class OAuth2Token(NamedTuple):
+    """
+    An access token and the epoch timestamp it expires at, if known,
+    along with the access token it was refreshed from
+    """
+
+    access_token: str
+    expires_at: Optional[int]
+    replaced_access_token: Optional[str] = None
+
+
+class OAuth2TokenCache:
+    """Caches the most recently stored access token for each connection and client id"""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[TokenCacheKey, OAuth2Token] = {}
+        self._refresh_locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_cache_key(connection_config: ConnectionConfig) -> TokenCacheKey:
+        """Tokens are keyed by client id too, so they are dropped if the client changes"""
+        secrets = connection_config.secrets or {}
+        return connection_config.key, secrets.get("client_id")
+
+    def get(self, connection_config: ConnectionConfig) -> Optional[OAuth2Token]:
+        """
+        Returns the cached token for the connection, if there is one.
+
+        The cached token is dropped if the connection's secrets hold an access token it
+        was not refreshed from, e.g. once the connection has been authorized again.
+        """
+        access_token = (connection_config.secrets or {}).get("access_token")
+        cache_key = self.get_cache_key(connection_config)
+        with self._lock:
+            token = self._tokens.get(cache_key)
+            if token and access_token not in (
+                None,
+                token.access_token,
+                token.replaced_access_token,
+            ):
+                del self._tokens[cache_key]
+                return None
+            return token
+
+    def set(self, connection_config: ConnectionConfig, token: OAuth2Token) -> None:
+        """Caches the latest token for the connection"""
+        with self._lock:
+            self._tokens[self.get_cache_key(connection_config)] = token
+
+    def get_refresh_lock(self, connection_config: ConnectionConfig) -> Lock:
+        """
+        Returns the lock held by the thread refreshing the connection's token. The locks
+        are keyed by connection only, so there is at most one per connection.
+        """
+        with self._lock:
+            return self._refresh_locks.setdefault(connection_config.key, Lock())
+
+    def clear(self) -> None:
+        """Drops all cached tokens"""
+        with self._lock:
+            self._tokens.clear()
+
+
+oauth2_token_cache = OAuth2TokenCache()
+
+
+def clear_oauth2_token_cache() -> None:
+    """Clears the process-wide OAuth2 token cache"""
+    oauth2_token_cache.clear()
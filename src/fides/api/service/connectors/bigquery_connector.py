@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import List, Optional
 
 from loguru import logger
@@ -26,6 +28,7 @@ from fides.api.service.connectors.query_configs.bigquery_query_config import (
 from fides.api.service.connectors.query_configs.query_config import SQLQueryConfig
 from fides.api.service.connectors.sql_connector import SQLConnector
 from fides.api.util.collection_util import Row
+from fides.config import CONFIG
 
 
 class BigQueryConnector(SQLConnector):
@@ -99,18 +102,78 @@ class BigQueryConnector(SQLConnector):
         logger.info(
             f"Executing {len(partition_clauses)} partition queries for node '{query_config.node.address}' in DSR execution"
         )
-        rows = []
-        for partition_clause in partition_clauses:
-            logger.debug(
-                f"Executing partition query with partition clause '{partition_clause}'"
+        existing_bind_params = stmt.compile().params
+        partitioned_stmts = [
+            text(f"{stmt} AND ({text(partition_clause)})").params(existing_bind_params)
+            for partition_clause in partition_clauses
+        ]
+
+        # like SQLConnector.stream_rows, fetch one row past the limit to tell whether any were left out
+        max_rows = CONFIG.execution.max_rows_per_collection
+        fetch_limit = None if max_rows is None else max_rows + 1
+        max_concurrency = min(
+            CONFIG.execution.bigquery_partition_query_concurrency,
+            len(partitioned_stmts),
+        )
+        rows: List[Row] = []
+        if max_concurrency <= 1:
+            for partitioned_stmt in partitioned_stmts:
+                rows.extend(
+                    self.execute_partition_query(
+                        connection, partitioned_stmt, fetch_limit
+                    )
+                )
+                if fetch_limit is not None and len(rows) >= fetch_limit:
+                    break
+            return self.limit_partitioned_rows(query_config, rows, max_rows)
+
+        # Connections can't be shared across threads, so each partition query checks out its own
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            # each query runs in a copy of the current context to keep the log context
+            futures = [
+                executor.submit(
+                    copy_context().run,
+                    self.execute_partition_query,
+                    None,
+                    partitioned_stmt,
+                    fetch_limit,
+                )
+                for partitioned_stmt in partitioned_stmts
+            ]
+            # collect in submission order so the rows come back in the same order on every run
+            for future in futures:
+                rows.extend(future.result())
+        return self.limit_partitioned_rows(query_config, rows, max_rows)
+
+    def limit_partitioned_rows(
+        self, query_config: SQLQueryConfig, rows: List[Row], max_rows: Optional[int]
+    ) -> List[Row]:
+        """Applies CONFIG.execution.max_rows_per_collection to the rows of all partitions combined"""
+        if max_rows is None:
+            return rows
+        return self.truncate_to_max_rows(query_config.node, rows, max_rows)
+
+    def execute_partition_query(
+        self,
+        connection: Optional[Connection],
+        partitioned_stmt: TextClause,
+        max_rows: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Executes a single partition query, on a new connection from the engine's pool
+        if no connection is given. Fetches at most max_rows rows if given.
+        """
+        logger.debug(f"Executing partition query '{partitioned_stmt}'")
+        if connection is not None:
+            return self.cursor_result_to_rows(
+                connection.execute(partitioned_stmt), max_rows
             )
-            existing_bind_params = stmt.compile().params
-            partitioned_stmt = text(f"{stmt} AND ({text(partition_clause)})").params(
-                existing_bind_params
+
+        with self.client().connect() as partition_connection:
+            self.set_schema(partition_connection)
+            return self.cursor_result_to_rows(
+                partition_connection.execute(partitioned_stmt), max_rows
             )
-            results = connection.execute(partitioned_stmt)
-            rows.extend(self.cursor_result_to_rows(results))
-        return rows
 
     # Overrides SQLConnector.test_connection
     def test_connection(self) -> Optional[ConnectionTestStatus]:
@@ -1,5 +1,6 @@
 import itertools
-from typing import Any, Dict, Generator, List, Optional
+import time
+from typing import Any, Dict, Generator, List, Optional, Set
 
 from boto3 import Session
 from boto3.dynamodb.types import TypeDeserializer
@@ -18,7 +19,6 @@ from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_configs.dynamodb_query_config import (
     DynamoDBQueryConfig,
 )
-from fides.api.service.connectors.query_configs.query_config import QueryConfig
 from fides.api.util.aws_util import get_aws_session
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii
@@ -27,6 +27,12 @@ from fides.connectors.models import (
     ConnectorFailureException,
 )
 
+# The most keys BatchGetItem and items BatchWriteItem accept in a single call
+DYNAMODB_BATCH_GET_SIZE = 100
+DYNAMODB_BATCH_WRITE_SIZE = 25
+DYNAMODB_BATCH_MAX_RETRIES = 8
+DYNAMODB_BATCH_RETRY_BACKOFF_SECONDS = 0.05
+
 
 class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
     """AWS DynamoDB Connector"""
@@ -51,12 +57,13 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         except ValueError:
             raise ConnectionException("Value Error connecting to AWS DynamoDB.")
 
-    def query_config(self, node: ExecutionNode) -> QueryConfig[Any]:
+    def query_config(self, node: ExecutionNode) -> DynamoDBQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
         client = self.client()
         try:
             describe_table = client.describe_table(TableName=node.address.collection)
-            for key in describe_table["Table"]["KeySchema"]:
+            key_schema = describe_table["Table"]["KeySchema"]
+            for key in key_schema:
                 if key["KeyType"] == "HASH":
                     hash_key = key["AttributeName"]
                     break
@@ -67,7 +74,7 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         except ClientError as error:
             raise ConnectorFailureException(error.response["Error"]["Message"])
 
-        return DynamoDBQueryConfig(node, attribute_definitions)
+        return DynamoDBQueryConfig(node, attribute_definitions, key_schema)
 
     def test_connection(self) -> Optional[ConnectionTestStatus]:
         """
@@ -106,33 +113,83 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         try:
             results = []
             query_config = self.query_config(node)
-            for attribute_definition in query_config.attribute_definitions:  # type: ignore
+            for attribute_definition in query_config.attribute_definitions:
                 attribute_name = attribute_definition["AttributeName"]
-                for identifier in input_data.get(attribute_name, []):
-                    selected_input_data = input_data
-                    selected_input_data[attribute_name] = [identifier]
-                    query_param = query_config.generate_query(
-                        selected_input_data, policy
-                    )
-                    if query_param is None:
-                        return []
-                    items = client.query(
-                        TableName=collection_name,
-                        ExpressionAttributeValues=query_param[
-                            "ExpressionAttributeValues"
-                        ],
-                        KeyConditionExpression=query_param["KeyConditionExpression"],
+                identifiers = input_data.get(attribute_name, [])
+                if not query_config.has_sort_key:
+                    items = self._batch_get_items(
+                        client,
+                        collection_name,
+                        query_config.generate_batch_get_keys(
+                            attribute_name, identifiers
+                        ),
                     )
-                    for item in items.get("Items"):
-                        result = {}
-                        for key, value in item.items():
-                            deserialized_value = deserializer.deserialize(value)
-                            result[key] = deserialized_value
-                        results.append(result)
+                else:
+                    items = []
+                    for identifier in identifiers:
+                        query_param = query_config.generate_query(
+                            {**input_data, attribute_name: [identifier]}, policy
+                        )
+                        if query_param is None:
+                            return []
+                        items.extend(
+                            self._query_items(client, collection_name, query_param)
+                        )
+                for item in items:
+                    result = {}
+                    for key, value in item.items():
+                        deserialized_value = deserializer.deserialize(value)
+                        result[key] = deserialized_value
+                    results.append(result)
             return results
         except ClientError as error:
             raise ConnectorFailureException(error.response["Error"]["Message"])
 
+    @staticmethod
+    def _query_items(
+        client: Any, collection_name: str, query_param: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Runs a query, following LastEvaluatedKey until every page has been read"""
+        items: List[Dict[str, Any]] = []
+        for page in client.get_paginator("query").paginate(
+            TableName=collection_name,
+            ExpressionAttributeValues=query_param["ExpressionAttributeValues"],
+            KeyConditionExpression=query_param["KeyConditionExpression"],
+        ):
+            items.extend(page.get("Items", []))
+        return items
+
+    @staticmethod
+    def _batch_get_items(
+        client: Any, collection_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the items with the given keys using as few BatchGetItem calls as possible.
+        Items are returned in the order of their keys, and missing items are skipped.
+        """
+        items_by_key: Dict[str, Dict[str, Any]] = {}
+        key_names = list(keys[0]) if keys else []
+        for batch_start in range(0, len(keys), DYNAMODB_BATCH_GET_SIZE):
+            request_items: Dict[str, Any] = {
+                collection_name: {
+                    "Keys": keys[batch_start : batch_start + DYNAMODB_BATCH_GET_SIZE]
+                }
+            }
+            for attempt in itertools.count():
+                response = client.batch_get_item(RequestItems=request_items)
+                for item in response["Responses"].get(collection_name, []):
+                    items_by_key[_key_id(item, key_names)] = item
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+                _wait_for_retry(attempt, "BatchGetItem", collection_name)
+
+        return [
+            items_by_key[_key_id(key, key_names)]
+            for key in keys
+            if _key_id(key, key_names) in items_by_key
+        ]
+
     def mask_data(
         self,
         node: ExecutionNode,
@@ -145,27 +202,75 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
 
         query_config = self.query_config(node)
         collection_name = node.address.collection
-        update_ct = 0
+        client = self.client()
+
+        # A single BatchWriteItem call can't write the same item twice
+        batches: List[List[Dict[str, Any]]] = [[]]
+        batch_keys: Set[str] = set()
         for row in rows:
             update_items = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_items is not None:
-                client = self.client()
-                update_result = client.put_item(
-                    TableName=collection_name,
-                    Item=update_items,
-                )
-                if update_result["ResponseMetadata"]["HTTPStatusCode"] == 200:
-                    update_ct += 1
-                logger.info(
-                    "client.put_item({}, {})",
-                    collection_name,
-                    Pii(update_items),
-                )
+                key_id = _key_id(update_items, query_config.key_attribute_names)
+                if (
+                    len(batches[-1]) == DYNAMODB_BATCH_WRITE_SIZE
+                    or key_id in batch_keys
+                ):
+                    batches.append([])
+                    batch_keys = set()
+                batches[-1].append(update_items)
+                batch_keys.add(key_id)
 
+        update_ct = 0
+        for batch in batches:
+            if batch:
+                update_ct += self._batch_put_items(client, collection_name, batch)
         return update_ct
 
+    @staticmethod
+    def _batch_put_items(
+        client: Any, collection_name: str, items: List[Dict[str, Any]]
+    ) -> int:
+        """Puts the items with a BatchWriteItem call, retrying any unprocessed items"""
+        request_items: Dict[str, Any] = {
+            collection_name: [{"PutRequest": {"Item": item}} for item in items]
+        }
+        for attempt in itertools.count():
+            logger.info(
+                "client.batch_write_item({}, {})",
+                collection_name,
+                Pii(request_items[collection_name]),
+            )
+            response = client.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems") or {}
+            if not request_items:
+                break
+            _wait_for_retry(attempt, "BatchWriteItem", collection_name)
+        return len(items)
+
+
+def _key_id(item: Dict[str, Any], key_names: List[str]) -> str:
+    """Identifies a serialized item by the serialized values of its key attributes"""
+    return repr([item.get(key_name) for key_name in key_names])
+
+
+def _wait_for_retry(attempt: int, operation: str, collection_name: str) -> None:
+    """Backs off before retrying the unprocessed part of a batch operation"""
+    if attempt >= DYNAMODB_BATCH_MAX_RETRIES:
+        raise ConnectorFailureException(
+            f"{operation} on {collection_name} still had unprocessed items after "
+            f"{DYNAMODB_BATCH_MAX_RETRIES} retries"
+        )
+    sleep_time = DYNAMODB_BATCH_RETRY_BACKOFF_SECONDS * (2**attempt)
+    logger.info(
+        "Retrying unprocessed {} items on {} in {} seconds",
+        operation,
+        collection_name,
+        sleep_time,
+    )
+    time.sleep(sleep_time)
+
 
 def product_dict(**kwargs: List) -> Generator:
     """
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 import pymysql
 from google.cloud.sql.connector import Connector
@@ -46,9 +46,11 @@ class GoogleCloudSQLMySQLConnector(SQLConnector):
         return create_engine("mysql+pymysql://", creator=getconn)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """results to a list of dictionaries"""
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
 
     def build_uri(self) -> None:
         """
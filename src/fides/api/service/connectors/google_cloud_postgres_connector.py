@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 import pg8000
 from google.cloud.sql.connector import Connector
@@ -62,9 +62,11 @@ class GoogleCloudSQLPostgresConnector(SQLConnector):
         return create_engine("postgresql+pg8000://", creator=getconn)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """results to a list of dictionaries"""
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
 
     def build_uri(self) -> None:
         """
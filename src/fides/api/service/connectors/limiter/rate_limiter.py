@@ -1,8 +1,11 @@
 import time
+from collections import defaultdict
 from enum import Enum
-from typing import List
+from threading import Lock
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
+from redis.client import Script  # type: ignore
 
 from fides.api.common_exceptions import RedisConnectionError
 from fides.api.util.cache import FidesopsRedis, get_cache
@@ -47,83 +50,112 @@ class RateLimiterTimeoutException(Exception):
     """
 
 
+# Reserves one call against every rate limit in KEYS using the generic cell rate algorithm
+# (GCRA), or returns how many milliseconds to wait before the call would fit within all of
+# them. ARGV holds the rate limit and period in milliseconds of each key.
+#
+# A limit of rate_limit calls per period allows one call every period / rate_limit
+# milliseconds, with bursts of up to rate_limit calls. Each key only holds the theoretical
+# arrival time (TAT) of the next call, which is pushed back by one interval for every call.
+# A call is allowed as long as the TAT it would set is at most one period ahead of now.
+RESERVE_CALL_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+local wait = 0
+local new_tats = {}
+for index, key in ipairs(KEYS) do
+    local rate_limit = tonumber(ARGV[index * 2 - 1])
+    local period = tonumber(ARGV[index * 2])
+    local tat = math.max(tonumber(redis.call('GET', key)) or now, now)
+    new_tats[index] = tat + period / rate_limit
+    wait = math.max(wait, new_tats[index] - period - now)
+end
+if wait > 0 then
+    return math.ceil(wait)
+end
+for index, key in ipairs(KEYS) do
+    redis.call('SET', key, string.format('%.3f', new_tats[index]), 'PX', math.ceil(new_tats[index] - now))
+end
+return 0
+"""
+
+
 class RateLimiter:
     """
     A rate limiter which interacts with Redis to provide a shared state between fidesops instances
     """
 
-    EXPIRE_AFTER_PERIOD_SECONDS: int = 500
+    # registered once, the script is then loaded into Redis the first time it is called
+    _reserve_call_script: Optional[Script] = None
+
+    # total seconds spent waiting for the rate limiter in this process, by request key
+    throttled_seconds: Dict[str, float] = defaultdict(float)
+    _throttled_seconds_lock = Lock()
 
-    def build_redis_key(self, current_seconds: int, request: RateLimiterRequest) -> str:
+    def build_redis_key(self, request: RateLimiterRequest) -> str:
         """
-        Builds the key to be used for the given request for rate limiting
+        Builds the key holding the theoretical arrival time of the next call for the given request
         """
-        fixed_time_filter = (
-            int(current_seconds / request.period.factor) * request.period.factor
-        )
-        redis_key = f"{request.key}:{request.period.label}:{fixed_time_filter}"
-        return redis_key
-
-    def increment_usage(
-        self,
-        redis: FidesopsRedis,
-        current_seconds: int,
-        requests: List[RateLimiterRequest],
-    ) -> List[int]:
+        return f"rate_limiter:{request.key}:{request.period.label}:tat"
+
+    @classmethod
+    def get_reserve_call_script(cls, redis: FidesopsRedis) -> Script:
+        """Returns the script that reserves calls, registering it on first use"""
+        script = cls._reserve_call_script
+        if script is None:
+            script = redis.register_script(RESERVE_CALL_SCRIPT)
+            cls._reserve_call_script = script
+        return script
+
+    def reserve_call(
+        self, redis: FidesopsRedis, requests: List[RateLimiterRequest]
+    ) -> float:
         """
-        Increments the call count for the given requests for rate limitting.
-
-        Also sets an expire time on the redis key.
+        Atomically reserves a call against every given request if none of their rate limits
+        would be breached. Otherwise nothing is reserved and the number of seconds until the
+        call would be allowed is returned.
         """
-        pipe = redis.pipeline()
+        args: List[Any] = []
         for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.incrby(redis_key, 1)
-            pipe.expire(
-                redis_key, request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
-            )
-        response = pipe.execute()
-
-        found_bucket_usages = []
-        for index, request in enumerate(requests):
-            # alternates between incr and expire responses
-            found_bucket_usages.append(response[index * 2])
-
-        return found_bucket_usages
+            args.extend([request.rate_limit, request.period.factor * 1000])
+        script: Script = self.get_reserve_call_script(redis)
+        wait_milliseconds = script(
+            keys=[self.build_redis_key(request) for request in requests],
+            args=args,
+            client=redis,
+        )
+        return int(wait_milliseconds) / 1000
 
-    def decrement_usage(
-        self,
-        redis: FidesopsRedis,
-        current_seconds: int,
-        requests: List[RateLimiterRequest],
+    def record_throttled_time(
+        self, requests: List[RateLimiterRequest], seconds: float
     ) -> None:
-        """
-        Decrements the call count for the given requests for rate limitting.
-        """
-        pipe = redis.pipeline()
-        for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.decrby(redis_key, 1)
-        pipe.execute()
+        """Adds the time spent waiting for the rate limiter to the totals for each request key"""
+        with self._throttled_seconds_lock:
+            for key in {request.key for request in requests}:
+                self.throttled_seconds[key] += seconds
 
     def limit(
         self, requests: List[RateLimiterRequest], timeout_seconds: int = 30
     ) -> None:
         """
-        Increments call count for the current time bucket and verifies that it is within the
-        rate limit provided. If limit is breached it will decrement the count and try again
-        until it can successfully reserve a call, or timeout. Because we rely on optimistic
-        locking for many keys at a time, it is possible that concurrent rate limiters could
-        make the wrong decision in between increment to decrement operations.
+        Reserves a call within every rate limit provided, waiting until the call fits within
+        all of them, or raising a RateLimiterTimeoutException if it would not fit before the
+        timeout. Each rate limit allows a burst of up to rate_limit calls, after which calls
+        are spread evenly over its period, so the average rate never exceeds the limit.
+
+        The check and reservation are made in a single atomic script, which returns exactly
+        how long to wait when a limit is breached, so the wait is only retried if another
+        caller takes the freed-up call first.
+
+        Time spent waiting is added to RateLimiter.throttled_seconds for each request key.
 
         If connection to the redis cluster fails then rate limiter will be skipped.
 
         Expiration is set on any keys which are stored in the cluster
         """
+        if not requests:
+            return
+
         try:
             redis: FidesopsRedis = get_cache()
         except RedisConnectionError as exc:
@@ -134,33 +166,31 @@ class RateLimiter:
             )
             return
 
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            current_seconds = int(time.time())
+        start_time = time.monotonic()
+        throttled_seconds = 0.0
+        while True:
+            wait_seconds = self.reserve_call(redis=redis, requests=requests)
+            if not wait_seconds:
+                if throttled_seconds:
+                    logger.info(
+                        "Waited {} seconds for rate limits: {}",
+                        round(throttled_seconds, 3),
+                        ",".join(str(r) for r in requests),
+                    )
+                return
 
-            bucket_usages = self.increment_usage(
-                redis=redis, current_seconds=current_seconds, requests=requests
-            )
+            if time.monotonic() - start_time + wait_seconds > timeout_seconds:
+                break
 
-            breached_requests = [
-                request
-                for index, request in enumerate(requests)
-                if bucket_usages[index] > request.rate_limit
-            ]
-
-            if breached_requests:
-                logger.debug(
-                    "Breached rate limits: {}. Decrementing usage and trying again.",
-                    ",".join(str(r) for r in breached_requests),
-                )
-                self.decrement_usage(
-                    redis=redis, current_seconds=current_seconds, requests=requests
-                )
-                time.sleep(0.1)
-            else:
-                # success
-                return
+            logger.debug(
+                "Breached rate limits: {}. Waiting {} seconds.",
+                ",".join(str(r) for r in requests),
+                wait_seconds,
+            )
+            time.sleep(wait_seconds)
+            self.record_throttled_time(requests, wait_seconds)
+            throttled_seconds += wait_seconds
 
-        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in breached_requests)}"
+        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in requests)}"
         logger.error(error_message)
         raise RateLimiterTimeoutException(error_message)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.engine import LegacyCursorResult  # type: ignore
 
@@ -34,8 +34,10 @@ class MariaDBConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
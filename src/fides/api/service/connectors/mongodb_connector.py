@@ -2,7 +2,7 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus
 
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
 
 from fides.api.common_exceptions import ConnectionException
@@ -20,6 +20,7 @@ from fides.api.service.connectors.query_configs.mongodb_query_config import (
 from fides.api.service.connectors.query_configs.query_config import QueryConfig
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii
+from fides.config import CONFIG
 
 
 class MongoDBConnector(BaseConnector[MongoClient]):
@@ -112,10 +113,14 @@ class MongoDBConnector(BaseConnector[MongoClient]):
 
         db = client[db_name]
         collection = db[collection_name]
-        rows = []
+        rows: List[Row] = []
         logger.info("Starting data retrieval for {}", node.address)
-        for row in collection.find(query_data, fields):
-            rows.append(row)
+        # The cursor fetches the projected documents a batch at a time as they are consumed
+        rows.extend(
+            collection.find(
+                query_data, fields, batch_size=CONFIG.execution.mongodb_batch_size
+            )
+        )
         logger.info("Found {} rows on {}", len(rows), node.address)
         return rows
 
@@ -127,28 +132,34 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         request_task: RequestTask,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request"""
+        """Execute a masking request, sending the updates in unordered bulk writes"""
         query_config = self.query_config(node)
         collection_name = node.address.collection
-        client = self.client()
+        collection = self.client()[node.address.dataset][collection_name]
+        batch_size = CONFIG.execution.mongodb_batch_size
         update_ct = 0
+        updates: List[UpdateOne] = []
         for row in rows:
             update_stmt = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
+                updates.append(UpdateOne(query, update, upsert=False))
                 logger.info(
-                    "db.{}.update_one({}, {}, upsert=False)",
-                    collection_name,
+                    "Queued UpdateOne({}, {}, upsert=False) for db.{}.bulk_write",
                     Pii(query),
                     Pii(update),
+                    collection_name,
                 )
-
+            if len(updates) >= batch_size:
+                update_ct += collection.bulk_write(
+                    updates, ordered=False
+                ).modified_count
+                updates = []
+
+        if updates:
+            update_ct += collection.bulk_write(updates, ordered=False).modified_count
         return update_ct
 
     def close(self) -> None:
@@ -32,10 +32,37 @@ DynamoDBStatement = Dict[str, Any]
 
 class DynamoDBQueryConfig(QueryConfig[DynamoDBStatement]):
     def __init__(
-        self, node: ExecutionNode, attribute_definitions: List[Dict[str, Any]]
+        self,
+        node: ExecutionNode,
+        attribute_definitions: List[Dict[str, Any]],
+        key_schema: Optional[List[Dict[str, Any]]] = None,
     ):
         super().__init__(node)
         self.attribute_definitions = attribute_definitions
+        self.key_schema = key_schema or []
+
+    @property
+    def key_attribute_names(self) -> List[str]:
+        """The names of the attributes making up the table's primary key"""
+        return [key["AttributeName"] for key in self.key_schema]
+
+    @property
+    def has_sort_key(self) -> bool:
+        """Whether items are keyed on a sort key as well as the partition key.
+
+        Without a sort key each partition key value identifies a single item, so items
+        can be fetched by key with BatchGetItem instead of one query per value."""
+        return any(key["KeyType"] == "RANGE" for key in self.key_schema)
+
+    def generate_batch_get_keys(
+        self, attribute_name: str, values: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """Generates the distinct, serialized keys to fetch with BatchGetItem"""
+        serializer = TypeSerializer()
+        keys: Dict[Any, Dict[str, Any]] = {}
+        for value in values:
+            keys.setdefault(value, {attribute_name: serializer.serialize(value)})
+        return list(keys.values())
 
     def generate_query(
         self,
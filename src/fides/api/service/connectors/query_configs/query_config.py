@@ -38,6 +38,22 @@ from fides.api.util.querytoken import QueryToken
 T = TypeVar("T")
 
 
+class MaskingBatch:
+    """The values of one field across a set of rows, to be masked together with one strategy"""
+
+    def __init__(
+        self,
+        strategy: MaskingStrategy,
+        truncation: MaskingTruncation,
+        null_masking: bool,
+    ):
+        self.strategy = strategy
+        self.truncation = truncation
+        self.null_masking = null_masking
+        self.paths: List[str] = []
+        self.values: List[Any] = []
+
+
 class QueryConfig(Generic[T], ABC):
     """A wrapper around a resource-type dependent query object that can generate runnable queries
     and string representations."""
@@ -57,7 +73,7 @@ class QueryConfig(Generic[T], ABC):
 
     def field_map(self) -> Dict[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
-        return self.node.collection.field_dict
+        return self.node.field_index.field_dict
 
     def top_level_field_map(self) -> Dict[FieldPath, Field]:
         """Top level FieldPaths on this traversal_node."""
@@ -82,7 +98,7 @@ class QueryConfig(Generic[T], ABC):
             targeted_field_paths = []
             collection_categories: Dict[
                 str, List[FieldPath]
-            ] = self.node.collection.field_paths_by_category  # type: ignore
+            ] = self.node.field_index.field_paths_by_category  # type: ignore
             for rule_cat in rule_categories:
                 for collection_cat, field_paths in collection_categories.items():
                     if collection_cat.startswith(rule_cat):
@@ -94,11 +110,7 @@ class QueryConfig(Generic[T], ABC):
     @property
     def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
         """Mapping of FieldPaths to Fields that are marked as PK's"""
-        return {
-            field_path: field
-            for field_path, field in self.field_map().items()
-            if field.primary_key
-        }
+        return self.node.field_index.primary_keys
 
     @property
     def reference_field_paths(self) -> Dict[FieldPath, Field]:
@@ -144,7 +156,7 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
+    def update_value_map(
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Dict[str, Any]:
         """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
@@ -155,12 +167,24 @@ class QueryConfig(Generic[T], ABC):
         workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
         with null values.
 
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(  # pylint: disable=R0914
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Batch version of update_value_map, returning one map of masked values per row.
+
+        The values of every row that share a field and masking strategy are collected and masked
+        with a single call to the strategy, then scattered back into each row's map.
         """
         rule_to_collection_field_paths: Dict[Rule, List[FieldPath]] = (
             self.build_rule_target_field_paths(policy)
         )
 
-        value_map: Dict[str, Any] = {}
+        # Each row's map holds the index of its value in the masking batch until the batch is masked
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+        batches: List[MaskingBatch] = []
         for rule, field_paths in rule_to_collection_field_paths.items():
             strategy_config = rule.masking_strategy
             if not strategy_config:
@@ -194,22 +218,35 @@ class QueryConfig(Generic[T], ABC):
                     )
                     continue
 
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
+                batch = MaskingBatch(strategy, truncation, null_masking)
+                for row, value_map in zip(rows, value_maps):
                     for path in build_refined_target_paths(
                         row, query_paths={rule_field_path: None}
-                    )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
-                        request_id=request.id,
-                        strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
-                        masking_truncation=truncation,
-                        null_masking=null_masking,
-                        str_field_path=detailed_path,
-                    )
-        return value_map
+                    ):
+                        detailed_path: str = join_detailed_path(path)
+                        value_map[detailed_path] = (len(batches), len(batch.values))
+                        batch.paths.append(detailed_path)
+                        batch.values.append(pydash.objects.get(row, detailed_path))
+                batches.append(batch)
+
+        masked_batches: List[List[Any]] = [
+            self._generate_masked_values(
+                request_id=request.id,
+                strategy=batch.strategy,
+                vals=batch.values,
+                masking_truncation=batch.truncation,
+                null_masking=batch.null_masking,
+                str_field_paths=batch.paths,
+            )
+            for batch in batches
+        ]
+        return [
+            {
+                detailed_path: masked_batches[batch_index][value_index]
+                for detailed_path, (batch_index, value_index) in value_map.items()
+            }
+            for value_map in value_maps
+        ]
 
     @staticmethod
     def _supported_data_type(
@@ -229,37 +266,45 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(  # pylint: disable=R0913
         request_id: str,
         strategy: MaskingStrategy,
-        val: Any,
+        vals: List[Any],
         masking_truncation: MaskingTruncation,
         null_masking: bool,
-        str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
-
-        logger.debug(
-            "Generated the following masked val for field {}: {}",
-            str_field_path,
-            masked_val,
-        )
+        str_field_paths: List[str],
+    ) -> List[Any]:
+        """Masks all of the values with a single call to the masking strategy"""
+        if not vals:
+            return []
+
+        masked_vals: List[Any] = strategy.mask(vals, request_id)  # type: ignore
+
+        for str_field_path, masked_val in zip(str_field_paths, masked_vals):
+            logger.debug(
+                "Generated the following masked val for field {}: {}",
+                str_field_path,
+                masked_val,
+            )
 
         # special case for null masking
         if null_masking:
-            return masked_val
+            return masked_vals
 
         if masking_truncation.length:
-            logger.warning(
-                "Because a length has been specified for field {}, we will truncate length of masked value to match, regardless of masking strategy",
-                str_field_path,
-            )
+            for str_field_path in dict.fromkeys(str_field_paths):
+                logger.warning(
+                    "Because a length has been specified for field {}, we will truncate length of masked value to match, regardless of masking strategy",
+                    str_field_path,
+                )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_truncation.data_type_converter.truncate(  # type: ignore
-                masking_truncation.length, masked_val
-            )
-        return masked_val
+            masked_vals = [
+                masking_truncation.data_type_converter.truncate(  # type: ignore
+                    masking_truncation.length, masked_val
+                )
+                for masked_val in masked_vals
+            ]
+        return masked_vals
 
     @abstractmethod
     def generate_query(
@@ -446,8 +491,38 @@ class SQLLikeQueryConfig(QueryConfig[T], ABC):
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Optional[T]:
         """Returns an update statement in generic SQL-ish dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_query = self.generate_update_query_and_params(row, policy, request)
+        if update_query is None:
+            return None
+
+        query_str, param_map = update_query
+        return self.format_query_stmt(query_str, param_map)
+
+    def generate_update_query_and_params(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the raw update query string and its bind parameters for a row.
 
+        Rows whose masked fields and where clause fields line up produce identical query
+        strings, which lets connectors execute them together as a single batch.
+        """
+        return self.generate_update_queries_and_params([row], policy, request)[0]
+
+    def generate_update_queries_and_params(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+        """Batch version of generate_update_query_and_params, masking the values of all rows together"""
+        return [
+            self._update_query_and_params(row, update_value_map)
+            for row, update_value_map in zip(
+                rows, self.update_value_maps(rows, policy, request)
+            )
+        ]
+
+    def _update_query_and_params(
+        self, row: Row, update_value_map: Dict[str, Any]
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Builds the raw update query string and its bind parameters from a row's masked values"""
         non_empty_primary_key_fields: Dict[str, Field] = filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
@@ -489,7 +564,7 @@ class SQLLikeQueryConfig(QueryConfig[T], ABC):
 
         query_str = self.get_update_stmt(update_clauses, where_clauses)
         logger.info("query = {}, params = {}", Pii(query_str), Pii(param_map))
-        return self.format_query_stmt(query_str, param_map)
+        return query_str, param_map
 
 
 class SQLQueryConfig(SQLLikeQueryConfig[Executable]):
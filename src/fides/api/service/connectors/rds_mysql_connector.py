@@ -134,11 +134,13 @@ class RDSMySQLConnector(RDSConnectorMixin, SQLConnector):
         return ConnectionTestStatus.succeeded
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, max_rows)
 
     def retrieve_data(
         self,
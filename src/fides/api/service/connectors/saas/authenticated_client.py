@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 
 from loguru import logger
 from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import HTTPAdapter
 
 from fides.api.common_exceptions import (
     ClientUnsuccessfulException,
@@ -47,12 +48,20 @@ class AuthenticatedClient:
         configuration: ConnectionConfig,
         client_config: ClientConfig,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        http_adapter: Optional[HTTPAdapter] = None,
+        authenticate: Optional[Callable[[PreparedRequest], PreparedRequest]] = None,
     ):
         self.session = Session()
+        if http_adapter:
+            # share the adapter's pool of keep-alive connections with other clients
+            self.session.mount("https://", http_adapter)
+            self.session.mount("http://", http_adapter)
         self.uri = uri
         self.configuration = configuration
         self.client_config = client_config
         self.rate_limit_config = rate_limit_config
+        # adds authentication instead of the configured strategy, if provided
+        self.authenticate = authenticate
 
     def get_authenticated_request(
         self, request_params: SaaSRequestParams
@@ -75,6 +84,9 @@ class AuthenticatedClient:
             files=request_params.files,
         ).prepare()
 
+        if self.authenticate:
+            return self.authenticate(req)
+
         # add authentication if provided
         if self.client_config.authentication:
             auth_strategy = AuthenticationStrategy.get_strategy(
@@ -1,11 +1,17 @@
 # pylint: disable=too-many-lines
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from copy import deepcopy
+from functools import partial
 from json import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import pydash
 from loguru import logger
 from requests import Response
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 from starlette.status import HTTP_204_NO_CONTENT
 
@@ -38,6 +44,9 @@ from fides.api.schemas.saas.shared_schemas import (
     ConsentPropagationStatus,
     SaaSRequestParams,
 )
+from fides.api.service.authentication.authentication_strategy import (
+    AuthenticationStrategy,
+)
 from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_configs.saas_query_config import SaaSQueryConfig
 from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
@@ -67,9 +76,13 @@ from fides.api.util.saas_util import (
     assign_placeholders,
     map_param_values,
 )
+from fides.config import CONFIG
 
 
-class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
+# Besides the per-request state, the connector tracks its shared HTTP adapter and the pid it was created in
+class SaaSConnector(  # pylint: disable=too-many-instance-attributes
+    BaseConnector[AuthenticatedClient], Contextualizable
+):
     """A connector type to integrate with third-party SaaS APIs"""
 
     def get_log_context(self) -> Dict[LoggerContextKeys, Any]:
@@ -93,6 +106,8 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         self.current_privacy_request: Optional[PrivacyRequest] = None
         self.current_request_task: Optional[RequestTask] = None
         self.current_saas_request: Optional[SaaSRequest] = None
+        self.http_adapter: Optional[HTTPAdapter] = None
+        self.http_adapter_pid: Optional[int] = None
 
     def query_config(self, node: ExecutionNode) -> SaaSQueryConfig:
         """
@@ -203,9 +218,57 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
 
         logger.debug("Creating client to {}", uri)
         return AuthenticatedClient(
-            uri, self.configuration, client_config, rate_limit_config
+            uri,
+            self.configuration,
+            client_config,
+            rate_limit_config,
+            http_adapter=self.get_http_adapter(),
         )
 
+    def _get_thread_safe_client_factory(self) -> Callable[[], AuthenticatedClient]:
+        """
+        Returns a function that creates clients which can send requests from other threads.
+
+        The connection config and its session are not thread-safe, so the authentication,
+        including any token refresh, is resolved here on the calling thread and the clients
+        only read a detached copy of the connection config.
+        """
+        client_config = self.get_client_config()
+        authenticate = None
+        if client_config.authentication:
+            authenticate = AuthenticationStrategy.get_strategy(
+                client_config.authentication.strategy,
+                client_config.authentication.configuration,
+            ).get_authenticator(self.configuration)
+
+        return partial(
+            AuthenticatedClient,
+            self.build_uri(),
+            self.configuration.detached_copy(),
+            client_config,
+            self.get_rate_limit_config(),
+            http_adapter=self.get_http_adapter(),
+            authenticate=authenticate,
+        )
+
+    def get_http_adapter(self) -> HTTPAdapter:
+        """
+        Returns the HTTP adapter shared by every client this connector creates, so that
+        paginated and masking requests reuse pooled keep-alive connections instead of
+        opening a new connection per request.
+
+        An adapter created before the process was forked, e.g. by a Celery prefork parent,
+        is never reused as its pooled sockets would be shared with the other process.
+        """
+        pid = os.getpid()
+        if self.http_adapter is None or self.http_adapter_pid != pid:
+            pool_size = CONFIG.execution.saas_connection_pool_size
+            self.http_adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            self.http_adapter_pid = pid
+        return self.http_adapter
+
     @log_context(action_type=ActionType.access.value)
     def retrieve_data(
         self,
@@ -301,23 +364,13 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
                     query_config.generate_requests(input_data, policy, read_request)
                 )
 
-                # Iterates through initial list of prepared requests and through subsequent
-                # requests generated by pagination. The results are added to the output
-                # list of rows after each request.
-                for next_request, param_value_map in prepared_requests:
-                    while next_request:
-                        processed_rows, next_request = self.execute_prepared_request(  # type: ignore
-                            next_request,
-                            privacy_request.get_cached_identity_data(),
-                            read_request,
-                        )
-                        rows.extend(
-                            self._apply_output_template(
-                                [param_value_map],
-                                read_request.output,
-                                processed_rows,
-                            )
-                        )
+                rows.extend(
+                    self._execute_read_requests(
+                        prepared_requests,
+                        privacy_request.get_cached_identity_data(),
+                        read_request,
+                    )
+                )
 
             # This allows us to build an output object even if we didn't generate and execute
             # any HTTP requests. This is useful if we just want to select specific input_data
@@ -341,6 +394,132 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
 
         return rows
 
+    def _execute_read_requests(
+        self,
+        prepared_requests: List[Tuple[SaaSRequestParams, Dict[str, Any]]],
+        identity_data: Dict[str, Any],
+        read_request: ReadSaaSRequest,
+    ) -> List[Row]:
+        """
+        Executes each prepared request along with the requests for its subsequent pages,
+        returning the rows in the order of the prepared requests.
+
+        Up to read_request.max_concurrency prepared requests are sent at once. The pages
+        of a single prepared request are always fetched one after the other, and every
+        request still goes through the rate limiter before it is sent. Only the requests
+        are sent from the worker threads, the responses are postprocessed on this thread.
+        """
+        max_concurrency = min(read_request.max_concurrency or 1, len(prepared_requests))
+        if max_concurrency <= 1:
+            results = [
+                self._execute_paginated_request(
+                    prepared_request, param_value_map, identity_data, read_request
+                )
+                for prepared_request, param_value_map in prepared_requests
+            ]
+        else:
+            create_client = self._get_thread_safe_client_factory()
+            secrets = deepcopy(self.secrets)
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                # each request runs in a copy of the current context to keep the log context
+                futures = [
+                    executor.submit(
+                        copy_context().run,
+                        self._fetch_pages,
+                        create_client(),
+                        prepared_request,
+                        read_request,
+                        secrets,
+                    )
+                    for prepared_request, _ in prepared_requests
+                ]
+                pages = [future.result() for future in futures]
+
+            results = [
+                [
+                    row
+                    for response_data in response_pages
+                    for row in self._process_page(
+                        response_data, param_value_map, identity_data, read_request
+                    )
+                ]
+                for response_pages, (_, param_value_map) in zip(
+                    pages, prepared_requests
+                )
+            ]
+
+        return [row for result in results for row in result]
+
+    def _fetch_pages(
+        self,
+        client: AuthenticatedClient,
+        prepared_request: SaaSRequestParams,
+        read_request: ReadSaaSRequest,
+        secrets: Dict[str, Any],
+    ) -> List[Any]:
+        """
+        Sends the prepared request and the requests for its subsequent pages using only
+        the given client and secrets, returning the unprocessed response data of each page.
+        """
+        pages: List[Any] = []
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            response_data, next_request = self._send_prepared_request(
+                client, next_request, read_request, secrets
+            )
+            pages.append(response_data)
+        return pages
+
+    def _process_page(
+        self,
+        response_data: Any,
+        param_value_map: Dict[str, Any],
+        identity_data: Dict[str, Any],
+        read_request: ReadSaaSRequest,
+    ) -> List[Row]:
+        """Postprocesses the response data of a page and applies the output template to it"""
+        processed_rows = self.process_response_data(
+            response_data,
+            identity_data,
+            cast(Optional[List[PostProcessorStrategy]], read_request.postprocessors),
+        )
+        logger.info(
+            "{} row(s) returned after postprocessing '{}' collection.",
+            len(processed_rows),
+            self.current_collection_name,
+        )
+        return self._apply_output_template(
+            [param_value_map], read_request.output, processed_rows
+        )
+
+    def _execute_paginated_request(
+        self,
+        prepared_request: SaaSRequestParams,
+        param_value_map: Dict[str, Any],
+        identity_data: Dict[str, Any],
+        read_request: ReadSaaSRequest,
+    ) -> List[Row]:
+        """
+        Iterates through the prepared request and through subsequent requests generated by
+        pagination. The results are added to the output list of rows after each request.
+        """
+        rows: List[Row] = []
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            processed_rows, next_request = self.execute_prepared_request(
+                next_request,
+                identity_data,
+                read_request,
+            )
+            rows.extend(
+                self._apply_output_template(
+                    [param_value_map],
+                    read_request.output,
+                    processed_rows,
+                )
+            )
+        return rows
+
     def _apply_output_template(
         self,
         param_value_maps: List[Dict[str, Any]],
@@ -414,9 +593,9 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         """
 
         client: AuthenticatedClient = self.create_client()
-        response: Response = client.send(prepared_request, saas_request.ignore_errors)
-        response = self._handle_errored_response(saas_request, response)
-        response_data = self._unwrap_response_data(saas_request, response)
+        response_data, next_request = self._send_prepared_request(
+            client, prepared_request, saas_request, self.secrets
+        )
 
         # process response and add to rows
         rows = self.process_response_data(
@@ -431,6 +610,23 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
             self.current_collection_name,
         )
 
+        return rows, next_request
+
+    def _send_prepared_request(
+        self,
+        client: AuthenticatedClient,
+        prepared_request: SaaSRequestParams,
+        saas_request: SaaSRequest,
+        secrets: Dict[str, Any],
+    ) -> Tuple[Any, Optional[SaaSRequestParams]]:
+        """
+        Sends the prepared request with the given client. Returns the unwrapped response data
+        and the request_params for the next page of data if available.
+        """
+        response: Response = client.send(prepared_request, saas_request.ignore_errors)
+        response = self._handle_errored_response(saas_request, response)
+        response_data = self._unwrap_response_data(saas_request, response)
+
         # use the pagination strategy (if available) to get the next request
         next_request = None
         if saas_request.pagination:
@@ -439,7 +635,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
                 saas_request.pagination.configuration,
             )
             next_request = strategy.get_next_request(
-                prepared_request, self.secrets, response, saas_request.data_path
+                prepared_request, secrets, response, saas_request.data_path
             )
 
         if next_request:
@@ -449,7 +645,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
                 self.current_collection_name,
             )
 
-        return rows, next_request
+        return response_data, next_request
 
     def process_response_data(
         self,
@@ -842,7 +1038,11 @@ class SaaSConnector(BaseConnector[AuthenticatedClient], Contextualizable):
         return True
 
     def close(self) -> None:
-        """Not required for this type"""
+        """Close the pooled HTTP connections held by this connector"""
+        if self.http_adapter and self.http_adapter_pid == os.getpid():
+            self.http_adapter.close()
+        self.http_adapter = None
+        self.http_adapter_pid = None
 
     @staticmethod
     def _handle_errored_response(
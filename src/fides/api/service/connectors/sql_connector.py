@@ -1,12 +1,13 @@
 import io
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import paramiko
 import sshtunnel  # type: ignore
 from aiohttp.client_exceptions import ClientResponseError
 from loguru import logger
-from sqlalchemy import Column, select
+from sqlalchemy import Column, select, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import (  # type: ignore
     Connection,
@@ -59,25 +60,31 @@ class SQLConnector(BaseConnector[Engine]):
         self.ssh_server: sshtunnel._ForwardServer = None
 
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
+    def cursor_result_to_rows(
+        results: CursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Convert SQLAlchemy results to a list of dictionaries, fetching at most max_rows rows if given
+        """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, max_rows):
             rows.append(
                 {col.name: row_tuple[count] for count, col in enumerate(columns)}
             )
         return rows
 
     @staticmethod
-    def default_cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def default_cursor_result_to_rows(
+        results: LegacyCursorResult, max_rows: Optional[int] = None
+    ) -> List[Row]:
         """
-        Convert SQLAlchemy results to a list of dictionaries
+        Convert SQLAlchemy results to a list of dictionaries, fetching at most max_rows rows if given
         Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MariaDB
         """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, max_rows):
             rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
         return rows
 
@@ -168,9 +175,47 @@ class SQLConnector(BaseConnector[Engine]):
             ):  # only BigQuery supports partitioning, for now
                 return self.partitioned_retrieval(query_config, connection, stmt)
 
-            results = connection.execute(stmt)
+            return self.stream_rows(node, connection, stmt)
+
+    def stream_rows(
+        self, node: ExecutionNode, connection: Connection, stmt: TextClause
+    ) -> List[Row]:
+        """
+        Executes the access query on a server-side cursor where the dialect supports one, so rows are
+        fetched from the database in batches as they're converted instead of all at once.
+
+        Stops fetching once CONFIG.execution.max_rows_per_collection rows have been converted.
+        """
+        batch_size = CONFIG.execution.sql_stream_batch_size
+        if batch_size > 0:
+            connection = connection.execution_options(
+                stream_results=True, max_row_buffer=batch_size
+            )
+        results = connection.execute(stmt)
+
+        max_rows = CONFIG.execution.max_rows_per_collection
+        if max_rows is None:
             return self.cursor_result_to_rows(results)
 
+        # fetch one row past the limit to tell whether any rows were left out
+        rows = self.cursor_result_to_rows(results, max_rows + 1)
+        results.close()
+        return self.truncate_to_max_rows(node, rows, max_rows)
+
+    @staticmethod
+    def truncate_to_max_rows(
+        node: ExecutionNode, rows: List[Row], max_rows: int
+    ) -> List[Row]:
+        """Drops the rows past max_rows, logging a warning if any were dropped"""
+        if len(rows) > max_rows:
+            logger.warning(
+                "Retrieved the maximum of {} rows from {}, remaining rows were not retrieved",
+                max_rows,
+                node.address,
+            )
+            del rows[max_rows:]
+        return rows
+
     def mask_data(
         self,
         node: ExecutionNode,
@@ -179,19 +224,56 @@ class SQLConnector(BaseConnector[Engine]):
         request_task: RequestTask,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        Rows that generate the same update statement are grouped together and executed
+        as a single batch. All updates for the node run on one connection, inside one transaction.
+        """
         query_config = self.query_config(node)
+        batched_updates: Dict[str, List[Dict[str, Any]]] = {}
+        update_queries: List[Optional[Tuple[str, Dict[str, Any]]]] = (
+            query_config.generate_update_queries_and_params(
+                rows, policy, privacy_request
+            )
+        )
+        for update_query in update_queries:
+            if update_query is not None:
+                query_str, param_map = update_query
+                batched_updates.setdefault(query_str, []).append(param_map)
+
+        if not batched_updates:
+            return 0
+
         update_ct = 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        with client.connect() as connection:
+            with connection.begin():
+                self.set_schema(connection)
+                for query_str, param_maps in batched_updates.items():
+                    update_ct += self.execute_batched_update(
+                        connection, query_str, param_maps
+                    )
+        return update_ct
+
+    @staticmethod
+    def execute_batched_update(
+        connection: Connection, query_str: str, param_maps: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Executes the same update statement for each set of parameters and returns the number of rows updated.
+
+        Uses a single executemany call when the dialect reports accurate row counts for
+        multi-row executions, otherwise falls back to one execution per set of parameters.
+        """
+        update_stmt: TextClause = text(query_str)
+        if len(param_maps) > 1 and connection.dialect.supports_sane_multi_rowcount:
+            results: LegacyCursorResult = connection.execute(update_stmt, param_maps)
+            return results.rowcount
+
+        update_ct = 0
+        for param_map in param_maps:
+            results = connection.execute(update_stmt, param_map)
+            update_ct = update_ct + results.rowcount
         return update_ct
 
     def close(self) -> None:
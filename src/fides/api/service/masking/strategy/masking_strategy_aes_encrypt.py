@@ -48,6 +48,11 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                 SecretType.key_hmac,
                 masking_meta[SecretType.key_hmac],
             )
+            salt_hmac: str | None = SecretsUtil.get_or_generate_secret(
+                request_id,
+                SecretType.salt_hmac,
+                masking_meta[SecretType.salt_hmac],
+            )
 
             # The nonce is generated deterministically such that the same input val will result in same nonce
             # and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
@@ -60,7 +65,7 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
                     continue
 
                 nonce: bytes | None = self._generate_nonce(
-                    str(value), key_hmac, request_id, masking_meta  # type: ignore
+                    str(value), key_hmac, salt_hmac  # type: ignore
                 )
                 masked: str = encrypt(str(value), key, nonce)  # type: ignore
                 if self.format_preservation is not None:
@@ -106,15 +111,7 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         return data_type in supported_data_types
 
     @staticmethod
-    def _generate_nonce(
-        value: str,
-        key: str,
-        privacy_request_id: Optional[str],
-        masking_meta: Dict[SecretType, MaskingSecretMeta],
-    ) -> bytes:
-        salt = SecretsUtil.get_or_generate_secret(
-            privacy_request_id, SecretType.salt_hmac, masking_meta[SecretType.salt_hmac]
-        )
+    def _generate_nonce(value: str, key: str, salt: str) -> bytes:
         # Trim to 12 bytes, which is recommended length from aes gcm lib:
         # https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
         return hmac_encrypt_return_bytes(
@@ -25,10 +25,7 @@ class NullMaskingStrategy(MaskingStrategy):
         """Replaces the value with a null value"""
         if values is None:
             return None
-        masked_values: List[None] = []
-        for _ in range(len(values)):
-            masked_values.append(None)
-        return masked_values
+        return [None] * len(values)
 
     def secrets_required(self) -> bool:
         return False
@@ -31,14 +31,12 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
         None"""
         if values is None:
             return None
-        masked_values: List[str] = []
-        for _ in range(len(values)):
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                masked_values.append(formatter.format(self.rewrite_value))
-            else:
-                masked_values.append(self.rewrite_value)
-        return masked_values
+        # Every value is rewritten to the same string
+        masked_value: str = self.rewrite_value
+        if self.format_preservation is not None:
+            formatter = FormatPreservation(self.format_preservation)
+            masked_value = formatter.format(self.rewrite_value)
+        return [masked_value] * len(values)
 
     def secrets_required(self) -> bool:
         return False
@@ -20,6 +20,7 @@ from fides.api.common_exceptions import (
 from fides.api.db.session import get_db_session
 from fides.api.graph.config import CollectionAddress
 from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.graph_cache import get_dataset_graph
 from fides.api.models.audit_log import AuditLog, AuditLogAction
 from fides.api.models.connectionconfig import AccessLevel, ConnectionConfig
 from fides.api.models.datasetconfig import DatasetConfig
@@ -355,13 +356,7 @@ def run_privacy_request(
                 )
 
             try:
-                datasets = DatasetConfig.all(db=session)
-                dataset_graphs = [
-                    dataset_config.get_graph()
-                    for dataset_config in datasets
-                    if not dataset_config.connection_config.disabled
-                ]
-                dataset_graph = DatasetGraph(*dataset_graphs)
+                dataset_graph: DatasetGraph = get_dataset_graph(session)
 
                 # Add success log for dataset configuration
                 privacy_request.add_success_execution_log(
@@ -470,7 +465,9 @@ def run_privacy_request(
                     consent_runner(
                         privacy_request=privacy_request,
                         policy=policy,
-                        graph=build_consent_dataset_graph(datasets),
+                        graph=build_consent_dataset_graph(
+                            DatasetConfig.all(db=session)
+                        ),
                         connection_configs=connection_configs,
                         identity=identity_data,
                         session=session,
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import json
+import time
 from asyncio import sleep
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
 
 from httpx import AsyncClient
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import and_, func, text
+from sqlalchemy.orm import Session
 from sqlalchemy.sql.elements import TextClause
 
 from fides.api.common_exceptions import PrivacyRequestNotFound
@@ -15,8 +17,11 @@ from fides.api.models.policy import Policy
 from fides.api.models.privacy_request import (
     EXITED_EXECUTION_LOG_STATUSES,
     PrivacyRequest,
-    RequestTask,
 )
+from fides.api.models.privacy_request import (
+    PrivacyRequestError as PrivacyRequestErrorModel,
+)
+from fides.api.models.privacy_request import RequestTask
 from fides.api.schemas.drp_privacy_request import DrpPrivacyRequestCreate
 from fides.api.schemas.masking.masking_secrets import MaskingSecretCache
 from fides.api.schemas.policy import ActionType
@@ -203,65 +208,61 @@ def poll_for_exited_privacy_request_tasks(self: DatabaseTask) -> Set[str]:
         # Privacy Requests that didn't need approval are "In Processing".
         # Privacy Requests in these states should be examined to see if all of its Request Tasks have had a chance
         # to complete.
-        in_progress_privacy_requests = (
-            db.query(PrivacyRequest)
+        in_progress_statuses = [
+            PrivacyRequestStatus.in_processing,
+            PrivacyRequestStatus.approved,
+        ]
+
+        # A single grouped query over the Request Tasks of every in-progress Privacy Request returns
+        # the action types whose tasks have all exited, with at least one of them errored.
+        # Request Tasks of different action types are considered separately: consent propagation
+        # tasks are not created until the access and erasure steps are complete, and erasure tasks
+        # are created with the access tasks but only run once those have finished.
+        errored_steps = (
+            db.query(RequestTask.privacy_request_id, RequestTask.action_type)
+            .join(PrivacyRequest, PrivacyRequest.id == RequestTask.privacy_request_id)
             .filter(
-                PrivacyRequest.status.in_(
-                    [PrivacyRequestStatus.in_processing, PrivacyRequestStatus.approved]
+                PrivacyRequest.status.in_(in_progress_statuses),
+                # Only look at Privacy Requests that haven't been deleted
+                PrivacyRequest.deleted_at.is_(None),
+            )
+            .group_by(RequestTask.privacy_request_id, RequestTask.action_type)
+            .having(
+                and_(
+                    func.bool_and(
+                        RequestTask.status.in_(EXITED_EXECUTION_LOG_STATUSES)
+                    ),
+                    func.bool_or(RequestTask.status == ExecutionLogStatus.error),
                 )
             )
-            # Only look at Privacy Requests that haven't been deleted
-            .filter(PrivacyRequest.deleted_at.is_(None))
-            .order_by(PrivacyRequest.created_at)
+            .all()
         )
 
-        # TODO: With this approach, we're making 3*n queries , where n is the number of in-progress privacy requests.
-        # We could optimize this to just get all the RequestTasks for all in-progress privacy requests in one single
-        # query and then process them in-memory. This could be more efficient.
-        def privacy_request_has_errored_tasks(
-            privacy_request: PrivacyRequest, task_type: ActionType
-        ) -> bool:
-            """Check if a privacy request has exited all its tasks of the given type,
-            and at least one of the tasks has errored.
-            We specifically only query for the RequestTask.status column to avoid
-            querying for the entire RequestTask row.
-            """
-            tasks_statuses_query = db.query(RequestTask.status).filter(
-                RequestTask.privacy_request_id == privacy_request.id,
-                RequestTask.action_type == task_type,
+        marked_as_errored: Set[str] = set()
+        for privacy_request_id, action_type in errored_steps:
+            logger.info(
+                f"Marking {action_type.value} step of {privacy_request_id} as error"
             )
-
-            statuses = set(status for status, in tasks_statuses_query.all())
-            all_exited = all(
-                status in EXITED_EXECUTION_LOG_STATUSES for status in statuses
+            marked_as_errored.add(privacy_request_id)
+
+        if marked_as_errored:
+            db.query(PrivacyRequest).filter(
+                PrivacyRequest.id.in_(marked_as_errored)
+            ).update(
+                {
+                    PrivacyRequest.status: PrivacyRequestStatus.error,
+                    PrivacyRequest.finished_processing_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
             )
-            if all_exited and ExecutionLogStatus.error in statuses:
-                logger.info(
-                    f"Marking {task_type.value} step of {privacy_request.id} as error"
-                )
-                return True
-
-            return False
-
-        marked_as_errored: Set[str] = set()
-        for pr in in_progress_privacy_requests.all():
-            if pr.consent_tasks.count():
-                # Consent propagation tasks - these are not created until access and erasure steps are complete.
-                if privacy_request_has_errored_tasks(pr, ActionType.consent):
-                    pr.error_processing(db)
-                    marked_as_errored.add(pr.id)
-
-            if pr.erasure_tasks.count():
-                # Erasure tasks are created at the same time as access tasks but if any are errored, this means
-                # we made it to the erasure section
-                if privacy_request_has_errored_tasks(pr, ActionType.erasure):
-                    pr.error_processing(db)
-                    marked_as_errored.add(pr.id)
-
-            if pr.access_tasks.count():
-                if privacy_request_has_errored_tasks(pr, ActionType.access):
-                    pr.error_processing(db)
-                    marked_as_errored.add(pr.id)
+            db.bulk_insert_mappings(
+                PrivacyRequestErrorModel,
+                [
+                    {"message_sent": False, "privacy_request_id": privacy_request_id}
+                    for privacy_request_id in marked_as_errored
+                ],
+            )
+            db.commit()
 
         return marked_as_errored
 
@@ -291,61 +292,151 @@ def initiate_scheduled_dsr_data_removal() -> None:
     )
 
 
+# Each batch statement selects the next batch_size matching rows after :last_id in primary key
+# order and removes their data. It returns how many rows it selected and removed, along with the
+# largest id it selected. That id is computed by the database, so the next batch compares against
+# it under the same collation the rows are ordered by.
+REMOVE_EXPIRED_REQUEST_TASKS: TextClause = text(
+    """
+    WITH batch AS (
+        SELECT requesttask.id
+        FROM requesttask
+        JOIN privacyrequest ON requesttask.privacy_request_id = privacyrequest.id
+        WHERE requesttask.created_at < :ttl
+        AND privacyrequest.status = 'complete'
+        AND requesttask.id > :last_id
+        ORDER BY requesttask.id
+        LIMIT :batch_size
+    ), removed AS (
+        DELETE FROM requesttask
+        USING batch
+        WHERE requesttask.id = batch.id
+        RETURNING requesttask.id
+    )
+    SELECT
+        (SELECT count(*) FROM batch) AS selected_count,
+        (SELECT count(*) FROM removed) AS removed_count,
+        (SELECT max(id) FROM batch) AS last_id;
+    """
+)
+
+REMOVE_EXPIRED_PRIVACY_REQUEST_DATA: TextClause = text(
+    """
+    WITH batch AS (
+        SELECT privacyrequest.id
+        FROM privacyrequest
+        WHERE privacyrequest.updated_at < :ttl
+        AND privacyrequest.status = 'complete'
+        AND (
+            privacyrequest.filtered_final_upload IS NOT NULL
+            OR privacyrequest.access_result_urls IS NOT NULL
+        )
+        AND privacyrequest.id > :last_id
+        ORDER BY privacyrequest.id
+        LIMIT :batch_size
+    ), removed AS (
+        UPDATE privacyrequest
+        SET filtered_final_upload = null, access_result_urls = null
+        FROM batch
+        WHERE privacyrequest.id = batch.id
+        RETURNING privacyrequest.id
+    )
+    SELECT
+        (SELECT count(*) FROM batch) AS selected_count,
+        (SELECT count(*) FROM removed) AS removed_count,
+        (SELECT max(id) FROM batch) AS last_id;
+    """
+)
+
+
+def remove_in_batches(
+    db: Session,
+    statement: TextClause,
+    params: Dict[str, Any],
+    description: str,
+    batch_size: Optional[int] = None,
+    sleep_seconds: Optional[float] = None,
+) -> int:
+    """
+    Runs a batch removal statement until it selects no more rows, and returns the number of rows removed.
+
+    The statement is passed :last_id and :batch_size along with the given params, and must return the
+    number of rows it selected and removed and the largest id it selected, which becomes the next
+    :last_id. Each batch is committed on its own so locks are held briefly and an interrupted removal
+    keeps the batches it completed; the next run picks up the rows that still match.
+    """
+    batch_size = batch_size or CONFIG.execution.dsr_data_removal_batch_size
+    if sleep_seconds is None:
+        sleep_seconds = CONFIG.execution.dsr_data_removal_batch_sleep_seconds
+
+    removed_count = 0
+    last_id = ""
+    start = time.perf_counter()
+    while True:
+        selected_count, batch_removed_count, last_id = db.execute(
+            statement, {**params, "last_id": last_id, "batch_size": batch_size}
+        ).one()
+        db.commit()
+        if not selected_count:
+            break
+
+        removed_count += batch_removed_count
+        elapsed = time.perf_counter() - start
+        logger.debug(
+            f"DSR Data Removal Task removed {removed_count} {description} so far "
+            f"({removed_count / elapsed:.0f} rows/s)."
+        )
+        if selected_count < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"DSR Data Removal Task removed {removed_count} {description} in {elapsed:.2f}s."
+    )
+    return removed_count
+
+
 @celery_app.task(base=DatabaseTask, bind=True)
 def remove_saved_dsr_data(self: DatabaseTask) -> None:
     """
     Remove saved customer data that is no longer needed to facilitate running the access or erasure request.
+
+    Rows are removed in batches, see remove_in_batches.
     """
     with self.get_new_session() as db:
         logger.info("Running DSR Data Removal Task to cleanup obsolete user data")
 
         # Remove old request tasks which potentially contain encrypted PII
-        remove_dsr_data: TextClause = text(
-            """
-            DELETE FROM requesttask
-            USING privacyrequest
-            WHERE requesttask.privacy_request_id = privacyrequest.id
-            AND requesttask.created_at < :ttl
-            AND privacyrequest.status = 'complete';
-            """
-        )
-
-        result = db.execute(
-            remove_dsr_data,
+        affected_rows = remove_in_batches(
+            db,
+            REMOVE_EXPIRED_REQUEST_TASKS,
             {
                 "ttl": (
                     datetime.now()
                     - timedelta(seconds=CONFIG.execution.request_task_ttl)
                 ),
             },
+            "expired request tasks",
         )
-        affected_rows = result.rowcount
         logger.info(
             f"Deleted {affected_rows} expired request tasks via DSR Data Removal Task."
         )
 
         # Remove columns from old privacyrequests that potentially contain encrypted PII
         # or URL's that contain encrypted PII.
-        remove_data_from_privacy_request: TextClause = text(
-            """
-            UPDATE privacyrequest
-            SET filtered_final_upload = null, access_result_urls = null
-            WHERE privacyrequest.updated_at < :ttl
-            AND privacyrequest.status = 'complete';
-            """
-        )
-
-        db.execute(
-            remove_data_from_privacy_request,
+        remove_in_batches(
+            db,
+            REMOVE_EXPIRED_PRIVACY_REQUEST_DATA,
             {
                 "ttl": (  # Using Redis Default TTL Seconds by default
                     datetime.now() - timedelta(seconds=CONFIG.redis.default_ttl_seconds)
                 ),
             },
+            "expired privacy request results",
         )
 
-        db.commit()
-
 
 def initiate_interrupted_task_requeue_poll() -> None:
     """Initiates scheduler to check for and requeue interrupted tasks"""
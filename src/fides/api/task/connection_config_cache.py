@@ -0,0 +1,110 @@
+"""
+A worker-local cache of decrypted ConnectionConfigs.
+
+Loading a ConnectionConfig decrypts its secrets, and a DSR 3.0 worker can run many nodes on the
+same connector in quick succession. Each cached entry is only reused while the ConnectionConfig's
+updated_at timestamp still matches the database, and only for a short time after it was loaded.
+"""
+
+from copy import deepcopy
+from datetime import datetime
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from fides.api.models.connectionconfig import ConnectionConfig
+
+CONNECTION_CONFIG_CACHE_TTL_SECONDS = 60
+
+
+class CachedConnectionConfig(NamedTuple):
+    """The column values of a ConnectionConfig as of its updated_at timestamp"""
+
+    updated_at: datetime
+    expires_at: float
+    values: Dict[str, Any]
+
+
+class ConnectionConfigCache:
+    """Caches the decrypted column values of recently loaded ConnectionConfigs by key"""
+
+    def __init__(self, ttl_seconds: float = CONNECTION_CONFIG_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, CachedConnectionConfig] = {}
+        self._lock = Lock()
+
+    def get(self, db: Session, key: str) -> Optional[ConnectionConfig]:
+        """
+        Returns the ConnectionConfig with the given key, attached to the given session.
+
+        Only the updated_at timestamp is queried if the ConnectionConfig is cached, so the
+        secrets are not decrypted again.
+        """
+        updated_at: Optional[datetime] = (
+            db.query(ConnectionConfig.updated_at)
+            .filter(ConnectionConfig.key == key)
+            .scalar()
+        )
+        if updated_at is None:
+            self.clear(key)
+            return None
+
+        with self._lock:
+            cached: Optional[CachedConnectionConfig] = self._entries.get(key)
+        if (
+            cached
+            and cached.updated_at == updated_at
+            and cached.expires_at > monotonic()
+        ):
+            cached_connection_config = ConnectionConfig(**deepcopy(cached.values))
+            make_transient_to_detached(cached_connection_config)
+            return db.merge(cached_connection_config, load=False)
+
+        connection_config: Optional[ConnectionConfig] = ConnectionConfig.get_by(
+            db, field="key", value=key
+        )
+        if connection_config is None:
+            self.clear(key)
+            return None
+
+        # a ConnectionConfig without an updated_at timestamp can't be checked for changes,
+        # so it is not cached
+        if connection_config.updated_at is None:
+            self.clear(key)
+            return connection_config
+
+        values: Dict[str, Any] = {
+            column.key: deepcopy(getattr(connection_config, column.key))
+            for column in inspect(ConnectionConfig).column_attrs
+        }
+        with self._lock:
+            self._entries[key] = CachedConnectionConfig(
+                updated_at=connection_config.updated_at,
+                expires_at=monotonic() + self.ttl_seconds,
+                values=values,
+            )
+        return connection_config
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Drops the cached ConnectionConfig with the given key, or all of them"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+_connection_config_cache = ConnectionConfigCache()
+
+
+def get_connection_config(db: Session, key: str) -> Optional[ConnectionConfig]:
+    """Returns a ConnectionConfig by key from the worker-local cache, see ConnectionConfigCache.get"""
+    return _connection_config_cache.get(db, key)
+
+
+def clear_connection_config_cache() -> None:
+    """Clears the worker-local ConnectionConfig cache"""
+    _connection_config_cache.clear()
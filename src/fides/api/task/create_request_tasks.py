@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Set
 import networkx
 from loguru import logger
 from networkx import NetworkXNoCycle
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, undefer
 
 from fides.api.common_exceptions import TraversalError
 from fides.api.graph.config import (
@@ -325,19 +325,15 @@ def persist_initial_erasure_request_tasks(
 
 
 def _get_data_for_erasures(
-    session: Session, privacy_request: PrivacyRequest, request_task: RequestTask
+    access_tasks_by_address: Dict[str, RequestTask], request_task: RequestTask
 ) -> List[Dict]:
     """
     Return the access data in erasure format needed to format the masking request for the current node.
     """
     # Get the access task of the same name as the erasure task so we can transfer the data
     # collected for masking onto the current erasure task
-    corresponding_access_task: Optional[RequestTask] = (
-        privacy_request.get_existing_request_task(
-            db=session,
-            action_type=ActionType.access,
-            collection_address=request_task.request_task_address,
-        )
+    corresponding_access_task: Optional[RequestTask] = access_tasks_by_address.get(
+        request_task.collection_address
     )
     retrieved_task_data: List[Dict] = []
     if (
@@ -364,11 +360,19 @@ def update_erasure_tasks_with_access_data(
         privacy_request.id,
     )
 
+    # Load the deferred erasure data of every access task in one query
+    access_tasks_by_address: Dict[str, RequestTask] = {
+        access_task.collection_address: access_task
+        for access_task in privacy_request.access_tasks.options(
+            undefer(RequestTask.data_for_erasures)
+        )
+    }
+
     for request_task in privacy_request.erasure_tasks:
         # I pull access data saved in the format suitable for erasures
         # off of the access nodes to be saved onto the erasure nodes.
         retrieved_task_data = _get_data_for_erasures(
-            session, privacy_request, request_task
+            access_tasks_by_address, request_task
         )
         request_task.data_for_erasures = retrieved_task_data
         request_task.save(session)
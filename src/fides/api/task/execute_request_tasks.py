@@ -24,6 +24,7 @@ from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.models.privacy_request import ExecutionLog, PrivacyRequest, RequestTask
 from fides.api.schemas.policy import ActionType, CurrentStep
 from fides.api.schemas.privacy_request import ExecutionLogStatus, PrivacyRequestStatus
+from fides.api.task.connection_config_cache import get_connection_config
 from fides.api.task.graph_task import (
     GraphTask,
     mark_current_and_downstream_nodes_as_failed,
@@ -98,6 +99,23 @@ def run_prerequisite_task_checks(
     return privacy_request, request_task, upstream_results
 
 
+def get_connection_configs_for_task(
+    session: Session, request_task: RequestTask
+) -> List[ConnectionConfig]:
+    """Returns the ConnectionConfig of the Request Task's dataset, rather than every ConnectionConfig.
+
+    Decrypted ConnectionConfigs are cached by the worker, so nodes that run on the
+    same connector don't decrypt its secrets again.
+    """
+    connection_key: Optional[str] = (request_task.traversal_details or {}).get(
+        "dataset_connection_key"
+    )
+    connection_config: Optional[ConnectionConfig] = (
+        get_connection_config(session, connection_key) if connection_key else None
+    )
+    return [connection_config] if connection_config else []
+
+
 def create_graph_task(
     session: Session, request_task: RequestTask, resources: TaskResources
 ) -> GraphTask:
@@ -216,11 +234,11 @@ def queue_downstream_tasks(
 
     If we've reached the terminator task, restart the privacy request from the appropriate checkpoint.
     """
-    pending_downstream: Query = request_task.get_pending_downstream_tasks(session)
-    for downstream_task in pending_downstream:
-        if downstream_task.can_queue_request_task(session, should_log=True):
-            log_task_queued(downstream_task, request_task.collection_address)
-            queue_request_task(downstream_task, privacy_request_proceed)
+    for downstream_task in request_task.get_queueable_downstream_tasks(
+        session, should_log=True
+    ):
+        log_task_queued(downstream_task, request_task.collection_address)
+        queue_request_task(downstream_task, privacy_request_proceed)
 
     if (
         request_task.request_task_address == TERMINATOR_ADDRESS
@@ -279,7 +297,7 @@ def run_access_node(
                     with TaskResources(
                         privacy_request,
                         privacy_request.policy,
-                        session.query(ConnectionConfig).all(),
+                        get_connection_configs_for_task(session, request_task),
                         request_task,
                         session,
                     ) as resources:
@@ -344,7 +362,7 @@ def run_erasure_node(
                 with TaskResources(
                     privacy_request,
                     privacy_request.policy,
-                    session.query(ConnectionConfig).all(),
+                    get_connection_configs_for_task(session, request_task),
                     request_task,
                     session,
                 ) as resources:
@@ -401,7 +419,7 @@ def run_consent_node(
                 with TaskResources(
                     privacy_request,
                     privacy_request.policy,
-                    session.query(ConnectionConfig).all(),
+                    get_connection_configs_for_task(session, request_task),
                     request_task,
                     session,
                 ) as resources:
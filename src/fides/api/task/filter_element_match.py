@@ -1,6 +1,6 @@
 import copy
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import pydash
 from loguru import logger
@@ -66,6 +66,28 @@ def filter_element_match(
     return _remove_paths_from_row(row, array_paths_to_preserve, delete_elements)
 
 
+def filter_element_match_with_placeholders(
+    row: Row, query_paths: FieldPathNodeInput
+) -> Tuple[Row, Row]:
+    """
+    Returns the row in both of the formats filter_element_match produces: a copy with unmatched array elements
+    *replaced* with placeholder text, and the row itself, modified in place to *remove* them.
+
+    The matching array elements are only looked up once, and the row is only copied if it has
+    array elements to replace. Otherwise the same row is returned for both formats.
+    """
+    array_paths_to_preserve: Dict[str, List[int]] = _expand_array_paths_to_preserve(
+        build_refined_target_paths(row, query_paths)
+    )
+    if not array_paths_to_preserve:
+        return row, row
+
+    placeholder_row = _remove_paths_from_row(
+        copy.deepcopy(row), array_paths_to_preserve, delete_elements=False
+    )
+    return placeholder_row, _remove_paths_from_row(row, array_paths_to_preserve)
+
+
 def _remove_paths_from_row(
     row: Dict[str, Any],
     preserve_indices: Dict[str, List[int]],
@@ -1,13 +1,127 @@
 import itertools
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Union
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 
 from fides.api.graph.config import CollectionAddress, FieldPath
-from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.graph import DatasetGraph, Node
 from fides.api.util.collection_util import Row
 
+FieldPathTrie = Dict[str, "FieldPathTrie"]
+ExtractorKey = Tuple[CollectionAddress, FrozenSet[str]]
+
+
+class FieldPathExtractor:
+    """
+    Projects rows onto a fixed set of field paths in a single pass over each row.
+
+    The field paths are compiled into a trie of their levels. Extracting a row gives the same result
+    as calling `select_and_save_field` for each field path and then `remove_empty_containers`.
+    """
+
+    def __init__(
+        self, field_paths: Iterable[FieldPath] = (), select_all: bool = False
+    ) -> None:
+        self.select_all = select_all
+        self.trie: FieldPathTrie = {}
+        for field_path in field_paths:
+            node = self.trie
+            for level in field_path.levels:
+                node = node.setdefault(level, {})
+
+    @property
+    def is_empty(self) -> bool:
+        """True if no data would be extracted from any row"""
+        return not self.select_all and not self.trie
+
+    def extract(self, row: Row) -> Row:
+        """Returns the data in the row along the compiled field paths, or the row itself if selecting everything"""
+        if self.select_all:
+            return row
+        return _extract_along_trie(row, self.trie)
+
+
+def _extract_along_trie(value: Any, trie: FieldPathTrie) -> Any:
+    """
+    Arrays are projected element by element along the same trie, objects are projected onto the keys
+    in the trie, and anything else is returned as is. Empty objects and arrays are left out.
+    """
+    if isinstance(value, dict):
+        extracted: Dict[Any, Any] = {}
+        for key, elem in value.items():
+            child_trie = trie.get(key)
+            if child_trie is None:
+                continue
+            elem = _extract_along_trie(elem, child_trie)
+            if elem not in [{}, []]:
+                extracted[key] = elem
+        return extracted
+
+    if isinstance(value, list):
+        return [
+            elem
+            for elem in (_extract_along_trie(elem, trie) for elem in value)
+            if elem not in [{}, []]
+        ]
+
+    return value
+
+
+def compile_field_path_extractor(
+    node: Node, target_categories: Iterable[str]
+) -> FieldPathExtractor:
+    """
+    Compiles an extractor for the fields on the node associated with the target data categories
+    and their subcategories. Every field is selected if the collection itself has a matching data category.
+    """
+    target_prefixes = tuple(target_categories)
+    collection = node.collection
+    if any(
+        collection_category.startswith(target_prefixes)
+        for collection_category in collection.data_categories or []
+    ):
+        return FieldPathExtractor(select_all=True)
+
+    return FieldPathExtractor(
+        itertools.chain.from_iterable(
+            field_paths
+            for category, field_paths in collection.field_paths_by_category.items()
+            if category.startswith(target_prefixes)
+        )
+    )
+
+
+_extractor_cache: (
+    "WeakKeyDictionary[DatasetGraph, Dict[ExtractorKey, FieldPathExtractor]]"
+) = WeakKeyDictionary()
+_extractor_cache_lock = Lock()
+
+
+def get_field_path_extractor(
+    dataset_graph: DatasetGraph,
+    node_address: CollectionAddress,
+    target_categories: FrozenSet[str],
+) -> FieldPathExtractor:
+    """
+    Returns the extractor for the node and target data categories, compiling it the first time
+    it's requested for the graph. Extractors are cached for as long as the graph is in use,
+    and the graph cache reuses graphs across privacy requests until a dataset changes.
+    """
+    key: ExtractorKey = (node_address, target_categories)
+    with _extractor_cache_lock:
+        extractors = _extractor_cache.setdefault(dataset_graph, {})
+        extractor = extractors.get(key)
+    if extractor is None:
+        extractor = compile_field_path_extractor(
+            dataset_graph.nodes[node_address], target_categories
+        )
+        with _extractor_cache_lock:
+            extractors[key] = extractor
+    return extractor
+
 
 def filter_data_categories(
     access_request_results: Dict[str, List[Dict[str, Optional[Any]]]],
@@ -33,18 +147,20 @@ def filter_data_categories(
         "Filtering Access Request results to return fields associated with data categories"
     )
     filtered_access_results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    frozen_target_categories = frozenset(target_categories)
     for node_address, results in access_request_results.items():
         if not results:
             continue
 
+        collection_address = CollectionAddress.from_string(node_address)
+
         # Results from fides connectors are a special case:
         # they've already been filtered and stored in a dict keyed by rule key.
         # So here, we simply find the results corresponding to our current rule
         # and unpack the result so that its stored at the "top level"
         # of the results dict
         if fides_connector_datasets and (
-            CollectionAddress.from_string(node_address).dataset
-            in fides_connector_datasets
+            collection_address.dataset in fides_connector_datasets
         ):
             unpack_fides_connector_results(
                 results, filtered_access_results, rule_key, node_address
@@ -53,44 +169,18 @@ def filter_data_categories(
             # as they have already been pre-filtered
             continue
 
-        # Gets all FieldPaths on this traversal_node associated with the requested data
-        # categories and sub data categories
-        target_field_paths: Set[FieldPath] = set(
-            itertools.chain(
-                *[
-                    field_paths
-                    for cat, field_paths in dataset_graph.data_category_field_mapping[
-                        CollectionAddress.from_string(node_address)
-                    ].items()
-                    if any(cat.startswith(tar) for tar in target_categories)
-                ]
-            )
-        )
-
-        collection_data_categories = set(
-            dataset_graph.nodes[
-                CollectionAddress.from_string(node_address)
-            ].collection.data_categories
-            or []
+        # Extracts the fields on this traversal_node associated with the requested data
+        # categories and sub data categories, or every field if the collection itself has
+        # one of those categories
+        extractor: FieldPathExtractor = get_field_path_extractor(
+            dataset_graph, collection_address, frozen_target_categories
         )
-
-        if collection_data_categories:
-            if any(
-                collection_category.startswith(tuple(target_categories))
-                for collection_category in collection_data_categories
-            ):
-                filtered_access_results[node_address].extend(results)
-                continue
-
-        if not target_field_paths:
+        if extractor.is_empty:
             continue
 
-        for row in results:
-            filtered_results: Dict[str, Any] = {}
-            for field_path in target_field_paths:
-                select_and_save_field(filtered_results, row, field_path)
-            remove_empty_containers(filtered_results)
-            filtered_access_results[node_address].append(filtered_results)
+        filtered_access_results[node_address].extend(
+            extractor.extract(row) for row in results
+        )
 
     return filtered_access_results
 
@@ -1,5 +1,4 @@
 # pylint: disable=too-many-lines,too-many-statements
-import copy
 import traceback
 from abc import ABC
 from functools import wraps
@@ -42,7 +41,7 @@ from fides.api.schemas.policy import ActionType, CurrentStep
 from fides.api.schemas.privacy_request import ExecutionLogStatus
 from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.task.consolidate_query_matches import consolidate_query_matches
-from fides.api.task.filter_element_match import filter_element_match
+from fides.api.task.filter_element_match import filter_element_match_with_placeholders
 from fides.api.task.refine_target_path import FieldPathNodeInput
 from fides.api.task.task_resources import TaskResources
 from fides.api.util.cache import get_cache
@@ -55,6 +54,7 @@ from fides.api.util.collection_util import (
     make_mutable,
 )
 from fides.api.util.consent_util import add_errored_system_status_for_consent_reporting
+from fides.api.util.encryption.secrets_util import masking_secrets_scope
 from fides.api.util.logger import Pii
 from fides.api.util.logger_context_utils import LoggerContextKeys
 from fides.api.util.saas_util import FIDESOPS_GROUPED_INPUTS
@@ -475,7 +475,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         out: FieldPathNodeInput = {}
         for key, values in pre_processed_inputs.items():
             path: FieldPath = FieldPath.parse(key)
-            field: Optional[Field] = self.execution_node.collection.field(path)
+            field: Optional[Field] = self.execution_node.field_index.field(path)
             if (
                 field
                 and path in self.execution_node.query_field_paths
@@ -511,12 +511,19 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             self.post_process_input_data(formatted_input_data)
         )
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
+        # For erasures: cache results with non-matching array elements *replaced* with placeholder text.
+        # For access request results: cache results with non-matching array elements *removed*.
+        # Rows are only copied if they have array elements to replace.
+        placeholder_output: List[Row] = []
+        for row in output:
+            logger.info(
+                "Filtering row in {} for matching array elements.",
+                self.execution_node.address,
+            )
+            placeholder_row, _ = filter_element_match_with_placeholders(
+                row, post_processed_node_input_data
             )
+            placeholder_output.append(placeholder_row)
 
         # For DSR 3.0, save data to build masking requests directly
         # on the Request Task.
@@ -531,14 +538,6 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             f"access_request__{self.key}", placeholder_output
         )
 
-        # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
-            logger.info(
-                "Filtering row in {} for matching array elements.",
-                self.execution_node.address,
-            )
-            filter_element_match(row, post_processed_node_input_data)
-
         if self.request_task.id:
             # Saves intermediate access results for DSR 3.0 directly on the Request Task
             self.request_task.access_data = output
@@ -678,13 +677,15 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             )
             return 0
 
-        output = self.connector.mask_data(
-            self.execution_node,
-            self.resources.policy,
-            self.resources.request,
-            self.resources.privacy_request_task,
-            retrieved_data,
-        )
+        # the masking secrets are fetched once for this node's rows and dropped afterwards
+        with masking_secrets_scope():
+            output = self.connector.mask_data(
+                self.execution_node,
+                self.resources.policy,
+                self.resources.request,
+                self.resources.privacy_request_task,
+                retrieved_data,
+            )
         if self.request_task.id:
             # For DSR 3.0, largely for testing. DSR 3.0 uses Request Task status
             # instead of presence of cached erasure data to know if we should rerun a node
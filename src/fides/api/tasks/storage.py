@@ -4,8 +4,9 @@ import json
 import os
 import secrets
 import zipfile
-from io import BytesIO
-from typing import Any, Dict, Optional, Set, Union
+from io import BufferedWriter, BytesIO, RawIOBase, TextIOWrapper
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, BinaryIO, Dict, Optional, Set, Union
 
 import pandas as pd
 from botocore.exceptions import ClientError, ParamValidationError
@@ -21,31 +22,43 @@ from fides.api.service.privacy_request.dsr_package.dsr_report_builder import (
 from fides.api.util.aws_util import get_aws_session
 from fides.api.util.cache import get_cache, get_encryption_cache_key
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
+    CombinedNonceAndMessageWriter,
     encrypt_to_bytes_verify_secrets_length,
 )
 from fides.api.util.storage_util import storage_json_encoder
 from fides.config import CONFIG
 
 LOCAL_FIDES_UPLOAD_DIRECTORY = "fides_uploads"
+# Access packages larger than this are spooled to disk instead of being held in memory
+ACCESS_PACKAGE_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Size of the chunks that serialized data is encrypted and written in
+ACCESS_PACKAGE_WRITE_BUFFER_SIZE = 64 * 1024
 
 
-def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
-    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
+def get_access_request_encryption_key(request_id: str) -> Optional[bytes]:
+    """Returns the encryption key cached for the privacy request, if one was provided"""
     cache = get_cache()
     encryption_cache_key = get_encryption_cache_key(
         privacy_request_id=request_id,
         encryption_attr="key",
     )
+    encryption_key: str | None = cache.get(encryption_cache_key)
+    if not encryption_key:
+        return None
+    return encryption_key.encode(encoding=CONFIG.security.encoding)
+
+
+def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
+    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
     if isinstance(data, bytes):
         data = data.decode(CONFIG.security.encoding)
 
-    encryption_key: str | None = cache.get(encryption_cache_key)
-    if not encryption_key:
+    bytes_encryption_key: Optional[bytes] = get_access_request_encryption_key(
+        request_id
+    )
+    if not bytes_encryption_key:
         return data
 
-    bytes_encryption_key: bytes = encryption_key.encode(
-        encoding=CONFIG.security.encoding
-    )
     nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
     # b64encode the entire nonce and the encrypted message together
     return bytes_to_b64_str(
@@ -54,53 +67,125 @@ def encrypt_access_request_results(data: Union[str, bytes], request_id: str) ->
     )
 
 
-def write_to_in_memory_buffer(
-    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
-) -> BytesIO:
-    """Write JSON/CSV data to in-memory file-like object to be passed to S3. Encrypt data if encryption key/nonce
-    has been cached for the given privacy request id
+class _UnclosableWriter(RawIOBase):
+    """Passes writes through to the file object, without closing it when closed"""
+
+    def __init__(self, fileobj: BinaryIO):
+        super().__init__()
+        self._fileobj = fileobj
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        return self._fileobj.write(b)
+
+
+def _open_text_writer(
+    fileobj: BinaryIO, encryption_key: Optional[bytes]
+) -> TextIOWrapper:
+    """Opens a buffered text stream over the file object that encrypts what is written to it
+    if an encryption key was provided. Closing the text stream leaves the file object open.
+    """
+    target: Any = (
+        CombinedNonceAndMessageWriter(
+            fileobj,
+            encryption_key,
+            secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length),
+        )
+        if encryption_key
+        else _UnclosableWriter(fileobj)
+    )
+    return TextIOWrapper(
+        BufferedWriter(target, buffer_size=ACCESS_PACKAGE_WRITE_BUFFER_SIZE),
+        encoding=CONFIG.security.encoding,
+        newline="",
+    )
+
+
+def write_access_package(
+    resp_format: str,
+    data: Dict[str, Any],
+    privacy_request: PrivacyRequest,
+    fileobj: BinaryIO,
+) -> None:
+    """Stream JSON/CSV data into a binary file object, collection by collection. Encrypt data in chunks
+    if encryption key/nonce has been cached for the given privacy request id
+
+    The serialized data is never held in memory in full, so the file object can be a spooled
+    temporary file to bound memory use for large packages.
 
     :param resp_format: str, should be one of ResponseFormat
     :param data: Dict
-    :param request_id: str, The privacy request id
+    :param privacy_request: PrivacyRequest
+    :param fileobj: BinaryIO, the file object to write to
     """
-    logger.debug("Writing data to in-memory buffer")
-
     if resp_format == ResponseFormat.json.value:
-        json_str = json.dumps(data, indent=2, default=storage_json_encoder)
-        return BytesIO(
-            encrypt_access_request_results(json_str, privacy_request.id).encode(
-                CONFIG.security.encoding
-            )
-        )
+        encryption_key = get_access_request_encryption_key(privacy_request.id)
+        encoder = json.JSONEncoder(indent=2, default=storage_json_encoder)
+        with _open_text_writer(fileobj, encryption_key) as writer:
+            for chunk in encoder.iterencode(data):
+                writer.write(chunk)
+        return
 
     if resp_format == ResponseFormat.csv.value:
-        zipped_csvs = BytesIO()
-        with zipfile.ZipFile(zipped_csvs, "w") as f:
+        encryption_key = get_access_request_encryption_key(privacy_request.id)
+        with zipfile.ZipFile(fileobj, "w") as f:
             for key in data:
                 df = pd.json_normalize(data[key])
-                buffer = BytesIO()
-                df.to_csv(buffer, index=False, encoding=CONFIG.security.encoding)
-                buffer.seek(0)
-                f.writestr(
-                    f"{key}.csv",
-                    encrypt_access_request_results(
-                        buffer.getvalue(), privacy_request.id
-                    ),
-                )
-
-        zipped_csvs.seek(0)
-        return zipped_csvs
+                with f.open(f"{key}.csv", "w") as entry:
+                    with _open_text_writer(entry, encryption_key) as writer:  # type: ignore[arg-type]
+                        df.to_csv(writer, index=False)
+        return
 
     if resp_format == ResponseFormat.html.value:
-        return DsrReportBuilder(
+        report: BytesIO = DsrReportBuilder(
             privacy_request=privacy_request,
             dsr_data=data,
         ).generate()
+        # the report is already in memory, so its buffer is written without copying it
+        fileobj.write(report.getbuffer())
+        return
 
     raise NotImplementedError(f"No handling for response format {resp_format}.")
 
 
+def write_to_in_memory_buffer(
+    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
+) -> BytesIO:
+    """Write JSON/CSV data to in-memory file-like object. Encrypt data if encryption key/nonce
+    has been cached for the given privacy request id
+
+    :param resp_format: str, should be one of ResponseFormat
+    :param data: Dict
+    :param request_id: str, The privacy request id
+    """
+    logger.debug("Writing data to in-memory buffer")
+    buffer = BytesIO()
+    write_access_package(resp_format, data, privacy_request, buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def write_to_spooled_file(
+    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
+) -> IO[bytes]:
+    """Write JSON/CSV data to a temporary file that is only held in memory while it is small.
+    Encrypt data if encryption key/nonce has been cached for the given privacy request id
+    """
+    logger.debug("Writing data to spooled temporary file")
+    spooled_file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=ACCESS_PACKAGE_SPOOL_MAX_SIZE
+    )
+    try:
+        write_access_package(resp_format, data, privacy_request, spooled_file)  # type: ignore[arg-type]
+    except Exception:
+        spooled_file.close()
+        raise
+    spooled_file.seek(0)
+    return spooled_file  # type: ignore[return-value]
+
+
 def create_presigned_url_for_s3(s3_client: Any, bucket_name: str, file_key: str) -> str:
     """ "Generate a presigned URL to share an S3 object
 
@@ -137,13 +222,16 @@ def upload_to_s3(  # pylint: disable=R0913
         my_session = get_aws_session(auth_method, storage_secrets)
         s3_client = my_session.client("s3")
 
-        # handles file chunking
+        # handles file chunking, using a multipart upload for large files
         try:
-            s3_client.upload_fileobj(
-                Fileobj=write_to_in_memory_buffer(resp_format, data, privacy_request),
-                Bucket=bucket_name,
-                Key=file_key,
-            )
+            with write_to_spooled_file(
+                resp_format, data, privacy_request
+            ) as package_file:
+                s3_client.upload_fileobj(
+                    Fileobj=package_file,
+                    Bucket=bucket_name,
+                    Key=file_key,
+                )
         except Exception as e:
             logger.error("Encountered error while uploading s3 object: {}", e)
             raise e
@@ -175,9 +263,7 @@ def upload_to_local(
         os.makedirs(LOCAL_FIDES_UPLOAD_DIRECTORY)
 
     filename = f"{LOCAL_FIDES_UPLOAD_DIRECTORY}/{file_key}"
-    in_memory_file = write_to_in_memory_buffer(resp_format, data, privacy_request)
-
     with open(filename, "wb") as file:
-        file.write(in_memory_file.getvalue())
+        write_access_package(resp_format, data, privacy_request, file)
 
     return "your local fides_uploads folder"
@@ -1,10 +1,11 @@
 import json
-from typing import Any, Dict, List, Optional, Union
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from urllib.parse import unquote_to_bytes
 
 from loguru import logger
 from redis import Redis
-from redis.client import Script  # type: ignore
 from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 from redis.exceptions import DataError
 
@@ -22,10 +23,26 @@ from fides.config import CONFIG
 # This constant represents every type a redis key may contain, and can be
 # extended if needed
 RedisValue = Union[bytes, float, int, str]
+RedisKey = Union[bytes, str]
+
+# Characters with a special meaning in the patterns used by SCAN ... MATCH and KEYS
+REDIS_PATTERN_SPECIAL_CHARACTERS = re.compile(r"([\\*?\[\]])")
 
 _connection = None
 
 
+def escape_redis_pattern(value: str) -> str:
+    """Escape a literal string so it can be used in a Redis glob-style pattern"""
+    return REDIS_PATTERN_SPECIAL_CHARACTERS.sub(r"\\\1", value)
+
+
+def _key_starts_with(key: RedisKey, prefixes: Tuple[str, ...]) -> bool:
+    """Whether a key returned by Redis, decoded or not, starts with any of the prefixes"""
+    if isinstance(key, bytes):
+        key = key.decode()
+    return key.startswith(prefixes)
+
+
 class FidesopsRedis(Redis):
     """
     An extension to Redis' python bindings to support auto expiring data input. This class
@@ -56,12 +73,54 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> int:
+        """Delete all keys starting with a given prefix, returning the number of keys deleted"""
+        return self.delete_keys_by_prefixes([prefix], chunk_size=chunk_size)
+
+    def delete_keys_by_prefixes(
+        self, prefixes: List[str], chunk_size: int = 1000
+    ) -> int:
+        """Delete all keys starting with any of the given prefixes in a single sweep of the keyspace.
+
+        The sweep is limited to keys matching the longest prefix that all of the given prefixes
+        share, and each key found is then checked against the individual prefixes.
+        """
+        if not prefixes:
+            return 0
+        match = f"{escape_redis_pattern(os.path.commonprefix(prefixes))}*"
+        prefix_tuple = tuple(prefixes)
+        keys = (
+            key
+            for key in self.scan_iter(match=match, count=chunk_size)
+            if _key_starts_with(key, prefix_tuple)
         )
-        s()
+        return self._unlink_in_chunks(keys, chunk_size)
+
+    def delete_keys_by_pattern(self, pattern: str, chunk_size: int = 1000) -> int:
+        """Delete all keys matching a glob-style pattern, returning the number of keys deleted"""
+        return self._unlink_in_chunks(
+            self.scan_iter(match=pattern, count=chunk_size), chunk_size
+        )
+
+    def _unlink_in_chunks(self, keys: Iterable[RedisKey], chunk_size: int) -> int:
+        """Unlink the given keys, sending one pipeline of UNLINK commands per chunk_size keys.
+
+        Keys are found incrementally with SCAN rather than KEYS, so Redis is never blocked
+        by a single walk of the whole keyspace, and UNLINK reclaims their memory in the
+        background. Each key gets its own UNLINK so a chunk never spans hash slots.
+        """
+        deleted = 0
+        pipe = self.pipeline(transaction=False)
+        queued = 0
+        for key in keys:
+            pipe.unlink(key)
+            queued += 1
+            if queued >= chunk_size:
+                deleted += sum(pipe.execute())
+                queued = 0
+        if queued:
+            deleted += sum(pipe.execute())
+        return deleted
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
@@ -236,7 +295,7 @@ def get_masking_secret_cache_key(
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
     """Returns all cache keys related to this privacy request's cached identities"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"*{privacy_request_id}*")
+    return list(cache.scan_iter(match=f"*{privacy_request_id}*", count=1000))
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
@@ -272,16 +331,26 @@ def cache_task_tracking_key(request_id: str, celery_task_id: str) -> None:
 
 def celery_tasks_in_flight(celery_task_ids: List[str]) -> bool:
     """Returns True if supplied Celery Tasks appear to be in-flight"""
+    return bool(get_celery_tasks_in_flight(celery_task_ids))
+
+
+def get_celery_tasks_in_flight(celery_task_ids: List[str]) -> Set[str]:
+    """Returns the ids of the supplied Celery Tasks that appear to be in-flight.
+
+    All of the ids are looked up with a single broadcast to the workers, rather than
+    one broadcast per task.
+    """
     if not celery_task_ids:
-        return False
+        return set()
 
     queried_tasks = celery_app.control.inspect().query_task(*celery_task_ids)
     if not queried_tasks:
-        return False
+        return set()
 
+    in_flight: Set[str] = set()
     # Expected format: {HOSTNAME: {TASK_ID: [STATE, TASK_INFO]}}
     for _, task_details in queried_tasks.items():
-        for _, state_array in task_details.items():
+        for task_id, state_array in task_details.items():
             state: str = state_array[0]
             # Note, not positive of states here,
             # some seen in testing, some from here:
@@ -296,9 +365,8 @@ def celery_tasks_in_flight(celery_task_ids: List[str]) -> bool:
                 "scheduled",
                 "started",
             ]:
-                return True
-
-    return False
+                in_flight.add(task_id)
+    return in_flight
 
 
 def get_queue_counts() -> Dict[str, int]:
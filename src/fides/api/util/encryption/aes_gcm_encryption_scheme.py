@@ -1,6 +1,8 @@
 import base64
-from typing import Optional
+from io import RawIOBase
+from typing import Any, BinaryIO, Optional
 
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from fides.api.cryptography.cryptographic_util import bytes_to_b64_str
@@ -61,6 +63,47 @@ def decrypt_combined_nonce_and_message(encrypted_value: str, key: bytes) -> str:
     return decrypted_str
 
 
+class CombinedNonceAndMessageWriter(RawIOBase):
+    """Writable stream that encrypts everything written to it with AES GCM, in chunks.
+
+    The output written to the underlying file object is the same as base64 encoding the nonce
+    packaged together with the message encrypted in one go, so it can be read with
+    decrypt_combined_nonce_and_message. The authentication tag is written when the stream is closed.
+    The underlying file object is left open.
+    """
+
+    def __init__(self, fileobj: BinaryIO, key: bytes, nonce: bytes):
+        super().__init__()
+        verify_nonce(nonce)
+        verify_encryption_key(key)
+        self._fileobj = fileobj
+        self._encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+        self._encryptor.authenticate_additional_data(nonce)
+        # bytes that have yet to be base64 encoded, as they are encoded in groups of three
+        self._pending: bytes = nonce
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+        self._write_b64(self._encryptor.update(data))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._write_b64(self._encryptor.finalize() + self._encryptor.tag)
+            self._fileobj.write(base64.b64encode(self._pending))
+            self._pending = b""
+        super().close()
+
+    def _write_b64(self, data: bytes) -> None:
+        data = self._pending + data
+        encodable_length = len(data) - len(data) % 3
+        self._fileobj.write(base64.b64encode(data[:encodable_length]))
+        self._pending = data[encodable_length:]
+
+
 def decrypt(encrypted_value: str, key: bytes, nonce: bytes) -> str:
     """Decrypts the value using the AES GCM Algorithm"""
     verify_encryption_key(key)
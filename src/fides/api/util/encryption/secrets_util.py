@@ -1,5 +1,7 @@
 import secrets
-from typing import Dict, List, Optional, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from loguru import logger
 
@@ -12,6 +14,26 @@ from fides.api.util.cache import get_cache, get_masking_secret_cache_key
 
 T = TypeVar("T")
 
+# Masking secrets by privacy request id and masking strategy, held for the current masking run only
+_masking_secrets: ContextVar[Optional[Dict[Tuple[str, str], Dict[SecretType, Any]]]] = (
+    ContextVar("masking_secrets", default=None)
+)
+
+
+@contextmanager
+def masking_secrets_scope() -> Iterator[None]:
+    """
+    Holds the masking secrets looked up inside the block in memory, so the secrets for each
+    privacy request and masking strategy are only fetched from Redis once.
+
+    The secrets are dropped when the block exits, so they don't outlive the masking run.
+    """
+    token = _masking_secrets.set({})
+    try:
+        yield
+    finally:
+        _masking_secrets.reset(token)
+
 
 class SecretsUtil:
     @staticmethod
@@ -43,13 +65,50 @@ class SecretsUtil:
         secret_type: SecretType,
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> Optional[T]:
+        """
+        Returns a masking secret for the privacy request.
+
+        Every secret type for the privacy request and masking strategy is fetched with a single MGET.
+        Inside a masking_secrets_scope they are held in memory after the first lookup.
+        """
+        scoped_secrets = _masking_secrets.get()
+        cache_key: Tuple[str, str] = (
+            privacy_request_id,
+            masking_secret_meta.masking_strategy,
+        )
+        masking_secrets: Optional[Dict[SecretType, Any]] = (
+            scoped_secrets.get(cache_key) if scoped_secrets is not None else None
+        )
+        if masking_secrets is None or secret_type not in masking_secrets:
+            masking_secrets = SecretsUtil._get_masking_secrets_from_cache(
+                privacy_request_id, masking_secret_meta.masking_strategy
+            )
+            if masking_secrets and scoped_secrets is not None:
+                scoped_secrets[cache_key] = masking_secrets
+        return masking_secrets.get(secret_type)
+
+    @staticmethod
+    def _get_masking_secrets_from_cache(
+        privacy_request_id: str, masking_strategy: str
+    ) -> Dict[SecretType, Any]:
+        """Fetches every secret type saved for the privacy request and masking strategy from Redis"""
         cache = get_cache()
-        masking_secret_cache_key: str = get_masking_secret_cache_key(
-            privacy_request_id=privacy_request_id,
-            masking_strategy=masking_secret_meta.masking_strategy,
-            secret_type=secret_type,
+        secret_types: List[SecretType] = list(SecretType)
+        values: List[Optional[str]] = cache.mget(
+            [
+                get_masking_secret_cache_key(
+                    privacy_request_id=privacy_request_id,
+                    masking_strategy=masking_strategy,
+                    secret_type=secret_type,
+                )
+                for secret_type in secret_types
+            ]
         )
-        return cache.get_encoded_by_key(masking_secret_cache_key)
+        return {
+            secret_type: cache.decode_obj(value)
+            for secret_type, value in zip(secret_types, values)
+            if value
+        }
 
     @staticmethod
     def generate_secret_string(length: int) -> str:
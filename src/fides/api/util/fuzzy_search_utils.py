@@ -1,126 +1,112 @@
-from typing import Any, Dict, List, Optional
+"""
+Fuzzy search over the identities provided with privacy requests.
 
-import ahocorasick  # type: ignore
-from loguru import logger
-from sqlalchemy.orm import Session
+Because we use SQLAlchemy-level AES/GCM encryption to write identity data to our ProvidedIdentity table,
+we cannot search identity values at the DB-level. No tools exist that support an equivalent AES/GCM
+decryption method within Postgres.
 
-from fides.api.util.cache import FidesopsRedis, get_cache
-from fides.config import get_config
+Instead, each identity value is indexed when it is persisted: a keyed hash of every prefix of the value,
+from MIN_INDEXED_PREFIX_LENGTH up to MAX_INDEXED_PREFIX_LENGTH characters, is written to the
+identity_search_index table. Searching for identities that start with a string is then an indexed lookup
+of the string's hash, which every worker can run against the shared database without decrypting anything.
+"""
 
-AUTOMATON_SIGNAL_CACHE_KEY = "DECRYPTED_IDENTITY_AUTOMATON__CACHE_SIGNAL"
-CONFIG = get_config()
-_automaton = None
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Union
 
+from sqlalchemy.orm import Query, Session
 
-def get_decrypted_identities_automaton(
-    db: Session, check_for_cache: bool = False
-) -> ahocorasick.Automaton:  # pylint: disable=c-extension-no-member
-    """
-    Return a singleton Automaton that we can use for efficient fuzzy search.
+from fides.api.cryptography.cryptographic_util import hmac_value_with_key
+from fides.api.cryptography.identity_salt import get_identity_salt
+from fides.api.models.identity_search_index import IdentitySearchIndex
 
-    If check_for_cache is true, we refresh the automaton if automaton age is > 3 hrs.
-    Automatons are only refreshed during new privacy requests (not during search) to reduce chance of slow performance
-    during search.
+if TYPE_CHECKING:
+    from fides.api.models.privacy_request import ProvidedIdentity
 
-    More background:
+# Shorter prefixes are not indexed: there are so few distinct ones that anyone who can read the
+# table could tell the first characters of identities apart by how often each hash occurs.
+# Shorter search strings only match privacy request ids.
+MIN_INDEXED_PREFIX_LENGTH = 3
 
-    Because we use SQLAlchemy-level AES/GCM encryption to write identity data to our ProvidedIdentity table,
-    we cannot implement fuzzy search at the DB-level. No tools exist that support an equivalent AES/GCM decryption
-    method within Postgres.
+# Search strings longer than this are looked up by their first MAX_INDEXED_PREFIX_LENGTH
+# characters, and the matching identities are decrypted to check the rest of the string.
+MAX_INDEXED_PREFIX_LENGTH = 64
 
-    Instead, we implement fuzzy search by decrypting identity data at the app-level. We do this by storing
-    decrypted identity data in a singleton that refreshes every 3 hrs.
 
-    We also manually write to the singleton when new privacy requests are created so that we do not miss newer values.
-    """
-    global _automaton  # pylint: disable=W0603
-    if _automaton is None:
-        logger.info(
-            "Automaton does not yet exist. Proceeding to build automaton with decrypted identities..."
-        )
-        _automaton = build_automaton(db)
-    elif check_for_cache and get_should_refresh_automaton():
-        logger.info(
-            "Automaton has expired. Proceeding to build new automaton with decrypted identities..."
-        )
-        _automaton = build_automaton(db)
+def hash_identity_prefix(prefix: str, encoding: str = "UTF-8") -> str:
+    """Hashes an identity prefix with the identity salt as the key"""
+    return hmac_value_with_key(
+        prefix.encode(encoding), get_identity_salt().encode(encoding)
+    )
 
-    # Else use global pre-existing singleton
-    return _automaton
 
+def build_identity_search_index_rows(
+    provided_identity: "ProvidedIdentity",
+) -> List[Dict[str, Any]]:
+    """Returns the identity search index rows for each indexed prefix of the identity's value"""
+    value = (provided_identity.encrypted_value or {}).get("value")
+    if value is None or not provided_identity.privacy_request_id:
+        return []
+
+    value_str = str(value)
+    return [
+        {
+            "provided_identity_id": provided_identity.id,
+            "privacy_request_id": provided_identity.privacy_request_id,
+            "prefix_hash": hash_identity_prefix(value_str[:length]),
+        }
+        for length in range(
+            MIN_INDEXED_PREFIX_LENGTH,
+            min(len(value_str), MAX_INDEXED_PREFIX_LENGTH) + 1,
+        )
+    ]
 
-def manually_reset_automaton() -> None:
-    """Manually set our global _automaton singleton to None. Used for testing"""
-    global _automaton  # pylint: disable=W0603
-    _automaton = None
 
+def add_to_identity_search_index(
+    db: Session, provided_identities: Iterable["ProvidedIdentity"]
+) -> None:
+    """
+    Adds the provided identities to the identity search index.
 
-def build_automaton(
-    db: Session,
-) -> ahocorasick.Automaton:  # pylint: disable=c-extension-no-member
+    The rows are inserted in bulk but not committed, that is left to the caller.
     """
-    Builds automaton in this format: {"decrypted identity val", ["req_id_1", "req_id_2"]}
+    rows = [
+        row
+        for provided_identity in provided_identities
+        for row in build_identity_search_index_rows(provided_identity)
+    ]
+    if rows:
+        db.bulk_insert_mappings(IdentitySearchIndex, rows)
+
+
+def get_privacy_request_ids_by_identity_prefix(
+    db: Session, prefix: str
+) -> Union[Query, Set[str]]:
+    """
+    Returns the ids of the privacy requests with an identity value that starts with the prefix.
+
+    Prefixes up to MAX_INDEXED_PREFIX_LENGTH characters are returned as a subquery so the
+    database can apply them directly, longer ones as the set of ids that were verified to match.
+    Prefixes shorter than MIN_INDEXED_PREFIX_LENGTH characters are not indexed and match nothing.
     """
     # Local import to avoid circular dependencies
-    from fides.api.models.privacy_request import PrivacyRequest
+    from fides.api.models.privacy_request import ProvidedIdentity
 
-    logger.debug("Creating new automaton...")
-    automaton = ahocorasick.Automaton()  # pylint: disable=c-extension-no-member
-    all_privacy_requests: List[PrivacyRequest] = db.query(PrivacyRequest).yield_per(1000)  # type: ignore
-    for request in all_privacy_requests:
-        _add_decrypted_identities_to_automaton(request.get_persisted_identity().__dict__, request.id, automaton)  # type: ignore
-    set_automaton_cache_signal()
-    return automaton
+    if len(prefix) < MIN_INDEXED_PREFIX_LENGTH:
+        return set()
 
+    indexed_prefix = prefix[:MAX_INDEXED_PREFIX_LENGTH]
+    matches = IdentitySearchIndex.prefix_hash == hash_identity_prefix(indexed_prefix)
+    if len(prefix) == len(indexed_prefix):
+        return db.query(IdentitySearchIndex.privacy_request_id).filter(matches)
 
-def add_identity_to_automaton(
-    automaton: ahocorasick.Automaton,  # pylint: disable=c-extension-no-member
-    request_id: str,
-    identities: Optional[Dict[str, Any]],
-) -> None:
-    logger.info("Adding single identity to automaton...")
-    _add_decrypted_identities_to_automaton(identities, request_id, automaton)
-
-
-def set_automaton_cache_signal() -> None:
-    """Set a signal we can check to determine whether we should refresh our decrypted identity automaton"""
-    cache: FidesopsRedis = get_cache()
-    logger.info("Setting automaton cache signal")
-    cache.set_with_autoexpire(
-        key=AUTOMATON_SIGNAL_CACHE_KEY,
-        value="true",
-        expire_time=10800,  # 3 hrs
+    candidates = db.query(ProvidedIdentity).filter(
+        ProvidedIdentity.id.in_(
+            db.query(IdentitySearchIndex.provided_identity_id).filter(matches)
+        )
     )
-
-
-def remove_refresh_automaton_signal() -> None:
-    """Remove should refresh automaton signal from cache for testing"""
-    cache: FidesopsRedis = get_cache()
-    cache.delete_keys_by_prefix(AUTOMATON_SIGNAL_CACHE_KEY)
-
-
-def get_should_refresh_automaton() -> bool:
-    """Returns whether we should refresh our decrypted identity automaton"""
-    cache: FidesopsRedis = get_cache()
-    result = cache.get(AUTOMATON_SIGNAL_CACHE_KEY)
-    if result:
-        return False
-    return True
-
-
-def _add_decrypted_identities_to_automaton(
-    identities: Optional[Dict[str, Any]],
-    request_id: str,
-    automaton: ahocorasick.Automaton,  # pylint: disable=c-extension-no-member
-) -> None:
-    if not identities or not identities.items():
-        return
-    for key, value in identities.items():  # pylint: disable=W0612
-        if value:
-            if automaton.exists(value):
-                existing: List[str] = automaton.get(value)  # value = decrypted identity
-                existing.append(str(request_id))
-                # overwrites the previously found key, updates with new request id
-                automaton.add_word(value, existing)
-            else:
-                automaton.add_word(value, [request_id])
+    return {
+        candidate.privacy_request_id
+        for candidate in candidates
+        if candidate.privacy_request_id
+        and str((candidate.encrypted_value or {}).get("value")).startswith(prefix)
+    }
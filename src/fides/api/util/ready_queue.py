@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class ReadyQueue(Generic[K, T]):
+    """A LILO queue of keyed values that only pops values whose dependencies have all been released.
+
+    Each key can be given a number of outstanding blockers. A queued value becomes ready once its
+    blocker count drops to zero, and ready values are popped in the order they were first pushed.
+    This gives the same ordering as scanning a list for the first runnable value, but pushes, pops
+    and releases don't need to look at every queued value.
+    """
+
+    def __init__(self, blocker_counts: Optional[Dict[K, int]] = None):
+        self.blocker_counts: Dict[K, int] = dict(blocker_counts or {})
+        self._queued: Dict[K, Tuple[int, T]] = {}
+        self._ready: List[Tuple[int, K]] = []
+        self._sequence = 0
+
+    def push_if_new(self, key: K, value: T) -> None:
+        """insert into the queue only if this key is not already in the queue."""
+        if key in self._queued:
+            return
+        self._queued[key] = (self._sequence, value)
+        if not self.blocker_counts.get(key):
+            heapq.heappush(self._ready, (self._sequence, key))
+        self._sequence += 1
+
+    def release(self, key: K) -> None:
+        """Remove one blocker from the given key, marking it ready if it is queued and has no blockers left."""
+        remaining = self.blocker_counts.get(key, 0) - 1
+        self.blocker_counts[key] = remaining
+        if remaining == 0 and key in self._queued:
+            heapq.heappush(self._ready, (self._queued[key][0], key))
+
+    def pop_ready(self) -> Optional[T]:
+        """Pop the earliest pushed value with no blockers, or return None if no queued value is ready."""
+        if not self._ready:
+            return None
+        _, key = heapq.heappop(self._ready)
+        return self._queued.pop(key)[1]
+
+    def is_empty(self) -> bool:
+        """is the queue empty?"""
+        return len(self._queued) == 0
+
+    @property
+    def data(self) -> List[T]:
+        """Values currently in the queue, in the order they were pushed"""
+        return [value for _, value in self._queued.values()]
+
+    def __repr__(self) -> str:
+        return f"ReadyQueue {self.data}"
@@ -69,4 +69,39 @@ class ExecutionSettings(FidesSettings):
         default=True,
         description="Whether fuzzy search is enabled for privacy request lookups.",
     )
+    saas_connection_pool_size: int = Field(
+        default=10,
+        gt=0,
+        description="The number of keep-alive HTTP connections each SaaS connector keeps open per host.",
+    )
+    mongodb_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of documents the MongoDB connector fetches per cursor batch and masks per bulk write.",
+    )
+    bigquery_partition_query_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="The maximum number of partition queries the BigQuery connector runs at once for a partitioned collection.",
+    )
+    sql_stream_batch_size: int = Field(
+        default=1000,
+        ge=0,
+        description="The number of rows SQL connectors fetch at a time from a server-side cursor during access requests. Set to 0 to fetch each result set at once.",
+    )
+    max_rows_per_collection: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of rows SQL connectors retrieve from a single collection during an access request, across all partitions of a partitioned BigQuery collection. Rows past the limit are not fetched.",
+    )
+    dsr_data_removal_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of rows the DSR data removal task deletes or clears per batch. Each batch is committed on its own.",
+    )
+    dsr_data_removal_batch_sleep_seconds: float = Field(
+        default=0.1,
+        ge=0,
+        description="Seconds the DSR data removal task sleeps between batches, to limit its load on the database.",
+    )
     model_config = SettingsConfigDict(env_prefix=ENV_PREFIX)
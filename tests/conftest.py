@@ -31,6 +31,7 @@ from fides.api.cryptography.schemas.jwt import (
 )
 from fides.api.db.ctl_session import sync_engine
 from fides.api.db.system import create_system
+from fides.api.graph.execution import clear_hydrated_node_cache
 from fides.api.main import app
 from fides.api.models.privacy_request import (
     EXITED_EXECUTION_LOG_STATUSES,
@@ -42,6 +43,7 @@ from fides.api.models.sql_models import Cookies, DataUse, PrivacyDeclaration
 from fides.api.oauth.jwt import generate_jwe
 from fides.api.oauth.roles import APPROVER, CONTRIBUTOR, OWNER, VIEWER_AND_APPROVER
 from fides.api.schemas.messaging.messaging import MessagingServiceType
+from fides.api.service.authentication.oauth2_token_cache import clear_oauth2_token_cache
 from fides.api.task.graph_runners import access_runner, consent_runner, erasure_runner
 from fides.api.tasks import celery_app
 from fides.api.tasks.scheduled.scheduler import async_scheduler, scheduler
@@ -378,6 +380,16 @@ def clear_get_config_cache() -> None:
     get_config.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_oauth2_tokens() -> None:
+    clear_oauth2_token_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_hydrated_nodes() -> None:
+    clear_hydrated_node_cache()
+
+
 @pytest.fixture(scope="session")
 def test_config_path():
     yield TEST_CONFIG_PATH
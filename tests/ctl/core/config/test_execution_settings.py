@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 from fides.config.execution_settings import ExecutionSettings
 
@@ -37,3 +38,20 @@ class TestExecutionSettings:
 
         settings = ExecutionSettings(**kwargs)
         assert settings.disable_consent_identity_verification is expected
+
+    @pytest.mark.parametrize(
+        "setting, value",
+        [
+            ("dsr_data_removal_batch_size", 0),
+            ("dsr_data_removal_batch_sleep_seconds", -1),
+            ("mongodb_batch_size", 0),
+            ("bigquery_partition_query_concurrency", 0),
+            ("saas_connection_pool_size", 0),
+            ("sql_stream_batch_size", -1),
+            ("max_rows_per_collection", 0),
+            ("max_rows_per_collection", -1),
+        ],
+    )
+    def test_invalid_batch_settings(self, setting, value):
+        with pytest.raises(ValidationError):
+            ExecutionSettings(**{setting: value})
@@ -27,11 +27,15 @@ from fides.api.cryptography.schemas.jwt import (
 from fides.api.db.seed import get_client_id, load_default_access_policy
 from fides.api.graph.config import CollectionAddress
 from fides.api.graph.graph import DatasetGraph
+from fides.api.migrations.identity_search_index_job import (
+    backfill_identity_search_index,
+)
 from fides.api.models.application_config import ApplicationConfig
 from fides.api.models.audit_log import AuditLog, AuditLogAction
 from fides.api.models.client import ClientDetail
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.models.identity_search_index import IdentitySearchIndex
 from fides.api.models.policy import Policy
 from fides.api.models.pre_approval_webhook import PreApprovalWebhookReply
 from fides.api.models.privacy_request import (
@@ -61,11 +65,6 @@ from fides.api.task.graph_runners import access_runner
 from fides.api.tasks import DSR_QUEUE_NAME, MESSAGING_QUEUE_NAME
 from fides.api.util.cache import get_encryption_cache_key, get_masking_secret_cache_key
 from fides.api.util.data_category import get_user_data_categories
-from fides.api.util.fuzzy_search_utils import (
-    get_should_refresh_automaton,
-    manually_reset_automaton,
-    remove_refresh_automaton_signal,
-)
 from fides.common.api.scope_registry import (
     DATASET_CREATE_OR_UPDATE,
     DATASET_TEST,
@@ -1325,7 +1324,7 @@ class TestGetPrivacyRequests:
 
     # FIXME: don't skip this
     @pytest.mark.skip("skip until PROD-2811 is done")
-    def test_fuzzy_search_bulk_privacy_requests_cache_exists(
+    def test_fuzzy_search_bulk_privacy_requests(
         self,
         db,
         api_client,
@@ -1365,14 +1364,10 @@ class TestGetPrivacyRequests:
             db=db,
             identity=Identity(email=TEST_EMAIL_4, phone_number=TEST_PHONE_4),
         )
-        # Persisting identities automatically adds to Automaton and sets cache signal,
-        # so at this point we expect cache to exist
-        assert get_should_refresh_automaton() is False
-
         auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
 
         # Test two matches on email
-        FUZZY_SEARCH_STR_1 = "te"
+        FUZZY_SEARCH_STR_1 = "test-"
         response = api_client.get(
             url + f"?fuzzy_search_str={FUZZY_SEARCH_STR_1}",
             headers=auth_header,
@@ -1485,9 +1480,7 @@ class TestGetPrivacyRequests:
             result["id"] for result in resp["items"]
         ]
 
-    # FIXME: don't skip this
-    @pytest.mark.skip("skip until PROD-2811 is done")
-    def test_fuzzy_search_privacy_requests_no_cache(
+    def test_fuzzy_search_privacy_requests_after_backfill(
         self,
         db,
         api_client,
@@ -1504,30 +1497,94 @@ class TestGetPrivacyRequests:
             identity=Identity(email=TEST_EMAIL, phone_number=TEST_PHONE),
         )
 
-        # Manually remove cache signal and set global _automaton to None
-        remove_refresh_automaton_signal()
-        manually_reset_automaton()
-
-        assert get_should_refresh_automaton() is True
+        # Manually clear the search index, as if the identities predate it
+        db.query(IdentitySearchIndex).delete()
+        db.commit()
 
         auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
 
-        # test partial prefix match on email
         FUZZY_SEARCH_STR_1 = "test"
         response = api_client.get(
             url + f"?fuzzy_search_str={FUZZY_SEARCH_STR_1}",
             headers=auth_header,
         )
         assert 200 == response.status_code
+        assert privacy_request.id not in [
+            result["id"] for result in response.json()["items"]
+        ]
+
+        assert backfill_identity_search_index(db, batch_size=1) > 0
+
+        # test partial prefix match on email
+        response = api_client.get(
+            url + f"?fuzzy_search_str={FUZZY_SEARCH_STR_1}",
+            headers=auth_header,
+        )
+        assert 200 == response.status_code
         resp = response.json()
         assert privacy_request.id in [result["id"] for result in resp["items"]]
 
-        # Test that the privacy request identities are automatically put in the cache as a side-effect of fuzzy-search
-        identities = (
-            privacy_request.retrieve_decrypted_identities_from_cache_by_privacy_request()
+        # the backfill only indexes identities that are not indexed yet
+        assert backfill_identity_search_index(db) == 0
+
+    def test_fuzzy_search_privacy_requests_long_search_string(
+        self,
+        db,
+        api_client,
+        url,
+        generate_auth_header,
+        privacy_request,
+    ):
+        TEST_EMAIL = f"{'a' * 70}-happy@example.com"
+        privacy_request.persist_identity(
+            db=db,
+            identity=Identity(email=TEST_EMAIL),
+        )
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+
+        # search strings past the indexed prefix length are checked against the identity
+        for search_str, matches in [
+            (TEST_EMAIL[:66], True),
+            (TEST_EMAIL, True),
+            (f"{'a' * 70}-sad", False),
+        ]:
+            response = api_client.get(
+                url + f"?fuzzy_search_str={search_str}",
+                headers=auth_header,
+            )
+            assert 200 == response.status_code
+            assert (
+                privacy_request.id in [item["id"] for item in response.json()["items"]]
+            ) is matches
+
+    def test_fuzzy_search_privacy_requests_short_search_string(
+        self,
+        db,
+        api_client,
+        url,
+        generate_auth_header,
+        privacy_request,
+    ):
+        privacy_request.persist_identity(
+            db=db,
+            identity=Identity(email="test-happy@example.com"),
         )
-        assert identities["email"] == TEST_EMAIL
-        assert identities["phone_number"] == TEST_PHONE
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+
+        # search strings shorter than the indexed prefixes only match privacy request ids
+        for search_str, matches in [
+            ("te", False),
+            ("tes", True),
+            (privacy_request.id[:2], True),
+        ]:
+            response = api_client.get(
+                url + f"?fuzzy_search_str={search_str}",
+                headers=auth_header,
+            )
+            assert 200 == response.status_code
+            assert (
+                privacy_request.id in [item["id"] for item in response.json()["items"]]
+            ) is matches
 
     def test_filter_privacy_requests_by_external_id(
         self,
@@ -1954,6 +2011,42 @@ class TestGetPrivacyRequests:
 
         privacy_request.delete(db)
 
+    @mock.patch(
+        "fides.api.api.v1.endpoints.privacy_request_endpoints.PRIVACY_REQUEST_CSV_BATCH_SIZE",
+        2,
+    )
+    def test_get_privacy_requests_csv_in_batches(
+        self, db, generate_auth_header, api_client, url, privacy_requests, user
+    ):
+        denied_request = privacy_requests[0]
+        denied_request.status = PrivacyRequestStatus.denied
+        denied_request.save(db)
+        denial_audit_log = AuditLog.create(
+            db=db,
+            data={
+                "user_id": user.id,
+                "privacy_request_id": denied_request.id,
+                "action": AuditLogAction.denied,
+                "message": "Not a customer",
+            },
+        )
+
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(url + f"?download_csv=True", headers=auth_header)
+        assert 200 == response.status_code
+
+        rows = {
+            row["Request ID"]: row
+            for row in csv.DictReader(io.StringIO(response.content.decode()))
+        }
+        assert {pr.id for pr in privacy_requests} <= rows.keys()
+        assert rows[denied_request.id]["Status"] == "denied"
+        assert rows[denied_request.id]["Denial Reason"] == "Not a customer"
+        assert rows[privacy_requests[1].id]["Denial Reason"] == ""
+        assert rows[privacy_requests[2].id]["Request Type"] == "access"
+
+        denial_audit_log.delete(db)
+
     def test_get_privacy_requests_csv_format_max_rows_limit(
         self,
         db,
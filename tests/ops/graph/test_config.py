@@ -369,6 +369,52 @@ class TestCollection:
             ],  # Applies to a nested field
         }
 
+    def test_collection_field_index(self):
+        ds = Collection(
+            name="t3",
+            fields=[
+                ScalarField(name="f1", primary_key=True, identity="email"),
+                ScalarField(name="f2", data_categories=["user"]),
+                ObjectField(
+                    name="f3",
+                    fields={
+                        "f4": ScalarField(
+                            name="f4", primary_key=True, data_categories=["user"]
+                        )
+                    },
+                ),
+            ],
+        )
+        index = CollectionFieldIndex.build(ds)
+
+        assert index.field_dict == ds.field_dict
+        assert index.identities == ds.identities()
+        assert index.references == ds.references()
+        assert index.custom_request_fields == ds.custom_request_fields()
+        assert index.field_paths_by_category == ds.field_paths_by_category
+        assert index.primary_keys == {
+            FieldPath("f1"): ds.fields[0],
+            FieldPath("f3", "f4"): ds.fields[2].fields["f4"],
+        }
+        assert index.field(FieldPath("f3", "f4")) is ds.fields[2].fields["f4"]
+        assert index.field(FieldPath("f5")) is None
+
+    def test_collection_field_index_is_a_snapshot(self):
+        ds = Collection(
+            name="t3",
+            fields=[ScalarField(name="f1", identity="email")],
+        )
+        index = CollectionFieldIndex.build(ds)
+
+        ds.fields = [ScalarField(name="f2", data_categories=["user"])]
+
+        # the collection reflects the new fields, the index keeps the ones it was built from
+        assert ds.identities() == {}
+        assert ds.field(FieldPath("f1")) is None
+        assert ds.field_paths_by_category == {"user": [FieldPath("f2")]}
+        assert index.identities == {FieldPath("f1"): "email"}
+        assert index.field(FieldPath("f2")) is None
+
     def test_collection_json(self):
         json_collection = json.loads(
             collection_to_serialize.model_dump_json(serialize_as_any=True)
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph_cache import (
+    DatasetGraphCache,
+    clear_dataset_graph_cache,
+    get_dataset_graph,
+)
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.datasetconfig import DatasetConfig
+
+
+class TestDatasetGraphCache:
+    @pytest.fixture
+    def cache(self) -> DatasetGraphCache:
+        return DatasetGraphCache()
+
+    def test_graph_reused_while_datasets_unchanged(
+        self, db: Session, cache: DatasetGraphCache, dataset_config: DatasetConfig
+    ):
+        dataset_graph = cache.get(db)
+        assert CollectionAddress(dataset_config.fides_key, "subscriptions") in set(
+            dataset_graph.nodes.keys()
+        )
+        assert cache.get(db) is dataset_graph
+
+    def test_graph_rebuilt_when_dataset_version_changes(
+        self, db: Session, cache: DatasetGraphCache, dataset_config: DatasetConfig
+    ):
+        dataset_graph = cache.get(db)
+
+        # Simulate a write from another process, which skips this process' listeners
+        dataset_config.updated_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+        db.add(dataset_config)
+        db.commit()
+
+        assert cache.get(db) is not dataset_graph
+
+    def test_disabled_connections_excluded(
+        self,
+        db: Session,
+        cache: DatasetGraphCache,
+        dataset_config: DatasetConfig,
+        connection_config: ConnectionConfig,
+    ):
+        address = CollectionAddress(dataset_config.fides_key, "subscriptions")
+        assert address in cache.get(db).nodes
+
+        connection_config.disabled = True
+        connection_config.save(db)
+
+        assert address not in cache.get(db).nodes
+        assert address in cache.get(db, include_disabled=True).nodes
+
+        connection_config.disabled = False
+        connection_config.save(db)
+
+    def test_writes_clear_process_cache(
+        self,
+        db: Session,
+        dataset_config: DatasetConfig,
+        connection_config: ConnectionConfig,
+    ):
+        clear_dataset_graph_cache()
+        dataset_graph = get_dataset_graph(db)
+        assert get_dataset_graph(db) is dataset_graph
+
+        connection_config.update(db, data={"description": "Updated description"})
+        assert get_dataset_graph(db) is not dataset_graph
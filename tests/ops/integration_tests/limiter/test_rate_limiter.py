@@ -25,6 +25,7 @@ from fides.api.service.connectors.limiter.rate_limiter import (
     RateLimiterTimeoutException,
 )
 from fides.api.task.graph_runners import access_runner
+from fides.api.util.cache import get_cache
 from fides.api.util.saas_util import (
     load_config_with_replacement,
     load_dataset_with_replacement,
@@ -116,6 +117,24 @@ def simulate_calls_with_limiter(
     return call_log
 
 
+def assert_rate_limit_respected(call_log: Dict[int, int], rate_limit: int) -> None:
+    """
+    Verifies the calls per second in a call log. Besides the evenly spread calls, any
+    number of consecutive seconds may also contain an initial burst of up to rate_limit calls.
+    """
+    seconds = sorted(call_log)
+    for start, first_second in enumerate(seconds):
+        for last_second in seconds[start:]:
+            calls = sum(
+                call_log[second]
+                for second in seconds
+                if first_second <= second <= last_second
+            )
+            # even though we set the rate limit there is a small chance our
+            # seconds dont line up with the second used by the rate limiter
+            assert calls < (last_second - first_second + 2) * rate_limit + 3
+
+
 @pytest.mark.integration
 def test_limiter_respects_rate_limit() -> None:
     """Make a number of calls which requires limiter slow down and verify limit is not breached"""
@@ -133,10 +152,7 @@ def test_limiter_respects_rate_limit() -> None:
     )
 
     assert sum(call_log.values()) == num_calls
-    for value in call_log.values():
-        # even though we set the rate limit at 100 there is a small chance our
-        # seconds dont line up with the second used by the rate limiter
-        assert value < rate_limit + 3
+    assert_rate_limit_respected(call_log, rate_limit)
 
 
 @pytest.mark.integration
@@ -167,8 +183,7 @@ def test_limiter_respects_rate_limit_multiple_threads() -> None:
         total_counts += Counter(call_future.result())
 
     assert sum(total_counts.values()) == num_calls_per_thread * concurrent_executions
-    for value in total_counts.values():
-        assert value < rate_limit + 3
+    assert_rate_limit_respected(total_counts, rate_limit)
 
 
 @pytest.mark.integration
@@ -195,8 +210,7 @@ def test_limiter_with_multiple_limits() -> None:
     )
 
     assert sum(call_log.values()) == num_calls
-    for value in call_log.values():
-        assert value < rate_limit_2 + 3
+    assert_rate_limit_respected(call_log, rate_limit_2)
 
 
 @pytest.mark.integration
@@ -218,6 +232,69 @@ def test_limiter_times_out_when_bucket_full() -> None:
             time.sleep(0.002)
 
 
+@pytest.mark.integration
+def test_limiter_sleeps_once_for_exact_wait(loguru_caplog) -> None:
+    """Breach a limit and verify the limiter sleeps once until a call is available"""
+    limiter: RateLimiter = RateLimiter()
+    key = f"my_test_key_{random.random()}"
+    requests = [
+        RateLimiterRequest(key=key, rate_limit=2, period=RateLimiterPeriod.SECOND)
+    ]
+    limiter.limit(requests=requests)
+    limiter.limit(requests=requests)
+
+    with mock.patch(
+        "fides.api.service.connectors.limiter.rate_limiter.time.sleep",
+        wraps=time.sleep,
+    ) as mock_sleep:
+        limiter.limit(requests=requests)
+
+    mock_sleep.assert_called_once()
+    wait_seconds = mock_sleep.call_args[0][0]
+    assert 0 < wait_seconds <= 1
+    assert RateLimiter.throttled_seconds[key] == wait_seconds
+    assert (
+        f"Waited {round(wait_seconds, 3)} seconds for rate limits" in loguru_caplog.text
+    )
+
+
+@pytest.mark.integration
+def test_limiter_reserves_all_limits_or_none() -> None:
+    """Verify a call is not counted against any limit when one of its limits is breached"""
+    limiter: RateLimiter = RateLimiter()
+    key = f"my_test_key_{random.random()}"
+    hourly = RateLimiterRequest(key=key, rate_limit=1, period=RateLimiterPeriod.HOUR)
+    daily = RateLimiterRequest(key=key, rate_limit=2, period=RateLimiterPeriod.DAY)
+
+    limiter.limit(requests=[hourly, daily])
+    with pytest.raises(RateLimiterTimeoutException):
+        limiter.limit(requests=[hourly, daily], timeout_seconds=1)
+
+    # the breached call was not counted against the daily limit
+    limiter.limit(requests=[daily], timeout_seconds=1)
+
+
+@pytest.mark.integration
+def test_limiter_stores_one_value_per_limit() -> None:
+    """Verify each limit only stores the theoretical arrival time of its next call"""
+    limiter: RateLimiter = RateLimiter()
+    request = RateLimiterRequest(
+        key=f"my_test_key_{random.random()}",
+        rate_limit=100,
+        period=RateLimiterPeriod.DAY,
+    )
+    for _ in range(10):
+        limiter.limit(requests=[request])
+
+    redis_key = limiter.build_redis_key(request)
+    cache = get_cache()
+    assert cache.type(redis_key) == "string"
+    # each call pushes the arrival time back by one interval of a day / 100
+    assert float(cache.get(redis_key)) - time.time() * 1000 == pytest.approx(
+        10 * 864_000, abs=1000
+    )
+
+
 @pytest.mark.integration_saas
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
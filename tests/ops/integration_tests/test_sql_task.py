@@ -393,6 +393,61 @@ async def test_postgres_access_request_task(
     )
 
 
+@pytest.fixture(scope="function")
+def streamed_rows_with_limit():
+    original_batch_size = CONFIG.execution.sql_stream_batch_size
+    original_max_rows = CONFIG.execution.max_rows_per_collection
+    CONFIG.execution.sql_stream_batch_size = 1
+    CONFIG.execution.max_rows_per_collection = 2
+    yield
+    CONFIG.execution.sql_stream_batch_size = original_batch_size
+    CONFIG.execution.max_rows_per_collection = original_max_rows
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "dsr_version",
+    ["use_dsr_3_0", "use_dsr_2_0"],
+)
+async def test_postgres_access_request_task_row_limit(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+    privacy_request,
+    dsr_version,
+    request,
+    streamed_rows_with_limit,
+    loguru_caplog,
+) -> None:
+    """Rows are streamed one at a time and no more than two are retrieved from any collection"""
+    request.getfixturevalue(dsr_version)  # REQUIRED to test both DSR 3.0 and 2.0
+
+    v = access_runner_tester(
+        privacy_request,
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        {"email": "customer-1@example.com"},
+        db,
+    )
+
+    # customer-1 has three orders
+    assert_rows_match(
+        v["postgres_example:orders"],
+        min_size=2,
+        keys=["id", "customer_id", "shipping_address_id", "payment_card_id"],
+    )
+    assert len(v["postgres_example:orders"]) == 2
+    assert v["postgres_example:customer"][0]["email"] == "customer-1@example.com"
+    assert (
+        "Retrieved the maximum of 2 rows from postgres_example:orders"
+        in loguru_caplog.text
+    )
+
+
 @pytest.mark.integration_postgres
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from fides.api.migrations.identity_search_index_job import (
+    backfill_identity_search_index,
+)
+from fides.api.models.identity_search_index import IdentitySearchIndex
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.util.fuzzy_search_utils import (
+    MAX_INDEXED_PREFIX_LENGTH,
+    MIN_INDEXED_PREFIX_LENGTH,
+    hash_identity_prefix,
+)
+
+
+@pytest.fixture
+def unindexed_provided_identities(db: Session, privacy_request):
+    provided_identities = [
+        ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": privacy_request.id,
+                "field_name": field_name,
+                "hashed_value": ProvidedIdentity.hash_value(value),
+                "encrypted_value": {"value": value},
+            },
+        )
+        for field_name, value in [
+            ("email", "backfill@example.com"),
+            ("phone_number", "+15555555555"),
+            ("external_id", "x" * (MAX_INDEXED_PREFIX_LENGTH + 10)),
+        ]
+    ]
+    yield provided_identities
+    for provided_identity in provided_identities:
+        provided_identity.delete(db)
+
+
+class TestIdentitySearchIndexBackfill:
+    def get_prefix_hashes(self, db: Session, provided_identity: ProvidedIdentity):
+        return {
+            row.prefix_hash
+            for row in db.query(IdentitySearchIndex).filter(
+                IdentitySearchIndex.provided_identity_id == provided_identity.id
+            )
+        }
+
+    def test_backfill_identity_search_index(
+        self, db: Session, unindexed_provided_identities
+    ):
+        email, phone_number, external_id = unindexed_provided_identities
+        assert not self.get_prefix_hashes(db, email)
+
+        # the batches page past identities that were already indexed
+        assert backfill_identity_search_index(db, batch_size=2) >= 3
+
+        assert self.get_prefix_hashes(db, email) == {
+            hash_identity_prefix("backfill@example.com"[:length])
+            for length in range(
+                MIN_INDEXED_PREFIX_LENGTH, len("backfill@example.com") + 1
+            )
+        }
+        assert hash_identity_prefix("b") not in self.get_prefix_hashes(db, email)
+        assert hash_identity_prefix("+1555") in self.get_prefix_hashes(db, phone_number)
+        assert (
+            len(self.get_prefix_hashes(db, external_id))
+            == MAX_INDEXED_PREFIX_LENGTH - MIN_INDEXED_PREFIX_LENGTH + 1
+        )
+
+        # identities that are already indexed are not indexed again
+        assert backfill_identity_search_index(db) == 0
+
+    def test_backfill_resumes_after_interruption(
+        self, db: Session, unindexed_provided_identities
+    ):
+        class Interrupted(Exception):
+            pass
+
+        def interrupt():
+            raise Interrupted()
+
+        with pytest.raises(Interrupted):
+            backfill_identity_search_index(
+                db, batch_size=1, on_batch_complete=interrupt
+            )
+
+        # the committed batch is kept, the rest are indexed by the next run
+        indexed = [
+            provided_identity
+            for provided_identity in unindexed_provided_identities
+            if self.get_prefix_hashes(db, provided_identity)
+        ]
+        assert len(indexed) <= 1
+        backfill_identity_search_index(db)
+        for provided_identity in unindexed_provided_identities:
+            assert self.get_prefix_hashes(db, provided_identity)
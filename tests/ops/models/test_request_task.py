@@ -2,6 +2,7 @@ import json
 from unittest import mock
 
 import pytest
+from sqlalchemy import inspect
 
 from fides.api.graph.config import (
     ROOT_COLLECTION_ADDRESS,
@@ -166,6 +167,66 @@ class TestRequestTask:
         assert terminator_task.upstream_tasks_complete(db)
         assert terminator_task.can_queue_request_task(db)
 
+    @mock.patch("fides.api.util.cache.celery_app.control.inspect.query_task")
+    def test_get_queueable_downstream_tasks(self, query_task_mock, db, request_task):
+        root_task = request_task.get_tasks_with_same_action_type(
+            db, ROOT_COLLECTION_ADDRESS.value
+        ).first()
+        terminator_task = request_task.get_tasks_with_same_action_type(
+            db, TERMINATOR_ADDRESS.value
+        ).first()
+        query_task_mock.return_value = {"@celery1234": {}}
+
+        # The terminator task is still waiting on the pending request task
+        assert root_task.get_queueable_downstream_tasks(db) == [request_task]
+        assert request_task.get_queueable_downstream_tasks(db) == []
+
+        # Queued tasks that are still in flight are left out
+        cache_task_tracking_key(request_task.id, "test_5678")
+        query_task_mock.return_value = {"@celery1234": {"test_5678": ["reserved", {}]}}
+        assert root_task.get_queueable_downstream_tasks(db) == []
+        assert query_task_mock.call_count == 1
+
+        query_task_mock.return_value = {"@celery1234": {"test_5678": ["completed", {}]}}
+        assert root_task.get_queueable_downstream_tasks(db) == [request_task]
+
+        request_task.update_status(db, ExecutionLogStatus.complete)
+        assert request_task.get_queueable_downstream_tasks(db) == [terminator_task]
+
+    def test_get_task_statuses(self, db, request_task):
+        assert request_task.get_task_statuses(
+            db,
+            [
+                ROOT_COLLECTION_ADDRESS.value,
+                request_task.collection_address,
+                "nonexistent:collection",
+            ],
+        ) == {
+            ROOT_COLLECTION_ADDRESS.value: ExecutionLogStatus.complete,
+            request_task.collection_address: ExecutionLogStatus.pending,
+        }
+        assert request_task.get_task_statuses(db, []) == {}
+
+    def test_task_data_deferred(self, db, request_task):
+        request_task.access_data = [{"name": "Jane"}]
+        request_task.data_for_erasures = [{"name": "Jane", "id": 1}]
+        request_task.save(db)
+        db.expire(request_task)
+
+        task = db.query(RequestTask).filter(RequestTask.id == request_task.id).first()
+        assert {"access_data", "data_for_erasures"} <= inspect(task).unloaded
+
+        upstream_task = task.get_tasks_with_same_action_type(
+            db, TERMINATOR_ADDRESS.value
+        ).first()
+        loaded_task = upstream_task.upstream_tasks_objects(db).first()
+        assert loaded_task is task
+        assert "access_data" not in inspect(task).unloaded
+        assert "data_for_erasures" in inspect(task).unloaded
+
+        # Deferred columns are still loaded on access
+        assert task.get_data_for_erasures() == [{"name": "Jane", "id": 1}]
+
     def test_update_status(self, db, request_task):
         assert request_task.status == ExecutionLogStatus.pending
         request_task.update_status(db, ExecutionLogStatus.complete)
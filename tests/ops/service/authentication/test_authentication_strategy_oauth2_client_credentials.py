@@ -8,12 +8,14 @@ from requests import PreparedRequest, Request
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import FidesopsException, OAuth2TokenException
+from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.service.authentication.authentication_strategy import (
     AuthenticationStrategy,
 )
 from fides.api.service.authentication.authentication_strategy_oauth2_client_credentials import (
     OAuth2ClientCredentialsAuthenticationStrategy,
 )
+from fides.api.service.authentication.oauth2_token_cache import oauth2_token_cache
 
 
 class TestAddAuthentication:
@@ -215,6 +217,173 @@ class TestAddAuthentication:
             == f"Unable to retrieve token for {oauth2_client_credentials_connection_config.key} (invalid_request)."
         )
 
+    # a token refreshed through one connection config is reused by the others
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_oauth2_authentication_uses_cached_token(
+        self,
+        mock_send: Mock,
+        db: Session,
+        oauth2_client_credentials_connection_config,
+        oauth2_client_credentials_configuration,
+    ):
+        mock_send().json.return_value = {
+            "access_token": "new_access",
+            "expires_in": 3600,
+        }
+        mock_send.reset_mock()
+
+        # expire the access token
+        oauth2_client_credentials_connection_config.secrets["expires_at"] = 0
+        auth_strategy = AuthenticationStrategy.get_strategy(
+            "oauth2_client_credentials", oauth2_client_credentials_configuration
+        )
+        req: PreparedRequest = Request(method="POST", url="https://localhost").prepare()
+        auth_strategy.add_authentication(
+            req, oauth2_client_credentials_connection_config
+        )
+        assert mock_send.call_count == 1
+
+        # a stale copy of the connection config uses the cached token
+        stale_connection_config = ConnectionConfig(
+            key=oauth2_client_credentials_connection_config.key,
+            secrets={
+                **oauth2_client_credentials_connection_config.secrets,
+                "access_token": "access",
+                "expires_at": 0,
+            },
+        )
+        req = Request(method="POST", url="https://localhost").prepare()
+        authenticated_request = auth_strategy.add_authentication(
+            req, stale_connection_config
+        )
+        assert authenticated_request.headers["Authorization"] == "Bearer new_access"
+        assert mock_send.call_count == 1
+
+    # the token was refreshed by another worker and stored in the database
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_oauth2_authentication_uses_persisted_token(
+        self,
+        mock_send: Mock,
+        db: Session,
+        oauth2_client_credentials_connection_config,
+        oauth2_client_credentials_configuration,
+    ):
+        expires_at = int((datetime.utcnow() + timedelta(hours=1)).timestamp())
+        oauth2_client_credentials_connection_config.update(
+            db,
+            data={
+                "secrets": {
+                    **oauth2_client_credentials_connection_config.secrets,
+                    "access_token": "other_worker_access",
+                    "expires_at": expires_at,
+                }
+            },
+        )
+
+        # the in-memory secrets are stale
+        oauth2_client_credentials_connection_config.secrets["expires_at"] = 0
+        auth_strategy = AuthenticationStrategy.get_strategy(
+            "oauth2_client_credentials", oauth2_client_credentials_configuration
+        )
+        req: PreparedRequest = Request(method="POST", url="https://localhost").prepare()
+        authenticated_request = auth_strategy.add_authentication(
+            req, oauth2_client_credentials_connection_config
+        )
+        assert (
+            authenticated_request.headers["Authorization"]
+            == "Bearer other_worker_access"
+        )
+        mock_send.assert_not_called()
+
+    # the connection was authorized again after its previous token was cached
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_oauth2_authentication_ignores_cached_token_after_reauthorization(
+        self,
+        mock_send: Mock,
+        db: Session,
+        oauth2_client_credentials_connection_config,
+        oauth2_client_credentials_configuration,
+    ):
+        mock_send().json.return_value = {
+            "access_token": "new_access",
+            "expires_in": 7200,
+        }
+        mock_send.reset_mock()
+
+        oauth2_client_credentials_connection_config.secrets["expires_at"] = 0
+        auth_strategy = AuthenticationStrategy.get_strategy(
+            "oauth2_client_credentials", oauth2_client_credentials_configuration
+        )
+        req: PreparedRequest = Request(method="POST", url="https://localhost").prepare()
+        auth_strategy.add_authentication(
+            req, oauth2_client_credentials_connection_config
+        )
+        assert mock_send.call_count == 1
+
+        # the new token expires before the cached one, which may have been revoked
+        reauthorized_connection_config = ConnectionConfig(
+            key=oauth2_client_credentials_connection_config.key,
+            secrets={
+                **oauth2_client_credentials_connection_config.secrets,
+                "access_token": "reauthorized_access",
+                "expires_at": int((datetime.utcnow() + timedelta(hours=1)).timestamp()),
+            },
+        )
+        req = Request(method="POST", url="https://localhost").prepare()
+        authenticated_request = auth_strategy.add_authentication(
+            req, reauthorized_connection_config
+        )
+        assert (
+            authenticated_request.headers["Authorization"]
+            == "Bearer reauthorized_access"
+        )
+        assert oauth2_token_cache.get(reauthorized_connection_config) is None
+        assert mock_send.call_count == 1
+
+    # another worker holds the refresh lock for longer than expected
+    @mock.patch(
+        "fides.api.service.authentication.authentication_strategy_oauth2_base.get_cache"
+    )
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_oauth2_authentication_refresh_lock_timeout(
+        self,
+        mock_send: Mock,
+        mock_get_cache: Mock,
+        db: Session,
+        oauth2_client_credentials_connection_config,
+        oauth2_client_credentials_configuration,
+    ):
+        mock_send().json.return_value = {
+            "access_token": "new_access",
+            "expires_in": 3600,
+        }
+        mock_send.reset_mock()
+        mock_lock = mock_get_cache.return_value.lock.return_value
+        mock_lock.acquire.return_value = False
+
+        oauth2_client_credentials_connection_config.secrets["expires_at"] = 0
+        auth_strategy = AuthenticationStrategy.get_strategy(
+            "oauth2_client_credentials", oauth2_client_credentials_configuration
+        )
+        req: PreparedRequest = Request(method="POST", url="https://localhost").prepare()
+        authenticated_request = auth_strategy.add_authentication(
+            req, oauth2_client_credentials_connection_config
+        )
+        assert authenticated_request.headers["Authorization"] == "Bearer new_access"
+        assert mock_send.call_count == 1
+        mock_lock.release.assert_not_called()
+
+    def test_oauth2_refresh_lock_per_connection(
+        self, oauth2_client_credentials_connection_config
+    ):
+        other_client_connection_config = ConnectionConfig(
+            key=oauth2_client_credentials_connection_config.key,
+            secrets={"client_id": "other_client"},
+        )
+        assert oauth2_token_cache.get_refresh_lock(
+            oauth2_client_credentials_connection_config
+        ) is oauth2_token_cache.get_refresh_lock(other_client_connection_config)
+
 
 class TestAccessTokenRequest:
     @mock.patch("datetime.datetime")
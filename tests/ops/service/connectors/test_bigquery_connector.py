@@ -1,18 +1,25 @@
 import logging
 from typing import Generator
+from unittest import mock
 
 import pytest
 from fideslang.models import Dataset
+from sqlalchemy import text
 
 from fides.api.graph.config import CollectionAddress
 from fides.api.graph.graph import DatasetGraph
 from fides.api.graph.traversal import Traversal
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
 from fides.api.models.datasetconfig import DatasetConfig, convert_dataset_to_graph
 from fides.api.models.privacy_request import PrivacyRequest, RequestTask
 from fides.api.schemas.namespace_meta.bigquery_namespace_meta import (
     BigQueryNamespaceMeta,
 )
 from fides.api.service.connectors.bigquery_connector import BigQueryConnector
+from fides.api.service.connectors.query_configs.bigquery_query_config import (
+    BigQueryQueryConfig,
+)
+from fides.config import CONFIG
 
 
 @pytest.mark.integration_external
@@ -225,3 +232,118 @@ class TestBigQueryConnector:
 
         assert len(results) == 1
         assert results[0]["email"] == "customer-1@example.com"
+
+
+class TestBigQueryPartitionedRetrieval:
+    """Runs partitioned_retrieval against a mocked engine"""
+
+    PARTITION_CLAUSES = [
+        "`created` > '2024-01-01'",
+        "`created` > '2023-01-01' AND `created` <= '2024-01-01'",
+        "`created` <= '2023-01-01'",
+    ]
+
+    @pytest.fixture
+    def connector(self) -> BigQueryConnector:
+        connector = BigQueryConnector(
+            ConnectionConfig(
+                key="bigquery_test", connection_type=ConnectionType.bigquery
+            )
+        )
+        connector.db_client = mock.MagicMock()
+        # each "result" is the statement that was executed, turned into a row below
+        connection = connector.db_client.connect.return_value.__enter__.return_value
+        connection.execute.side_effect = lambda stmt: stmt
+        return connector
+
+    @pytest.fixture
+    def query_config(self) -> BigQueryQueryConfig:
+        query_config = mock.create_autospec(BigQueryQueryConfig, instance=True)
+        query_config.get_partition_clauses.return_value = self.PARTITION_CLAUSES
+        query_config.node = mock.Mock(
+            address=CollectionAddress("bigquery_example_test_dataset", "customer")
+        )
+        return query_config
+
+    @pytest.fixture
+    def partition_query_concurrency(self, request) -> Generator:
+        original_value = CONFIG.execution.bigquery_partition_query_concurrency
+        CONFIG.execution.bigquery_partition_query_concurrency = request.param
+        yield request.param
+        CONFIG.execution.bigquery_partition_query_concurrency = original_value
+
+    @pytest.mark.parametrize("partition_query_concurrency", [1, 3], indirect=True)
+    def test_partitioned_retrieval(
+        self, connector, query_config, partition_query_concurrency
+    ):
+        stmt = text("SELECT email FROM customer WHERE email = :email").bindparams(
+            email="customer-1@example.com"
+        )
+        connection = mock.MagicMock()
+        connection.execute.side_effect = lambda stmt: stmt
+
+        with mock.patch.object(
+            BigQueryConnector,
+            "cursor_result_to_rows",
+            side_effect=lambda partitioned_stmt, max_rows: [
+                {
+                    "query": str(partitioned_stmt),
+                    "params": partitioned_stmt.compile().params,
+                }
+            ],
+        ):
+            rows = connector.partitioned_retrieval(query_config, connection, stmt)
+
+        # rows come back in partition order however the queries are run
+        assert [row["query"] for row in rows] == [
+            f"SELECT email FROM customer WHERE email = :email AND ({clause})"
+            for clause in self.PARTITION_CLAUSES
+        ]
+        assert all(row["params"] == {"email": "customer-1@example.com"} for row in rows)
+        if partition_query_concurrency == 1:
+            # run one after the other on the connection that was passed in
+            assert connection.execute.call_count == 3
+            connector.db_client.connect.assert_not_called()
+        else:
+            # each concurrent query checks out its own connection
+            connection.execute.assert_not_called()
+            assert connector.db_client.connect.call_count == 3
+
+    @pytest.fixture
+    def max_rows_per_collection(self) -> Generator:
+        original_value = CONFIG.execution.max_rows_per_collection
+        CONFIG.execution.max_rows_per_collection = 3
+        yield 3
+        CONFIG.execution.max_rows_per_collection = original_value
+
+    @pytest.mark.parametrize("partition_query_concurrency", [1, 3], indirect=True)
+    def test_partitioned_retrieval_max_rows(
+        self,
+        connector,
+        query_config,
+        partition_query_concurrency,
+        max_rows_per_collection,
+    ):
+        stmt = text("SELECT email FROM customer")
+        connection = mock.MagicMock()
+        connection.execute.side_effect = lambda stmt: stmt
+
+        # every partition has more rows than the limit
+        with mock.patch.object(
+            BigQueryConnector,
+            "cursor_result_to_rows",
+            side_effect=lambda partitioned_stmt, max_rows: [
+                {"query": str(partitioned_stmt)} for _ in range(10)
+            ][:max_rows],
+        ) as cursor_result_to_rows:
+            rows = connector.partitioned_retrieval(query_config, connection, stmt)
+
+        assert len(rows) == max_rows_per_collection
+        # each partition query fetches at most one row past the limit
+        assert all(
+            call.args[1] == max_rows_per_collection + 1
+            for call in cursor_result_to_rows.call_args_list
+        )
+        if partition_query_concurrency == 1:
+            # the remaining partitions are not queried once the limit is reached
+            assert cursor_result_to_rows.call_count == 1
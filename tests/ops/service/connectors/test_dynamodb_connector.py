@@ -0,0 +1,199 @@
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from fideslang.models import Dataset
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors.dynamodb_connector import DynamoDBConnector
+
+privacy_request = PrivacyRequest(id="234544")
+
+HASH_KEY_TABLE = {
+    "Table": {
+        "KeySchema": [{"AttributeName": "email", "KeyType": "HASH"}],
+        "AttributeDefinitions": [{"AttributeName": "email", "AttributeType": "S"}],
+    }
+}
+SORT_KEY_TABLE = {
+    "Table": {
+        "KeySchema": [
+            {"AttributeName": "email", "KeyType": "HASH"},
+            {"AttributeName": "created", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "email", "AttributeType": "S"},
+            {"AttributeName": "created", "AttributeType": "S"},
+        ],
+    }
+}
+
+
+@mock.patch("fides.api.service.connectors.dynamodb_connector.time.sleep")
+class TestDynamoDBConnector:
+    @pytest.fixture(scope="function")
+    def customer_node(self, integration_dynamodb_config, example_datasets):
+        dataset = Dataset(**example_datasets[11])
+        dataset_graph = DatasetGraph(
+            convert_dataset_to_graph(dataset, integration_dynamodb_config.key)
+        )
+        traversal = Traversal(
+            dataset_graph, {"email": "customer-test_uuid@example.com"}
+        )
+        return traversal.traversal_node_dict[
+            CollectionAddress("dynamodb_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+    @pytest.fixture(scope="function")
+    def stubbed_connector(self, integration_dynamodb_config):
+        connector = DynamoDBConnector(integration_dynamodb_config)
+        connector.db_client = boto3.client(
+            "dynamodb",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        with Stubber(connector.db_client) as stubber:
+            yield connector, stubber
+            stubber.assert_no_pending_responses()
+
+    def test_retrieve_data_batches_key_lookups(
+        self, mock_sleep, stubbed_connector, customer_node, resources_dict
+    ):
+        connector, stubber = stubbed_connector
+        stubber.add_response("describe_table", HASH_KEY_TABLE)
+        stubber.add_response(
+            "batch_get_item",
+            {
+                "Responses": {"customer": [{"email": {"S": "b@example.com"}}]},
+                "UnprocessedKeys": {
+                    "customer": {"Keys": [{"email": {"S": "a@example.com"}}]}
+                },
+            },
+            {
+                "RequestItems": {
+                    "customer": {
+                        "Keys": [
+                            {"email": {"S": "a@example.com"}},
+                            {"email": {"S": "b@example.com"}},
+                            {"email": {"S": "c@example.com"}},
+                        ]
+                    }
+                }
+            },
+        )
+        stubber.add_response(
+            "batch_get_item",
+            {"Responses": {"customer": [{"email": {"S": "a@example.com"}}]}},
+            {
+                "RequestItems": {
+                    "customer": {"Keys": [{"email": {"S": "a@example.com"}}]}
+                }
+            },
+        )
+
+        input_data = {
+            "email": [
+                "a@example.com",
+                "b@example.com",
+                "a@example.com",
+                "c@example.com",
+            ]
+        }
+        rows = connector.retrieve_data(
+            customer_node,
+            resources_dict["policy"],
+            privacy_request,
+            None,
+            input_data,
+        )
+
+        # results follow the order of the input, and missing items are skipped
+        assert rows == [{"email": "a@example.com"}, {"email": "b@example.com"}]
+        assert input_data["email"] == [
+            "a@example.com",
+            "b@example.com",
+            "a@example.com",
+            "c@example.com",
+        ]
+        mock_sleep.assert_called_once()
+
+    def test_retrieve_data_paginates_queries(
+        self, mock_sleep, stubbed_connector, customer_node, resources_dict
+    ):
+        connector, stubber = stubbed_connector
+        stubber.add_response("describe_table", SORT_KEY_TABLE)
+        first_page = {
+            "Items": [{"email": {"S": "a@example.com"}, "created": {"S": "1"}}],
+            "LastEvaluatedKey": {
+                "email": {"S": "a@example.com"},
+                "created": {"S": "1"},
+            },
+        }
+        second_page = {
+            "Items": [{"email": {"S": "a@example.com"}, "created": {"S": "2"}}],
+        }
+        stubber.add_response("query", first_page)
+        stubber.add_response("query", second_page)
+
+        rows = connector.retrieve_data(
+            customer_node,
+            resources_dict["policy"],
+            privacy_request,
+            None,
+            {"email": ["a@example.com"]},
+        )
+
+        assert rows == [
+            {"email": "a@example.com", "created": "1"},
+            {"email": "a@example.com", "created": "2"},
+        ]
+
+    def test_mask_data_batches_writes(
+        self, mock_sleep, stubbed_connector, customer_node, erasure_policy
+    ):
+        connector, stubber = stubbed_connector
+        stubber.add_response("describe_table", HASH_KEY_TABLE)
+        rows = [
+            {"email": f"customer-{i}@example.com", "name": "Customer"}
+            for i in range(30)
+        ]
+        put_requests = [
+            {
+                "PutRequest": {
+                    "Item": {
+                        "email": {"S": f"customer-{i}@example.com"},
+                        "name": {"NULL": True},
+                    }
+                }
+            }
+            for i in range(30)
+        ]
+        stubber.add_response(
+            "batch_write_item",
+            {"UnprocessedItems": {"customer": put_requests[24:25]}},
+            {"RequestItems": {"customer": put_requests[:25]}},
+        )
+        stubber.add_response(
+            "batch_write_item",
+            {"UnprocessedItems": {}},
+            {"RequestItems": {"customer": put_requests[24:25]}},
+        )
+        stubber.add_response(
+            "batch_write_item",
+            {"UnprocessedItems": {}},
+            {"RequestItems": {"customer": put_requests[25:]}},
+        )
+
+        assert (
+            connector.mask_data(
+                customer_node, erasure_policy, privacy_request, None, rows
+            )
+            == 30
+        )
+        mock_sleep.assert_called_once()
@@ -0,0 +1,96 @@
+from unittest import mock
+
+import pytest
+from fideslang.models import Dataset
+from pymongo import UpdateOne
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+from fides.api.models.datasetconfig import convert_dataset_to_graph
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors.mongodb_connector import MongoDBConnector
+from fides.config import CONFIG
+
+privacy_request = PrivacyRequest(id="234544")
+
+
+class TestMongoDBConnector:
+    @pytest.fixture(scope="function")
+    def customer_details_node(
+        self, example_datasets, integration_mongodb_config, connection_config
+    ):
+        postgres_graph = convert_dataset_to_graph(
+            Dataset(**example_datasets[0]), connection_config.key
+        )
+        mongo_graph = convert_dataset_to_graph(
+            Dataset(**example_datasets[1]), integration_mongodb_config.key
+        )
+        traversal = Traversal(
+            DatasetGraph(postgres_graph, mongo_graph),
+            {"email": "customer-1@example.com"},
+        )
+        return traversal.traversal_node_dict[
+            CollectionAddress("mongo_test", "customer_details")
+        ].to_mock_execution_node()
+
+    @pytest.fixture(scope="function")
+    def mock_collection(self, integration_mongodb_config):
+        connector = MongoDBConnector(integration_mongodb_config)
+        connector.db_client = mock.MagicMock()
+        collection = connector.db_client["mongo_test"]["customer_details"]
+        yield connector, collection
+
+    @pytest.fixture(scope="function")
+    def small_batches(self):
+        original_value = CONFIG.execution.mongodb_batch_size
+        CONFIG.execution.mongodb_batch_size = 2
+        yield
+        CONFIG.execution.mongodb_batch_size = original_value
+
+    def test_retrieve_data_uses_batch_size(
+        self, small_batches, mock_collection, customer_details_node, policy
+    ):
+        connector, collection = mock_collection
+        collection.find.return_value = iter([{"_id": 1}, {"_id": 2}, {"_id": 3}])
+
+        rows = connector.retrieve_data(
+            customer_details_node, policy, privacy_request, None, {"customer_id": [1]}
+        )
+
+        assert rows == [{"_id": 1}, {"_id": 2}, {"_id": 3}]
+        assert collection.find.call_args.kwargs == {"batch_size": 2}
+
+    def test_mask_data_bulk_writes(
+        self, small_batches, mock_collection, customer_details_node, erasure_policy
+    ):
+        connector, collection = mock_collection
+        collection.bulk_write.side_effect = lambda updates, ordered: mock.Mock(
+            modified_count=len(updates)
+        )
+        rows = [
+            {"_id": i, "emergency_contacts": [{"name": "June Customer"}]}
+            for i in range(1, 6)
+        ]
+
+        assert (
+            connector.mask_data(
+                customer_details_node, erasure_policy, privacy_request, None, rows
+            )
+            == 5
+        )
+
+        assert collection.bulk_write.call_count == 3
+        first_batch, *_ = collection.bulk_write.call_args_list
+        assert first_batch == mock.call(
+            [
+                UpdateOne(
+                    {"_id": 1}, {"$set": {"emergency_contacts.0.name": None}}, False
+                ),
+                UpdateOne(
+                    {"_id": 2}, {"$set": {"emergency_contacts.0.name": None}}, False
+                ),
+            ],
+            ordered=False,
+        )
+        collection.update_one.assert_not_called()
@@ -281,6 +281,44 @@ class TestSQLQueryConfig:
             text_clause._bindparams["masked_name"].value is None
         )  # Null masking strategy
 
+    def test_generate_update_query_and_params_shared_across_rows(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+        config = SQLQueryConfig(customer_node)
+        first_query, first_params = config.generate_update_query_and_params(
+            {"email": "customer-1@example.com", "name": "John Customer", "id": 1},
+            erasure_policy,
+            privacy_request,
+        )
+        second_query, second_params = config.generate_update_query_and_params(
+            {"email": "customer-2@example.com", "name": "Jane Customer", "id": 2},
+            erasure_policy,
+            privacy_request,
+        )
+
+        # Rows with the same shape generate the same statement so they can be batched together
+        assert first_query == second_query
+        assert first_query == "UPDATE customer SET name = :masked_name WHERE id = :id"
+        assert first_params == {
+            "masked_name": None,
+            "id": 1,
+            "email": "customer-1@example.com",
+        }
+        assert second_params == {
+            "masked_name": None,
+            "id": 2,
+            "email": "customer-2@example.com",
+        }
+
     def test_generate_update_stmt_one_field_inbound_reference(
         self, erasure_policy_address_city, example_datasets, connection_config
     ):
@@ -411,6 +449,66 @@ class TestSQLQueryConfig:
         assert text_clause._bindparams["id"].value == 1
         clear_cache_secrets(privacy_request.id)
 
+    def test_generate_update_queries_and_params_masks_rows_together(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ].to_mock_execution_node()
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 4)
+        ]
+
+        rule = erasure_policy.rules[0]
+        target = rule.targets[0]
+        target.data_category = DataCategory("user").value
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo",
+            masking_strategy=HashMaskingStrategy.name,
+            secret_type=SecretType.salt,
+        )
+        cache_secret(secret, privacy_request.id)
+
+        with mock.patch.object(
+            HashMaskingStrategy,
+            "mask",
+            autospec=True,
+            side_effect=HashMaskingStrategy.mask,
+        ) as mask_mock:
+            update_queries = config.generate_update_queries_and_params(
+                rows, erasure_policy, privacy_request
+            )
+
+        # One call to the masking strategy per field, covering every row
+        assert mask_mock.call_count == 2
+        assert [len(call.args[1]) for call in mask_mock.call_args_list] == [3, 3]
+
+        assert update_queries == [
+            config.generate_update_query_and_params(
+                row, erasure_policy, privacy_request
+            )
+            for row in rows
+        ]
+        assert len({query_str for query_str, _ in update_queries}) == 1
+        clear_cache_secrets(privacy_request.id)
+
     def test_generate_update_stmts_from_multiple_rules(
         self, erasure_policy_two_rules, example_datasets, connection_config
     ):
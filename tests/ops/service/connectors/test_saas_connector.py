@@ -1,5 +1,8 @@
 import json
 import random
+import threading
+import time
+from datetime import datetime
 from typing import Any, Dict, List
 from unittest import mock
 from unittest.mock import Mock
@@ -30,8 +33,17 @@ from fides.api.models.privacy_request import (
 from fides.api.oauth.utils import extract_payload
 from fides.api.schemas.consentable_item import ConsentableItem
 from fides.api.schemas.redis_cache import Identity
-from fides.api.schemas.saas.saas_config import ParamValue, SaaSConfig, SaaSRequest
-from fides.api.schemas.saas.shared_schemas import ConsentPropagationStatus, HTTPMethod
+from fides.api.schemas.saas.saas_config import (
+    ParamValue,
+    ReadSaaSRequest,
+    SaaSConfig,
+    SaaSRequest,
+)
+from fides.api.schemas.saas.shared_schemas import (
+    ConsentPropagationStatus,
+    HTTPMethod,
+    SaaSRequestParams,
+)
 from fides.api.service.connectors import get_connector
 from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
 from fides.api.service.connectors.saas_connector import SaaSConnector
@@ -248,6 +260,149 @@ class TestSaasConnector:
             {"fidesops_grouped_inputs": [], "conversation_id": ["456"]},
         ) == [{"id": "123", "from_email": "test@example.com"}]
 
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_concurrent_read_requests(
+        self, mock_send: Mock, saas_example_config, saas_example_connection_config
+    ):
+        """
+        Verifies that requests sent concurrently return their rows
+        in the same order as if they were sent one at a time
+        """
+        conversation_ids = [str(i) for i in range(8)]
+        thread_ids = set()
+
+        def send(request_params, ignore_errors):
+            conversation_id = request_params.path.split("/")[3]
+            thread_ids.add(threading.get_ident())
+            # make the earlier requests finish last
+            time.sleep(0.01 * (len(conversation_ids) - int(conversation_id)))
+            response = Mock()
+            response.json.return_value = {
+                "conversation_messages": [
+                    {"id": conversation_id, "from_email": "test@example.com"}
+                ]
+            }
+            return response
+
+        mock_send.side_effect = send
+
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "messages"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        request_task = traversal_node.to_mock_request_task()
+        execution_node = ExecutionNode(request_task)
+
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        connector.endpoints["messages"].requests.read.max_concurrency = 4
+
+        privacy_request = PrivacyRequest(id="123")
+        privacy_request.cache_identity(Identity(email="test@example.com"))
+
+        assert connector.retrieve_data(
+            execution_node,
+            Policy(),
+            privacy_request,
+            request_task,
+            {"fidesops_grouped_inputs": [], "conversation_id": conversation_ids},
+        ) == [
+            {"id": conversation_id, "from_email": "test@example.com"}
+            for conversation_id in conversation_ids
+        ]
+        assert mock_send.call_count == len(conversation_ids)
+        assert len(thread_ids) > 1
+
+    @mock.patch(
+        "fides.api.service.authentication.authentication_strategy_oauth2_base."
+        "OAuth2AuthenticationStrategyBase._call_token_request"
+    )
+    @mock.patch("fides.api.service.connectors.saas.authenticated_client.Session.send")
+    @mock.patch(
+        "fides.api.service.connectors.saas.authenticated_client.deny_unsafe_hosts"
+    )
+    def test_concurrent_read_requests_refresh_oauth2_token(
+        self,
+        mock_deny_unsafe_hosts: Mock,
+        mock_session_send: Mock,
+        mock_token_request: Mock,
+        db,
+        oauth2_client_credentials_connection_config,
+    ):
+        """
+        Verifies that an expired OAuth2 token is refreshed once on the calling thread
+        before the requests are sent concurrently with the refreshed token
+        """
+        oauth2_client_credentials_connection_config.update(
+            db,
+            data={
+                "secrets": {
+                    **oauth2_client_credentials_connection_config.secrets,
+                    "expires_at": int(datetime.utcnow().timestamp()) - 60,
+                }
+            },
+        )
+        token_request_thread_ids = []
+        sent_requests = []
+
+        def token_request(action, token_request, connection_config):
+            token_request_thread_ids.append(threading.get_ident())
+            return {"access_token": "new_access", "expires_in": 3600}
+
+        def send(prepared_request, **kwargs):
+            sent_requests.append(
+                (threading.get_ident(), prepared_request.headers["Authorization"])
+            )
+            time.sleep(0.01)
+            response = Response()
+            response.status_code = HTTP_200_OK
+            response._content = json.dumps(
+                {"id": prepared_request.path_url.split("/")[-1]}
+            ).encode()
+            return response
+
+        mock_token_request.side_effect = token_request
+        mock_session_send.side_effect = send
+
+        connector: SaaSConnector = get_connector(
+            oauth2_client_credentials_connection_config
+        )
+        read_request = ReadSaaSRequest(
+            method=HTTPMethod.GET, path="/users/<user_id>", max_concurrency=4
+        )
+        user_ids = [str(i) for i in range(8)]
+
+        assert connector._execute_read_requests(
+            [
+                (
+                    SaaSRequestParams(method=HTTPMethod.GET, path=f"/users/{user_id}"),
+                    {},
+                )
+                for user_id in user_ids
+            ],
+            {"email": "test@example.com"},
+            read_request,
+        ) == [{"id": user_id} for user_id in user_ids]
+
+        assert token_request_thread_ids == [threading.get_ident()]
+        assert {header for _, header in sent_requests} == {"Bearer new_access"}
+        assert threading.get_ident() not in {
+            thread_id for thread_id, _ in sent_requests
+        }
+        assert len({thread_id for thread_id, _ in sent_requests}) > 1
+
+        db.refresh(oauth2_client_credentials_connection_config)
+        assert (
+            oauth2_client_credentials_connection_config.secrets["access_token"]
+            == "new_access"
+        )
+
     @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
     def test_no_content_response(
         self, mock_send: Mock, saas_example_config, saas_example_connection_config
@@ -638,6 +793,33 @@ class TestSaaSConnectorMethods:
         assert client.rate_limit_config.enabled is False
         assert connector.get_rate_limit_config().enabled is False
 
+    def test_clients_share_http_adapter(
+        self, db: Session, saas_example_connection_config, saas_example_dataset_config
+    ):
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        first_client = connector.create_client()
+        second_client = connector.create_client()
+
+        adapter = connector.get_http_adapter()
+        assert first_client.session.get_adapter("https://example.com") is adapter
+        assert second_client.session.get_adapter("https://example.com") is adapter
+        assert first_client.session is not second_client.session
+
+        connector.close()
+        assert connector.get_http_adapter() is not adapter
+
+    def test_http_adapter_not_reused_after_fork(
+        self, db: Session, saas_example_connection_config, saas_example_dataset_config
+    ):
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        adapter = connector.get_http_adapter()
+
+        with mock.patch(
+            "fides.api.service.connectors.saas_connector.os.getpid",
+            return_value=connector.http_adapter_pid + 1,
+        ):
+            assert connector.get_http_adapter() is not adapter
+
 
 @pytest.mark.integration_saas
 class TestConsentRequests:
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.policy import Policy
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.service.connectors.postgres_connector import PostgreSQLConnector
+
+UPDATE_NAME = "UPDATE customer SET name = :name WHERE id = :id"
+UPDATE_EMAIL = "UPDATE customer SET email = :email WHERE id = :id"
+
+
+class TestSQLConnectorMaskData:
+    @pytest.fixture(scope="function")
+    def engine(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(
+                text("CREATE TABLE customer (id INTEGER PRIMARY KEY, name, email)")
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO customer (id, name, email) VALUES "
+                    "(1, 'Jane', 'jane@example.com'), "
+                    "(2, 'John', 'john@example.com'), "
+                    "(3, 'June', 'june@example.com')"
+                )
+            )
+        yield engine
+        engine.dispose()
+
+    @pytest.fixture(scope="function")
+    def executions(self, engine) -> List[bool]:
+        """Records whether each statement sent to the database was an executemany"""
+        executions = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record_execution(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE"):
+                executions.append(executemany)
+
+        return executions
+
+    @pytest.fixture(scope="function")
+    def connector(self, engine) -> PostgreSQLConnector:
+        connector = PostgreSQLConnector(
+            ConnectionConfig(
+                key="sql_connector_test",
+                connection_type=ConnectionType.postgres,
+                secrets={"host": "localhost", "dbname": "test"},
+            )
+        )
+        connector.db_client = engine
+        return connector
+
+    @staticmethod
+    def mask_data(
+        connector: PostgreSQLConnector,
+        updates: List[Optional[Tuple[str, Dict[str, Any]]]],
+    ) -> int:
+        with mock.patch.object(connector, "query_config") as mock_query_config:
+            mock_query_config.return_value.generate_update_queries_and_params.return_value = (
+                updates
+            )
+            return connector.mask_data(
+                mock.Mock(), Policy(), PrivacyRequest(id="123"), None, [{}] * 3
+            )
+
+    @staticmethod
+    def get_customers(engine) -> List[Tuple]:
+        with engine.connect() as connection:
+            return list(
+                connection.execute(
+                    text("SELECT id, name, email FROM customer ORDER BY id")
+                )
+            )
+
+    def test_mask_data_groups_rows_by_statement(self, connector, engine, executions):
+        updated = self.mask_data(
+            connector,
+            [
+                (UPDATE_NAME, {"name": None, "id": 1}),
+                (UPDATE_EMAIL, {"email": None, "id": 1}),
+                None,
+                (UPDATE_NAME, {"name": None, "id": 2}),
+                # no customer has this id
+                (UPDATE_NAME, {"name": None, "id": 4}),
+            ],
+        )
+
+        assert updated == 3
+        # one executemany for the three name updates, the single email update runs on its own
+        assert executions == [True, False]
+        assert self.get_customers(engine) == [
+            (1, None, None),
+            (2, None, "john@example.com"),
+            (3, "June", "june@example.com"),
+        ]
+
+    def test_mask_data_without_multi_rowcount_executes_each_row(
+        self, connector, engine, executions
+    ):
+        with mock.patch.object(engine.dialect, "supports_sane_multi_rowcount", False):
+            updated = self.mask_data(
+                connector,
+                [
+                    (UPDATE_NAME, {"name": None, "id": 1}),
+                    (UPDATE_NAME, {"name": None, "id": 2}),
+                    (UPDATE_NAME, {"name": None, "id": 4}),
+                ],
+            )
+
+        assert updated == 2
+        assert executions == [False, False, False]
+        assert [name for _, name, _ in self.get_customers(engine)] == [
+            None,
+            None,
+            "June",
+        ]
+
+    def test_mask_data_without_updates(self, connector, engine, executions):
+        assert self.mask_data(connector, [None, None]) == 0
+        assert executions == []
+
+    def test_mask_data_rolls_back_node_on_failure(self, connector, engine, executions):
+        with pytest.raises(OperationalError):
+            self.mask_data(
+                connector,
+                [
+                    (UPDATE_NAME, {"name": None, "id": 1}),
+                    (UPDATE_NAME, {"name": None, "id": 2}),
+                    (
+                        "UPDATE customer SET missing = :missing WHERE id = :id",
+                        {"missing": None, "id": 3},
+                    ),
+                ],
+            )
+
+        # the name updates ran before the failing statement but were rolled back with it
+        assert executions == [True, False]
+        assert self.get_customers(engine) == [
+            (1, "Jane", "jane@example.com"),
+            (2, "John", "john@example.com"),
+            (3, "June", "june@example.com"),
+        ]
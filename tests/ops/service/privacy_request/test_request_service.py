@@ -1,21 +1,26 @@
 import time
 from datetime import datetime
+from unittest import mock
 
 import pytest
 from httpx import HTTPStatusError
+from sqlalchemy import text
 
 from fides.api.cryptography.cryptographic_util import str_to_b64_str
 from fides.api.db.seed import create_or_update_parent_user
 from fides.api.models.privacy_request import (
     ExecutionLogStatus,
     PrivacyRequest,
+    PrivacyRequestError,
     PrivacyRequestStatus,
 )
 from fides.api.schemas.policy import ActionType
 from fides.api.service.privacy_request.request_service import (
+    REMOVE_EXPIRED_REQUEST_TASKS,
     build_required_privacy_request_kwargs,
     poll_for_exited_privacy_request_tasks,
     poll_server_for_completion,
+    remove_in_batches,
     remove_saved_dsr_data,
 )
 from fides.common.api.v1.urn_registry import LOGIN, V1_URL_PREFIX
@@ -246,6 +251,43 @@ class TestPollForExitedPrivacyRequests:
         db.refresh(privacy_request)
         assert privacy_request.status == PrivacyRequestStatus.error
 
+    def test_access_and_erasure_tasks_errored(
+        self, db, privacy_request, request_task, erasure_request_task
+    ):
+        """A privacy request with errored tasks in more than one step is marked as errored once"""
+        for rq in privacy_request.request_tasks:
+            rq.update_status(db, ExecutionLogStatus.complete)
+        request_task.update_status(db, ExecutionLogStatus.error)
+        erasure_request_task.update_status(db, ExecutionLogStatus.error)
+
+        errored_prs = poll_for_exited_privacy_request_tasks.delay().get()
+        assert errored_prs == {privacy_request.id}
+
+        db.refresh(privacy_request)
+        assert privacy_request.status == PrivacyRequestStatus.error
+        assert privacy_request.finished_processing_at is not None
+        assert (
+            db.query(PrivacyRequestError)
+            .filter(PrivacyRequestError.privacy_request_id == privacy_request.id)
+            .count()
+            == 1
+        )
+
+    def test_deleted_privacy_request_with_errored_tasks(
+        self, db, privacy_request, request_task
+    ):
+        for rq in privacy_request.request_tasks:
+            rq.update_status(db, ExecutionLogStatus.complete)
+        request_task.update_status(db, ExecutionLogStatus.error)
+        privacy_request.deleted_at = datetime.utcnow()
+        privacy_request.save(db)
+
+        errored_prs = poll_for_exited_privacy_request_tasks.delay().get()
+        assert errored_prs == set()
+
+        db.refresh(privacy_request)
+        assert privacy_request.status == PrivacyRequestStatus.in_processing
+
 
 @pytest.fixture(scope="function")
 def very_short_request_task_expiration():
@@ -267,6 +309,17 @@ def very_short_redis_cache_expiration():
     CONFIG.redis.default_ttl_seconds = original_value
 
 
+@pytest.fixture(scope="function")
+def single_row_dsr_data_removal_batches():
+    original_batch_size = CONFIG.execution.dsr_data_removal_batch_size
+    original_sleep_seconds = CONFIG.execution.dsr_data_removal_batch_sleep_seconds
+    CONFIG.execution.dsr_data_removal_batch_size = 1
+    CONFIG.execution.dsr_data_removal_batch_sleep_seconds = 0
+    yield CONFIG
+    CONFIG.execution.dsr_data_removal_batch_size = original_batch_size
+    CONFIG.execution.dsr_data_removal_batch_sleep_seconds = original_sleep_seconds
+
+
 class TestRemoveSavedCustomerData:
     @pytest.mark.usefixtures(
         "very_short_redis_cache_expiration", "very_short_request_task_expiration"
@@ -341,6 +394,69 @@ class TestRemoveSavedCustomerData:
             in loguru_caplog.text
         )
 
+    @pytest.mark.usefixtures(
+        "very_short_redis_cache_expiration",
+        "very_short_request_task_expiration",
+        "single_row_dsr_data_removal_batches",
+        "request_task",
+    )
+    def test_customer_data_removed_in_batches(self, db, privacy_request, loguru_caplog):
+        privacy_request.status = PrivacyRequestStatus.complete
+        privacy_request.access_result_urls = {"access_result_urls": ["www.example.com"]}
+        privacy_request.save(db)
+
+        assert privacy_request.request_tasks.count() == 3
+        time.sleep(1)
+
+        remove_saved_dsr_data.delay().get()
+
+        db.refresh(privacy_request)
+        assert privacy_request.access_result_urls is None
+        assert not privacy_request.request_tasks.count()
+
+        # one request task is deleted and committed per batch
+        assert (
+            "DSR Data Removal Task removed 2 expired request tasks so far"
+            in loguru_caplog.text
+        )
+        assert (
+            "Deleted 3 expired request tasks via DSR Data Removal Task."
+            in loguru_caplog.text
+        )
+
+    @pytest.mark.usefixtures("very_short_request_task_expiration", "request_task")
+    def test_batches_page_by_primary_key(self, db, privacy_request):
+        """Each batch starts after the largest id the database selected in the previous one"""
+        privacy_request.status = PrivacyRequestStatus.complete
+        privacy_request.save(db)
+        request_task_ids = [
+            row_id
+            for row_id, in db.execute(
+                text(
+                    "SELECT id FROM requesttask WHERE privacy_request_id = :id ORDER BY id"
+                ),
+                {"id": privacy_request.id},
+            )
+        ]
+        time.sleep(1)
+
+        with mock.patch.object(db, "execute", wraps=db.execute) as mock_execute:
+            removed_count = remove_in_batches(
+                db,
+                REMOVE_EXPIRED_REQUEST_TASKS,
+                {"ttl": datetime.now()},
+                "expired request tasks",
+                batch_size=1,
+                sleep_seconds=0,
+            )
+
+        assert removed_count == 3
+        assert [call.args[1]["last_id"] for call in mock_execute.call_args_list] == [
+            "",
+            *request_task_ids,
+        ]
+        assert not privacy_request.request_tasks.count()
+
 
 class TestBuildPrivacyRequestRequiredKwargs:
     def test_build_required_privacy_request_kwargs_authenticated(self):
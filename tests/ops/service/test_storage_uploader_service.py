@@ -28,6 +28,7 @@ from fides.api.tasks.storage import (
     LOCAL_FIDES_UPLOAD_DIRECTORY,
     encrypt_access_request_results,
     write_to_in_memory_buffer,
+    write_to_spooled_file,
 )
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     decrypt_combined_nonce_and_message,
@@ -366,6 +367,26 @@ class TestWriteToInMemoryBuffer:
         assert isinstance(buff, BytesIO)
         assert json.load(buff) == data
 
+    def test_json_matches_serialized_data(self, data, privacy_request):
+        buff = write_to_in_memory_buffer("json", data, privacy_request)
+        assert buff.getvalue() == json.dumps(data, indent=2).encode(
+            CONFIG.security.encoding
+        )
+
+    def test_spooled_file_encrypted_json(
+        self, data, privacy_request_with_encryption_keys
+    ):
+        with mock.patch("fides.api.tasks.storage.ACCESS_PACKAGE_WRITE_BUFFER_SIZE", 8):
+            with write_to_spooled_file(
+                "json", data, privacy_request_with_encryption_keys
+            ) as spooled_file:
+                encrypted = spooled_file.read().decode(CONFIG.security.encoding)
+
+        decrypted = decrypt_combined_nonce_and_message(
+            encrypted, self.key.encode(CONFIG.security.encoding)
+        )
+        assert decrypted == json.dumps(data, indent=2)
+
     def test_csv_format(self, data, privacy_request):
         buff = write_to_in_memory_buffer("csv", data, privacy_request)
         assert isinstance(buff, BytesIO)
@@ -0,0 +1,61 @@
+from unittest import mock
+
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.task.connection_config_cache import ConnectionConfigCache
+
+
+class TestConnectionConfigCache:
+    def test_connection_config_reused_while_unchanged(self, db, connection_config):
+        cache = ConnectionConfigCache()
+        first = cache.get(db, connection_config.key)
+        assert first.secrets == connection_config.secrets
+
+        with mock.patch.object(
+            ConnectionConfig, "get_by", wraps=ConnectionConfig.get_by
+        ) as get_by_mock:
+            cached = cache.get(db, connection_config.key)
+
+        assert not get_by_mock.called
+        assert cached is connection_config
+        assert cached.secrets == connection_config.secrets
+        assert cached not in db.dirty
+
+    def test_connection_config_reloaded_when_updated(self, db, connection_config):
+        cache = ConnectionConfigCache()
+        cache.get(db, connection_config.key)
+
+        connection_config.update(
+            db, data={"secrets": {**connection_config.secrets, "port": 1234}}
+        )
+
+        with mock.patch.object(
+            ConnectionConfig, "get_by", wraps=ConnectionConfig.get_by
+        ) as get_by_mock:
+            reloaded = cache.get(db, connection_config.key)
+
+        assert get_by_mock.called
+        assert reloaded.secrets["port"] == 1234
+
+    def test_connection_config_reloaded_when_expired(self, db, connection_config):
+        cache = ConnectionConfigCache(ttl_seconds=0)
+        cache.get(db, connection_config.key)
+
+        with mock.patch.object(
+            ConnectionConfig, "get_by", wraps=ConnectionConfig.get_by
+        ) as get_by_mock:
+            cache.get(db, connection_config.key)
+
+        assert get_by_mock.called
+
+    def test_cached_secrets_not_shared(self, db, connection_config):
+        cache = ConnectionConfigCache()
+        loaded = cache.get(db, connection_config.key)
+        loaded.secrets["host"] = "changed"
+
+        assert (
+            cache._entries[connection_config.key].values["secrets"]["host"] != "changed"
+        )
+        db.refresh(connection_config)
+
+    def test_missing_connection_config(self, db):
+        assert ConnectionConfigCache().get(db, "does_not_exist") is None
@@ -16,7 +16,7 @@ from fides.api.graph.config import (
     FieldAddress,
     FieldPath,
 )
-from fides.api.graph.execution import ExecutionNode
+from fides.api.graph.execution import ExecutionNode, HydratedNodeCache
 from fides.api.graph.graph import DatasetGraph, Edge
 from fides.api.graph.traversal import Traversal
 from fides.api.models.connectionconfig import ConnectionConfig
@@ -34,6 +34,7 @@ from fides.api.task.create_request_tasks import (
 from fides.api.task.execute_request_tasks import (
     can_run_task_body,
     create_graph_task,
+    get_connection_configs_for_task,
     run_prerequisite_task_checks,
 )
 from fides.api.task.graph_runners import use_dsr_3_0_scheduler
@@ -148,6 +149,28 @@ class TestCreateGraphTask:
         )
         assert isinstance(graph_task.connector, PostgreSQLConnector)
 
+    @pytest.mark.usefixtures("create_postgres_access_request_tasks")
+    def test_get_connection_configs_for_task(self, db, privacy_request):
+        """Only the ConnectionConfig of the Request Task's dataset is loaded"""
+        request_task = privacy_request.access_tasks.filter(
+            RequestTask.collection_address == "postgres_example_test_dataset:address"
+        ).first()
+
+        connection_configs = get_connection_configs_for_task(db, request_task)
+        assert [connection_config.key for connection_config in connection_configs] == [
+            request_task.traversal_details["dataset_connection_key"]
+        ]
+
+        resources = TaskResources(
+            privacy_request,
+            privacy_request.policy,
+            connection_configs,
+            request_task,
+            db,
+        )
+        graph_task = create_graph_task(db, request_task, resources)
+        assert isinstance(graph_task.connector, PostgreSQLConnector)
+
     @pytest.mark.usefixtures("create_postgres_access_request_tasks")
     def test_error_hydrating_graph_task(self, db, privacy_request):
         """If GraphTask cannot be hydrated, error is thrown, current task and downstream tasks
@@ -433,6 +456,57 @@ class TestExecutionNode:
             == {}
         )
 
+    @pytest.mark.usefixtures("create_postgres_access_request_tasks")
+    def test_hydrated_node_is_reused(self, privacy_request):
+        request_task = privacy_request.access_tasks.filter(
+            RequestTask.collection_address == "postgres_example_test_dataset:address"
+        ).first()
+
+        execution_node = ExecutionNode(request_task)
+        retried_execution_node = ExecutionNode(request_task)
+
+        # the parsed collection is shared, the edges are copied for each node
+        assert retried_execution_node.collection is execution_node.collection
+        assert retried_execution_node.incoming_edges == execution_node.incoming_edges
+        assert (
+            retried_execution_node.incoming_edges is not execution_node.incoming_edges
+        )
+
+    @pytest.mark.usefixtures("create_postgres_access_request_tasks")
+    def test_changed_details_are_hydrated_again(self, privacy_request):
+        request_task = privacy_request.access_tasks.filter(
+            RequestTask.collection_address == "postgres_example_test_dataset:address"
+        ).first()
+        execution_node = ExecutionNode(request_task)
+
+        request_task.collection = {
+            **request_task.collection,
+            "fields": request_task.collection["fields"][:1],
+        }
+        changed_execution_node = ExecutionNode(request_task)
+
+        assert changed_execution_node.collection is not execution_node.collection
+        assert len(changed_execution_node.collection.fields) == 1
+
+    @pytest.mark.usefixtures("create_postgres_access_request_tasks")
+    def test_hydrated_node_cache_evicts_least_recently_used(self, privacy_request):
+        address_task, employee_task = [
+            privacy_request.access_tasks.filter(
+                RequestTask.collection_address == collection_address
+            ).first()
+            for collection_address in (
+                "postgres_example_test_dataset:address",
+                "postgres_example_test_dataset:employee",
+            )
+        ]
+        cache = HydratedNodeCache(maxsize=1)
+
+        address_node = cache.get(address_task)
+        assert cache.get(address_task) is address_node
+
+        cache.get(employee_task)
+        assert cache.get(address_task) is not address_node
+
 
 class TestCanRunTaskBody:
     def test_task_is_pending(self, request_task):
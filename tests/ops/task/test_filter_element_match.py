@@ -7,6 +7,7 @@ from fides.api.task.filter_element_match import (
     _expand_array_paths_to_preserve,
     _remove_paths_from_row,
     filter_element_match,
+    filter_element_match_with_placeholders,
 )
 from fides.api.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
 
@@ -263,6 +264,54 @@ class TestFilterElementMatchReplaceIndices:
         }
 
 
+class TestFilterElementMatchWithPlaceholders:
+    def test_no_arrays_returns_same_row(self):
+        row = {"A": "B", "C": {"D": {"E": "F", "G": "H"}}}
+        query_paths = {FieldPath("A"): ["B"], FieldPath("C", "D", "E"): ["F"]}
+
+        placeholder_row, filtered_row = filter_element_match_with_placeholders(
+            row, query_paths
+        )
+
+        assert placeholder_row is row
+        assert filtered_row is row
+        assert row == {"A": "B", "C": {"D": {"E": "F", "G": "H"}}}
+
+    def test_array_match(self):
+        row = {
+            "A": ["b", "c", "d", "e"],
+            "C": {"D": {"E": ["g", "h", "i", "j"], "G": "H"}},
+            "J": ["K", "L", "M"],
+        }
+        query_paths = {FieldPath("A"): ["c", "d"], FieldPath("C", "D", "E"): ["h", "i"]}
+
+        placeholder_row, filtered_row = filter_element_match_with_placeholders(
+            row, query_paths
+        )
+
+        assert placeholder_row == {
+            "A": [FIDESOPS_DO_NOT_MASK_INDEX, "c", "d", FIDESOPS_DO_NOT_MASK_INDEX],
+            "C": {
+                "D": {
+                    "E": [
+                        FIDESOPS_DO_NOT_MASK_INDEX,
+                        "h",
+                        "i",
+                        FIDESOPS_DO_NOT_MASK_INDEX,
+                    ],
+                    "G": "H",
+                }
+            },
+            "J": ["K", "L", "M"],
+        }
+        assert filtered_row is row
+        assert row == {
+            "A": ["c", "d"],
+            "C": {"D": {"E": ["h", "i"], "G": "H"}},
+            "J": ["K", "L", "M"],
+        }
+
+
 class TestRemovePathsFromRowDeleteElements:
     """Test sub-method remove_paths_from_row. Non-matching targeted array elements are removed."""
 
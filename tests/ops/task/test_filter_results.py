@@ -5,11 +5,13 @@ import pytest
 from bson import ObjectId
 from fideslang.models import Dataset
 
-from fides.api.graph.config import FieldPath
+from fides.api.graph.config import CollectionAddress, FieldPath
 from fides.api.graph.graph import DatasetGraph
 from fides.api.models.datasetconfig import convert_dataset_to_graph
 from fides.api.task.filter_results import (
+    FieldPathExtractor,
     filter_data_categories,
+    get_field_path_extractor,
     remove_empty_containers,
     select_and_save_field,
     unpack_fides_connector_results,
@@ -1294,3 +1296,76 @@ class TestFilterResults:
             )
             == access_request_results
         )
+
+    def test_field_path_extractor_matches_select_and_save_field(self):
+        row = {
+            "A": "a",
+            "B": [{"C": "c", "D": [1, 2]}, {"D": []}, "e"],
+            "E": {"F": {"G": "g", "H": "h"}, "I": {}},
+            "J": [[{"K": "k"}, {"L": "l"}], []],
+            "M": None,
+        }
+        field_paths = [
+            FieldPath("A"),
+            FieldPath("B", "C"),
+            FieldPath("B", "D"),
+            FieldPath("E", "F", "G"),
+            FieldPath("E", "I"),
+            FieldPath("J", "K"),
+            FieldPath("M"),
+            FieldPath("N"),
+        ]
+        expected = {}
+        for field_path in field_paths:
+            select_and_save_field(expected, row, field_path)
+        remove_empty_containers(expected)
+
+        extracted = FieldPathExtractor(field_paths).extract(row)
+
+        assert extracted == expected
+        assert extracted == {
+            "A": "a",
+            "B": [{"C": "c", "D": [1, 2]}, "e"],
+            "E": {"F": {"G": "g"}},
+            "J": [[{"K": "k"}]],
+            "M": None,
+        }
+
+    def test_get_field_path_extractor_cached_per_graph(self):
+        dataset = {
+            "fides_key": "postgres_example",
+            "name": "postgres_example",
+            "collections": [
+                {
+                    "name": "customer",
+                    "fields": [
+                        {"name": "email", "data_categories": ["user.contact.email"]},
+                        {"name": "name", "data_categories": ["user.name"]},
+                    ],
+                }
+            ],
+        }
+        dataset_graph = DatasetGraph(
+            convert_dataset_to_graph(
+                Dataset.model_validate(dataset), "postgres_example"
+            )
+        )
+        address = CollectionAddress("postgres_example", "customer")
+
+        extractor = get_field_path_extractor(
+            dataset_graph, address, frozenset({"user.contact"})
+        )
+
+        assert extractor.trie == {"email": {}}
+        assert (
+            get_field_path_extractor(
+                dataset_graph, address, frozenset({"user.contact"})
+            )
+            is extractor
+        )
+        assert get_field_path_extractor(
+            dataset_graph, address, frozenset({"user"})
+        ).trie == {"email": {}, "name": {}}
+        assert get_field_path_extractor(
+            dataset_graph, address, frozenset({"system"})
+        ).is_empty
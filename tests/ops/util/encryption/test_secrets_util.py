@@ -1,4 +1,5 @@
 from typing import Dict, List
+from unittest import mock
 
 from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretCache,
@@ -9,7 +10,8 @@ from fides.api.service.masking.strategy.masking_strategy_aes_encrypt import (
     AesEncryptionMaskingStrategy,
 )
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
-from fides.api.util.encryption.secrets_util import SecretsUtil
+from fides.api.util.cache import get_cache
+from fides.api.util.encryption.secrets_util import SecretsUtil, masking_secrets_scope
 
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -64,6 +66,54 @@ def test_get_secret_from_cache_bytes() -> None:
     clear_cache_secrets(request_id)
 
 
+def test_secrets_fetched_once_per_masking_scope() -> None:
+    masking_meta: Dict[SecretType, MaskingSecretMeta] = (
+        HmacMaskingStrategy._build_masking_secret_meta()
+    )
+    other_request_id = "67890"
+    for secret_type, secret in [
+        (SecretType.key, "request_key"),
+        (SecretType.salt, "request_salt"),
+    ]:
+        cache_secret(
+            MaskingSecretCache[str](
+                secret=secret,
+                masking_strategy=HmacMaskingStrategy.name,
+                secret_type=secret_type,
+            ),
+            other_request_id,
+        )
+
+    def get_secrets():
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                other_request_id, SecretType.key, masking_meta[SecretType.key]
+            )
+            == "request_key"
+        )
+        assert (
+            SecretsUtil.get_or_generate_secret(
+                other_request_id, SecretType.salt, masking_meta[SecretType.salt]
+            )
+            == "request_salt"
+        )
+
+    with mock.patch(
+        "fides.api.util.encryption.secrets_util.get_cache", wraps=get_cache
+    ) as get_cache_mock:
+        with masking_secrets_scope():
+            for _ in range(3):
+                get_secrets()
+        # Every secret type for the strategy was fetched with the first lookup
+        assert get_cache_mock.call_count == 1
+
+        # The secrets are not held after the scope exits
+        get_secrets()
+        assert get_cache_mock.call_count == 3
+
+    clear_cache_secrets(other_request_id)
+
+
 def test_generate_secret() -> None:
     # build masking secret meta for HMAC key
     masking_meta_key: Dict[SecretType, MaskingSecretMeta] = {
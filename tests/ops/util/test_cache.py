@@ -13,6 +13,7 @@ from fides.api.util.cache import (
     FidesopsRedis,
     cache_task_tracking_key,
     celery_tasks_in_flight,
+    get_celery_tasks_in_flight,
 )
 from fides.api.util.custom_json_encoder import (
     ENCODED_BYTES_PREFIX,
@@ -93,6 +94,42 @@ def test_scan(cache: FidesopsRedis) -> List:
     assert len(keys) == 0
 
 
+def test_delete_keys_by_prefix_in_chunks(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    for i in range(25):
+        cache.set(f"{prefix}{i}", i)
+    cache.set(f"other_{prefix}", 1)
+
+    assert cache.delete_keys_by_prefix(prefix, chunk_size=10) == 25
+    assert cache.get_keys_by_prefix(prefix) == []
+    assert cache.delete(f"other_{prefix}") == 1
+
+
+def test_delete_keys_by_prefix_escapes_pattern_characters(
+    cache: FidesopsRedis,
+) -> None:
+    prefix = f"redis_key_{random.random()}_[*]"
+    cache.set(f"{prefix}_1", 1)
+    cache.set(f"{prefix[:-3]}x_1", 1)
+
+    assert cache.delete_keys_by_prefix(prefix) == 1
+    assert cache.delete(f"{prefix[:-3]}x_1") == 1
+
+
+def test_delete_keys_by_prefixes(cache: FidesopsRedis) -> None:
+    base = f"redis_key_{random.random()}_"
+    prefixes = [f"{base}a_", f"{base}b_"]
+    for prefix in prefixes:
+        for i in range(10):
+            cache.set(f"{prefix}{i}", i)
+    cache.set(f"{base}c_1", 1)
+
+    assert cache.delete_keys_by_prefixes(prefixes, chunk_size=3) == 20
+    assert cache.get_keys_by_prefix(base) == [f"{base}c_1"]
+    assert cache.delete_keys_by_prefixes([]) == 0
+    cache.delete(f"{base}c_1")
+
+
 class TestCustomJSONEncoder:
     def test_encode_enum_string(self):
         class TestEnum(Enum):
@@ -242,6 +279,20 @@ class TestCeleryTasksInFlight:
 
         assert celery_tasks_in_flight(["abde"])
 
+    @mock.patch("fides.api.util.cache.celery_app.control.inspect.query_task")
+    def test_get_celery_tasks_in_flight(self, query_task_mock):
+        query_task_mock.return_value = {
+            "@celery1234": {"abcde": ["reserved", {}], "fghij": ["completed", {}]},
+            "@celery5678": {"klmno": ["active", {}]},
+        }
+
+        assert get_celery_tasks_in_flight(["abcde", "fghij", "klmno"]) == {
+            "abcde",
+            "klmno",
+        }
+        query_task_mock.assert_called_once_with("abcde", "fghij", "klmno")
+        assert get_celery_tasks_in_flight([]) == set()
+
 
 def test_push_encoded_object_with_expiration(cache: FidesopsRedis) -> None:
     """Test that push_encoded_object correctly sets expiration time."""
@@ -0,0 +1,41 @@
+from fides.api.util.ready_queue import ReadyQueue
+
+
+def test_queue() -> None:
+    queue = ReadyQueue({"B": 1, "C": 2})
+    queue.push_if_new("A", "a")
+    queue.push_if_new("B", "b")
+    queue.push_if_new("C", "c")
+    queue.push_if_new("D", "d")
+    assert queue.data == ["a", "b", "c", "d"]
+
+    assert queue.pop_ready() == "a"
+    assert queue.pop_ready() == "d"
+    assert queue.pop_ready() is None
+    assert queue.is_empty() is False
+
+    queue.release("C")
+    assert queue.pop_ready() is None
+    queue.release("B")
+    queue.release("C")
+    # ready values are popped in the order they were first pushed
+    assert queue.pop_ready() == "b"
+    assert queue.pop_ready() == "c"
+    assert queue.is_empty() is True
+
+
+def test_push_if_new() -> None:
+    queue = ReadyQueue()
+    queue.push_if_new("A", "a")
+    queue.push_if_new("A", "a")
+    assert queue.data == ["a"]
+    assert queue.pop_ready() == "a"
+    queue.push_if_new("A", "a")
+    assert queue.data == ["a"]
+
+
+def test_release_before_push() -> None:
+    queue = ReadyQueue({"A": 1})
+    queue.release("A")
+    queue.push_if_new("A", "a")
+    assert queue.pop_ready() == "a"